@@ -2,4 +2,7 @@ from django.apps import AppConfig
 
 class CoursesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "apps.courses"
\ No newline at end of file
+    name = "apps.courses"
+
+    def ready(self):
+        from apps.courses import signals  # noqa: F401
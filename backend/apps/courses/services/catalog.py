@@ -0,0 +1,5 @@
+from config.generation_cache import GenerationCache
+
+# Course list/detail payloads, retired whenever a Course, Hole or TeeBox
+# is saved or deleted (signals.py)
+catalog_cache = GenerationCache("courses:catalog")
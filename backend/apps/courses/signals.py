@@ -0,0 +1,5 @@
+from apps.courses.models import Course, Hole, TeeBox
+from apps.courses.services.catalog import catalog_cache
+
+# Seeds and admin edits both go through save()/delete()
+catalog_cache.watch(Course, Hole, TeeBox)
@@ -1,3 +1,35 @@
+from django.core.cache import caches
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from apps.courses.models import Course, Hole, TeeBox
+
+
+class CourseCatalogCacheTests(TestCase):
+    def setUp(self):
+        caches["catalog"].clear()
+        self.client = APIClient()
+        self.course = Course.objects.create(name="Cache Hills")
+        hole = Hole.objects.create(course=self.course, number=1, par=4)
+        self.tee = TeeBox.objects.create(hole=hole, name="Champ", yardage=420)
+
+    def test_warm_detail_skips_the_database(self):
+        url = f"/api/courses/{self.course.id}/"
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).json(), first.json())
+        self.assertEqual(len(queries), 0)
+
+    def test_nested_edits_retire_cached_payloads(self):
+        url = f"/api/courses/{self.course.id}/"
+        self.client.get(url)
+
+        self.tee.yardage = 455
+        self.tee.save()
+        self.assertIn("455", self.client.get(url).content.decode())
+
+        self.course.delete()
+        self.assertEqual(self.client.get("/api/courses/").json(), [])
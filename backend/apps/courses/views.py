@@ -1,12 +1,30 @@
 from rest_framework import viewsets
 from apps.courses.models import Course
 from apps.courses.serializers import CourseSerializer, CourseDetailSerializer
+from apps.courses.services.catalog import catalog_cache
 
 
 class CourseViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Course.objects.prefetch_related("holes__tee_boxes").all()
+    """
+    Course data hardly changes after seeding, so list and detail payloads
+    are cached until a Course, Hole or TeeBox is saved or deleted
+    (see signals.py).
+    """
+    queryset = Course.objects.all()
+
+    def get_queryset(self):
+        # Only the detail view serializes holes and their tee boxes
+        if self.action == "retrieve":
+            return Course.objects.prefetch_related("holes__tee_boxes")
+        return Course.objects.all()
 
     def get_serializer_class(self):
         if self.action == "retrieve":
             return CourseDetailSerializer
         return CourseSerializer
+
+    def list(self, request, *args, **kwargs):
+        return catalog_cache.response(request, lambda: super(CourseViewSet, self).list(request, *args, **kwargs).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        return catalog_cache.response(request, lambda: super(CourseViewSet, self).retrieve(request, *args, **kwargs).data)
@@ -1,5 +1,4 @@
 from django.contrib import admin
-from django.db.models import F, FloatField, ExpressionWrapper
 from .models import Golfer
 from django.utils.html import format_html
 
@@ -52,14 +51,6 @@ class GolferAdmin(admin.ModelAdmin):
             val,
         )
 
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        fields = Golfer.rating_fields()
-        total = sum(F(f) for f in fields)
-        return qs.annotate(
-            overall_db=ExpressionWrapper(total / len(fields), output_field=FloatField())
-        )
-
-    @admin.display(description="Overall", ordering="overall_db")
+    @admin.display(description="Overall", ordering="overall")
     def overall_display(self, obj: Golfer) -> int:
         return obj.overall
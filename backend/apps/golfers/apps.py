@@ -2,4 +2,7 @@ from django.apps import AppConfig
 
 class GolfersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "apps.golfers"
\ No newline at end of file
+    name = "apps.golfers"
+
+    def ready(self):
+        from apps.golfers import signals  # noqa: F401
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:05
+
+from django.db import migrations, models
+
+
+# Golfer.rating_fields() / overall_from() as of this migration, frozen so
+# later changes to the live definition don't rewrite history
+RATING_FIELDS = (
+    "driving_power",
+    "driving_accuracy",
+    "approach",
+    "short_game",
+    "putting",
+    "ball_striking",
+    "consistency",
+    "course_management",
+    "discipline",
+    "sand",
+    "clutch",
+    "weather_handling",
+    "endurance",
+)
+
+
+def backfill_overall(apps, schema_editor):
+    Golfer = apps.get_model("golfers", "Golfer")
+    golfers = list(Golfer.objects.only("id", *RATING_FIELDS))
+    for g in golfers:
+        g.overall = int(round(sum(getattr(g, f) for f in RATING_FIELDS) / len(RATING_FIELDS)))
+    Golfer.objects.bulk_update(golfers, ["overall"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('golfers', '0004_golfer_dob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='golfer',
+            name='overall',
+            field=models.PositiveSmallIntegerField(default=50, editable=False),
+        ),
+        migrations.RunPython(backfill_overall, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='golfer',
+            index=models.Index(fields=['-overall', 'name'], name='golfer_overall_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='golfer',
+            index=models.Index(fields=['is_active', '-overall', 'name'], name='golfer_active_overall_idx'),
+        ),
+    ]
@@ -52,6 +52,10 @@ class Golfer(models.Model):
     # Higher = more “wild” outcomes (separate from consistency, which is skill-like)
     volatility = models.DecimalField(max_digits=4, decimal_places=2, default=1.0)
 
+    # Average of rating_fields(), stored so the directory can filter and
+    # order by it in SQL. Recomputed on every save.
+    overall = models.PositiveSmallIntegerField(default=50, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     @classmethod
@@ -76,14 +80,26 @@ class Golfer(models.Model):
             "endurance",
         ]
 
-    @property
-    def overall(self) -> int:
+    @classmethod
+    def overall_from(cls, ratings: dict) -> int:
         """
-        Average of all rating fields (rounded to nearest int).
-        Always computed so it can’t go stale.
+        Overall from a mapping of rating field -> value (e.g. a `.values()` row),
+        so callers can rate golfers without loading model instances.
         """
-        vals = [getattr(self, f) for f in self.rating_fields()]
+        vals = [ratings[f] for f in cls.rating_fields()]
         return int(round(sum(vals) / len(vals))) if vals else 0
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-overall", "name"], name="golfer_overall_idx"),
+            models.Index(fields=["is_active", "-overall", "name"], name="golfer_active_overall_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.overall = self.overall_from({f: getattr(self, f) for f in self.rating_fields()})
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "overall"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.name
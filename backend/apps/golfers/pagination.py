@@ -0,0 +1,12 @@
+from rest_framework.pagination import PageNumberPagination
+
+
+class GolferPagination(PageNumberPagination):
+    """
+    Page numbers (with a total `count`) rather than cursors: the directory
+    is bounded by TOP_N and re-sortable by `?ordering=`, and pickers want
+    the count up front.
+    """
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
@@ -3,7 +3,16 @@ from apps.golfers.models import Golfer
 
 
 class GolferSerializer(serializers.ModelSerializer):
-    overall = serializers.IntegerField(read_only=True)
+    """
+    Pass `fields=[...]` for a sparse representation (the directory's
+    `?fields=`); unknown names are ignored.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
 
     class Meta:
         model = Golfer
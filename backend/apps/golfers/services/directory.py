@@ -0,0 +1,5 @@
+from config.generation_cache import GenerationCache
+
+# Directory responses, retired whenever a golfer is saved or deleted
+# (signals.py) or ratings are refreshed in bulk
+directory_cache = GenerationCache("golfers:directory")
@@ -0,0 +1,5 @@
+from apps.golfers.models import Golfer
+from apps.golfers.services.directory import directory_cache
+
+# Admin edits, refresh_ratings and seeds all go through save()
+directory_cache.watch(Golfer)
@@ -1,3 +1,45 @@
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from apps.golfers.models import Golfer
+
+
+class GolferDirectoryCacheTests(TestCase):
+    def setUp(self):
+        caches["catalog"].clear()
+        self.client = APIClient()
+        for i, rating in enumerate((80, 65, 50)):
+            Golfer.objects.create(name=f"Golfer {i}", country="CAN", putting=rating, approach=rating)
+
+    def test_warm_list_skips_the_database(self):
+        first = self.client.get("/api/golfers/", {"ordering": "-overall"})
+        self.assertEqual(first.status_code, 200)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get("/api/golfers/", {"ordering": "-overall"})
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(len(queries), 0)
+
+    def test_default_cache_churn_keeps_pages(self):
+        self.client.get("/api/golfers/")
+        for i in range(settings.CACHE_MAX_ENTRIES * 2):
+            cache.set(f"churn:{i}", i)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/api/golfers/")
+        self.assertEqual(len(queries), 0)
+
+    def test_save_and_delete_retire_cached_pages(self):
+        url = "/api/golfers/"
+        self.assertEqual(self.client.get(url).json()["count"], 3)
+
+        golfer = Golfer.objects.get(name="Golfer 0")
+        golfer.country = "USA"
+        golfer.save()
+        rows = self.client.get(url, {"country": "USA"}).json()["results"]
+        self.assertEqual([g["name"] for g in rows], ["Golfer 0"])
+
+        golfer.delete()
+        self.assertEqual(self.client.get(url).json()["count"], 2)
@@ -1,16 +1,77 @@
-from rest_framework import viewsets
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from apps.golfers.models import Golfer
+from apps.golfers.pagination import GolferPagination
 from apps.golfers.serializers import GolferSerializer
+from apps.golfers.services.directory import directory_cache
 from apps.golfers.services.ratings import update_ratings_from_csv
 
 
 class GolferViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Golfer directory. `list` is paginated and takes:
+      ?min_overall= / ?max_overall=   rating band (inclusive)
+      ?country=USA,ENG                 one or more country codes
+      ?active=true|false
+      ?ordering=name|-name|overall|-overall   (default name)
+      ?fields=id,name,overall          sparse rows
+    Responses are cached per query until a golfer is saved or deleted.
+    """
     queryset = Golfer.objects.all().order_by("name")
     serializer_class = GolferSerializer
+    pagination_class = GolferPagination
+
+    ORDERINGS = ("name", "-name", "overall", "-overall")
+
+    def _requested_fields(self):
+        fields = self.request.query_params.get("fields")
+        if not fields:
+            return None
+        known = set(GolferSerializer.Meta.fields)
+        return [f for f in fields.split(",") if f in known] or None
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self._requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        qs = Golfer.objects.all()
+        fields = self._requested_fields()
+        if fields:
+            qs = qs.only("id", *fields)
+        if self.action != "list":
+            return qs
+
+        params = self.request.query_params
+        if params.get("min_overall"):
+            qs = qs.filter(overall__gte=int(params["min_overall"]))
+        if params.get("max_overall"):
+            qs = qs.filter(overall__lte=int(params["max_overall"]))
+        if params.get("country"):
+            qs = qs.filter(country__in=params["country"].upper().split(","))
+        if params.get("active") in ("true", "1"):
+            qs = qs.filter(is_active=True)
+        elif params.get("active") in ("false", "0"):
+            qs = qs.filter(is_active=False)
+
+        ordering = params.get("ordering", "name")
+        if ordering not in self.ORDERINGS:
+            ordering = "name"
+        return qs.order_by(ordering, "name", "id")
+
+    def list(self, request, *args, **kwargs):
+        for param in ("min_overall", "max_overall"):
+            value = request.query_params.get(param)
+            if value and not value.isdigit():
+                return Response({"error": f"{param} must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+        return directory_cache.response(request, lambda: super(GolferViewSet, self).list(request, *args, **kwargs).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        return directory_cache.response(request, lambda: super(GolferViewSet, self).retrieve(request, *args, **kwargs).data)
 
     @action(detail=False, methods=['post'])
     def refresh_ratings(self, request):
         count = update_ratings_from_csv()
+        directory_cache.invalidate()
         return Response({"status": "ok", "golfers_updated": count})
@@ -1,11 +1,14 @@
 # apps/tournaments/admin.py
 
 from django.contrib import admin
+from django.db import transaction
 from django.db.models import Sum, Q
 from django.utils.html import format_html
 from django.utils import timezone
 
 from .models import Tournament, TournamentEntry, Group, GroupMember, HoleResult, Season
+from .services.live import publish_changes
+from .services.rounds import refresh_entry_round
 
 
 # ---------- Inlines ----------
@@ -215,6 +218,48 @@ class HoleResultAdmin(admin.ModelAdmin):
         return obj.entry.tournament.name
     tournament_name.short_description = "Tournament"
 
+    # Hand edits bypass the engine, so keep the materialized EntryRound rows
+    # (and the entry's running totals) in step with every save and delete,
+    # then publish a new tournament version so ETags, cached payloads,
+    # changes?since= and live subscribers all see the correction.
+    def _refresh(self, entry_id: int, round_number: int) -> Tournament:
+        entry = TournamentEntry.objects.select_related("tournament").get(pk=entry_id)
+        rounds = refresh_entry_round(entry, round_number)
+        if round_number == entry.tournament.current_round:
+            entry.total_strokes = next((r.strokes for r in rounds if r.round_number == round_number), 0)
+        entry.tournament_strokes = sum(r.strokes for r in rounds)
+        entry.save(update_fields=["total_strokes", "tournament_strokes"])
+        return entry.tournament
+
+    def _publish(self, tournaments):
+        # Same as TournamentViewSet._publish, once per touched tournament
+        for tournament in {t.pk: t for t in tournaments}.values():
+            since = tournament.version
+            tournament.bump_version()
+            publish_changes(tournament, since)
+
+    def save_model(self, request, obj, form, change):
+        previous = None
+        if change:
+            previous = HoleResult.objects.filter(pk=obj.pk).values_list("entry_id", "round_number").first()
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            touched = [self._refresh(obj.entry_id, obj.round_number)]
+            if previous and previous != (obj.entry_id, obj.round_number):
+                touched.append(self._refresh(*previous))
+            self._publish(touched)
+
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            super().delete_model(request, obj)
+            self._publish([self._refresh(obj.entry_id, obj.round_number)])
+
+    def delete_queryset(self, request, queryset):
+        touched = set(queryset.values_list("entry_id", "round_number"))
+        with transaction.atomic():
+            super().delete_queryset(request, queryset)
+            self._publish([self._refresh(entry_id, round_number) for entry_id, round_number in touched])
+
 
 @admin.register(Season)
 class SeasonAdmin(admin.ModelAdmin):
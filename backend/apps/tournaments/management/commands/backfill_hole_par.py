@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from apps.courses.models import Hole
+from apps.tournaments.models import HoleResult
+from apps.tournaments.services.par import backfill_hole_par
+
+
+class Command(BaseCommand):
+    help = "Stamp par and to_par on hole results that predate those columns (chunked, safe to re-run)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        updated = backfill_hole_par(
+            HoleResult, Hole, batch_size=options["batch_size"], log=lambda msg: self.stdout.write(msg)
+        )
+        self.stdout.write(self.style.SUCCESS(f"Stamped {updated} hole results"))
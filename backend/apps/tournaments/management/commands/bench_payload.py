@@ -0,0 +1,72 @@
+import gzip
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from rest_framework.renderers import JSONRenderer
+
+from config.renderers import ORJSONRenderer, orjson
+from apps.tournaments.models import Tournament
+from apps.tournaments.serializers import NormalizedTournamentSerializer, TournamentSerializer
+from apps.tournaments.views import TournamentViewSet
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _timed(fn, repeat):
+    """(result, median ms) over `repeat` runs."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(times)
+
+
+class Command(BaseCommand):
+    help = "Benchmark tournament payload rendering (stdlib json vs orjson) and compression (gzip vs brotli)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tournament", type=int, help="Tournament id (default: the largest field)")
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        if options["tournament"]:
+            pk = options["tournament"]
+        else:
+            pk = (
+                Tournament.objects.annotate(n=Count("entries")).order_by("-n").values_list("pk", flat=True).first()
+            )
+        if pk is None:
+            raise CommandError("No tournaments to benchmark")
+
+        repeat = options["repeat"]
+        view = TournamentViewSet()
+        view.request = None  # nested shape prefetches
+
+        tournament = view._payload_queryset().get(pk=pk)
+        self.stdout.write(
+            f"Tournament {pk} '{tournament.name}': {tournament.entries.count()} entries, round {tournament.current_round}"
+        )
+        if orjson is None:
+            self.stdout.write(self.style.WARNING("orjson not installed: ORJSONRenderer falls back to stdlib json"))
+
+        for label, serializer_class in (("nested", TournamentSerializer), ("normalized", NormalizedTournamentSerializer)):
+            data, serialize_ms = _timed(lambda: serializer_class(tournament).data, repeat)
+            body, json_ms = _timed(lambda: JSONRenderer().render(data), repeat)
+            _, orjson_ms = _timed(lambda: ORJSONRenderer().render(data), repeat)
+            gz, gzip_ms = _timed(lambda: gzip.compress(body, 6), repeat)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n{label}"))
+            self.stdout.write(f"  serialize        {serialize_ms:8.1f} ms")
+            self.stdout.write(f"  render json      {json_ms:8.1f} ms")
+            self.stdout.write(f"  render orjson    {orjson_ms:8.1f} ms  ({json_ms / max(orjson_ms, 1e-6):.1f}x)")
+            self.stdout.write(f"  bytes            {len(body):8d}")
+            self.stdout.write(f"  gzip -6          {len(gz):8d}  ({len(body) / len(gz):.1f}x, {gzip_ms:.1f} ms)")
+            if brotli is not None:
+                br, br_ms = _timed(lambda: brotli.compress(body, quality=5), repeat)
+                self.stdout.write(f"  brotli q5        {len(br):8d}  ({len(body) / len(br):.1f}x, {br_ms:.1f} ms)")
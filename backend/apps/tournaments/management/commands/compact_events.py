@@ -0,0 +1,54 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tournaments.models import Tournament, TournamentEvent
+
+
+class Command(BaseCommand):
+    help = "Prune low-importance events of finished tournaments past the retention window"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.EVENT_RETENTION_DAYS,
+                            help="Only touch events older than this many days")
+        parser.add_argument("--keep-importance", type=int, default=settings.EVENT_KEEP_IMPORTANCE,
+                            help="Events at or above this importance are always kept")
+        parser.add_argument("--keep-recent", type=int, default=settings.EVENT_KEEP_RECENT,
+                            help="Always keep each tournament's newest N events")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        batch_size = options["batch_size"]
+        total = 0
+
+        for tournament_id in Tournament.objects.filter(status="finished").values_list("pk", flat=True).iterator():
+            events = TournamentEvent.objects.filter(tournament_id=tournament_id)
+            # The head of the feed (recent_events, first /events/ page) survives
+            recent = list(events.order_by("-created_at", "-id").values_list("pk", flat=True)[: options["keep_recent"]])
+            prunable = (
+                events.filter(created_at__lt=cutoff, importance__lt=options["keep_importance"])
+                .exclude(pk__in=recent)
+                .order_by("pk")
+            )
+
+            if options["dry_run"]:
+                pruned = prunable.count()
+            else:
+                # Bounded batches keep each delete (and its lock) short
+                pruned = 0
+                while True:
+                    ids = list(prunable.values_list("pk", flat=True)[:batch_size])
+                    if not ids:
+                        break
+                    pruned += TournamentEvent.objects.filter(pk__in=ids).delete()[0]
+
+            if pruned:
+                self.stdout.write(f"Tournament {tournament_id}: {pruned} events")
+            total += pruned
+
+        verb = "Would prune" if options["dry_run"] else "Pruned"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {total} events"))
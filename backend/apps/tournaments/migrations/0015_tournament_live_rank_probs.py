@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0014_season_tournament_season_order_tournament_season'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tournament',
+            name='live_rank_probs',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
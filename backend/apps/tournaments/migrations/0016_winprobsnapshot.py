@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0015_tournament_live_rank_probs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WinProbSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('clock', models.DateTimeField()),
+                ('round_number', models.PositiveSmallIntegerField()),
+                ('probs', models.BinaryField()),
+                ('tournament', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='prob_snapshots', to='tournaments.tournament')),
+            ],
+            options={
+                'ordering': ['clock'],
+                'unique_together': {('tournament', 'clock')},
+            },
+        ),
+    ]
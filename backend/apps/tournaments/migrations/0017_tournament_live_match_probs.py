@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0016_winprobsnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tournament',
+            name='live_match_probs',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
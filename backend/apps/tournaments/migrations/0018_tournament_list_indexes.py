@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0001_initial'),
+        ('golfers', '0004_golfer_dob'),
+        ('tournaments', '0017_tournament_live_match_probs'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tournament',
+            index=models.Index(fields=['-created_at', '-id'], name='tournament_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tournament',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='tournament_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tournament',
+            index=models.Index(fields=['season', '-created_at', '-id'], name='tournament_season_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tournamententry',
+            index=models.Index(fields=['tournament', 'position'], name='entry_position_idx'),
+        ),
+    ]
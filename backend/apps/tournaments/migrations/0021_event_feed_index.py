@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0020_row_versions'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='tournamentevent',
+            options={'ordering': ['-created_at', '-id']},
+        ),
+        migrations.AddIndex(
+            model_name='tournamentevent',
+            index=models.Index(fields=['tournament', '-created_at', '-id'], name='event_feed_idx'),
+        ),
+    ]
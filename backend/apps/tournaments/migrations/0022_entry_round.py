@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_entry_rounds(apps, schema_editor):
+    HoleResult = apps.get_model("tournaments", "HoleResult")
+    EntryRound = apps.get_model("tournaments", "EntryRound")
+    TournamentEntry = apps.get_model("tournaments", "TournamentEntry")
+    Hole = apps.get_model("courses", "Hole")
+
+    course_of = dict(TournamentEntry.objects.values_list("id", "tournament__course_id"))
+    pars = {(course_id, number): par for course_id, number, par in Hole.objects.values_list("course_id", "number", "par")}
+
+    totals = {}  # (entry_id, round) -> [strokes, par_played, holes_played]
+    rows = HoleResult.objects.values_list("entry_id", "round_number", "hole_number", "strokes")
+    for entry_id, round_number, hole_number, strokes in rows.iterator(chunk_size=2000):
+        t = totals.setdefault((entry_id, round_number), [0, 0, 0])
+        t[0] += strokes
+        t[1] += pars.get((course_of[entry_id], hole_number), 4)
+        t[2] += 1
+
+    EntryRound.objects.bulk_create(
+        [
+            EntryRound(
+                entry_id=entry_id, round_number=round_number,
+                strokes=strokes, par_played=par, holes_played=holes, to_par=strokes - par,
+            )
+            for (entry_id, round_number), (strokes, par, holes) in totals.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0001_initial'),
+        ('tournaments', '0021_event_feed_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntryRound',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('round_number', models.PositiveSmallIntegerField()),
+                ('strokes', models.PositiveSmallIntegerField(default=0)),
+                ('par_played', models.PositiveSmallIntegerField(default=0)),
+                ('holes_played', models.PositiveSmallIntegerField(default=0)),
+                ('to_par', models.SmallIntegerField(default=0)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rounds', to='tournaments.tournamententry')),
+            ],
+            options={
+                'ordering': ['round_number'],
+                'unique_together': {('entry', 'round_number')},
+            },
+        ),
+        migrations.RunPython(backfill_entry_rounds, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:17
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import F
+
+BATCH_SIZE = 2000
+
+
+def stamp_par(apps, schema_editor):
+    # Same chunked walk as `manage.py backfill_hole_par`, frozen here on the
+    # historical models: one UPDATE per distinct par per batch of NULL rows
+    HoleResult = apps.get_model("tournaments", "HoleResult")
+    Hole = apps.get_model("courses", "Hole")
+
+    pars = {(course_id, number): par for course_id, number, par in Hole.objects.values_list("course_id", "number", "par")}
+    pending = HoleResult.objects.filter(par__isnull=True).order_by("pk")
+
+    last_pk = 0
+    while True:
+        batch = list(
+            pending.filter(pk__gt=last_pk).values_list("pk", "entry__tournament__course_id", "hole_number")[:BATCH_SIZE]
+        )
+        if not batch:
+            return
+
+        by_par = defaultdict(list)
+        for pk, course_id, hole_number in batch:
+            by_par[pars.get((course_id, hole_number), 4)].append(pk)
+        for par, pks in by_par.items():
+            HoleResult.objects.filter(pk__in=pks).update(par=par, to_par=F("strokes") - par)
+
+        last_pk = batch[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0001_initial'),
+        ('tournaments', '0022_entry_round'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='holeresult',
+            name='par',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='holeresult',
+            name='to_par',
+            field=models.SmallIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(stamp_par, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:20
+
+from django.db import migrations, models
+
+BOOL_STATS = ("fir", "gir")
+INT_STATS = ("putts", "drive_distance", "prox_to_hole", "excitement")
+
+
+def split_stats(apps, schema_editor):
+    """Copy the `stats` JSON into the typed columns, in primary-key batches."""
+    HoleResult = apps.get_model("tournaments", "HoleResult")
+    fields = [*BOOL_STATS, *INT_STATS, "commentary"]
+
+    batch = []
+    for hr in HoleResult.objects.exclude(stats={}).only("id", "stats").order_by("pk").iterator(chunk_size=2000):
+        stats = hr.stats or {}
+        for f in BOOL_STATS:
+            setattr(hr, f, None if stats.get(f) is None else bool(stats[f]))
+        for f in INT_STATS:
+            setattr(hr, f, None if stats.get(f) is None else max(0, int(stats[f])))
+        hr.commentary = stats.get("commentary") or ""
+        batch.append(hr)
+        if len(batch) >= 2000:
+            HoleResult.objects.bulk_update(batch, fields)
+            batch = []
+    if batch:
+        HoleResult.objects.bulk_update(batch, fields)
+
+
+def join_stats(apps, schema_editor):
+    HoleResult = apps.get_model("tournaments", "HoleResult")
+    fields = [*BOOL_STATS, "putts", "drive_distance", "prox_to_hole", "commentary", "excitement"]
+
+    batch = []
+    for hr in HoleResult.objects.only("id", *fields).order_by("pk").iterator(chunk_size=2000):
+        if hr.commentary or any(getattr(hr, f) is not None for f in fields if f != "commentary"):
+            hr.stats = {
+                "fir": hr.fir, "gir": hr.gir, "putts": hr.putts, "drive_distance": hr.drive_distance,
+                "prox_to_hole": hr.prox_to_hole, "commentary": hr.commentary, "excitement": hr.excitement,
+            }
+            batch.append(hr)
+        if len(batch) >= 2000:
+            HoleResult.objects.bulk_update(batch, ["stats"])
+            batch = []
+    if batch:
+        HoleResult.objects.bulk_update(batch, ["stats"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0023_hole_result_par'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='holeresult',
+            name='commentary',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='holeresult',
+            name='drive_distance',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='holeresult',
+            name='excitement',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='holeresult',
+            name='fir',
+            field=models.BooleanField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='holeresult',
+            name='gir',
+            field=models.BooleanField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='holeresult',
+            name='prox_to_hole',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='holeresult',
+            name='putts',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(split_stats, join_stats),
+        migrations.RemoveField(
+            model_name='holeresult',
+            name='stats',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0024_hole_stat_columns'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='holeresult',
+            index=models.Index(fields=['entry', 'version'], name='hole_result_version_idx'),
+        ),
+    ]
@@ -1,11 +1,30 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.db.models import JSONField
 
-from apps.courses.models import Course
+from apps.courses.models import Course, Hole
 from apps.golfers.models import Golfer
 
 
+class VersionedRow(models.Model):
+    """
+    A row that records the tournament version which last changed it, for
+    delta sync (`changes?since=`). Every save marks the row unpublished
+    (NULL); Tournament.bump_version() stamps unpublished rows with the new
+    version. Queryset .update() calls must set version=None themselves.
+    """
+    version = models.PositiveIntegerField(null=True, blank=True, db_index=True)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        self.version = None
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "version"}
+        super().save(*args, **kwargs)
+
+
 class Tournament(models.Model):
     """
     A single PGA-style stroke play tournament.
@@ -49,12 +68,50 @@ class Tournament(models.Model):
 
     # Live Win Probabilities: {"entry_id": 0.15, ...}
     live_win_probs = models.JSONField(blank=True, default=dict)
+
+    # Finish distribution, column-oriented:
+    # {"ids": [...], "win": [...], "top5": [...], "top10": [...], "make_cut": [...], "exp_finish": [...]}
+    live_rank_probs = models.JSONField(blank=True, default=dict)
+
+    # Match play only: per-match and team odds (see services/match_play.py)
+    live_match_probs = models.JSONField(blank=True, default=dict)
     
+    # Bumped by every mutating path (tick, hole result, reseed, shuffle);
+    # drives ETags and conditional GETs
+    version = models.PositiveIntegerField(default=0)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # Back the paginated list (newest first) and its status/season filters
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="tournament_created_idx"),
+            models.Index(fields=["status", "-created_at", "-id"], name="tournament_status_idx"),
+            models.Index(fields=["season", "-created_at", "-id"], name="tournament_season_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
+    def bump_version(self) -> int:
+        """
+        Mark the tournament as changed and publish the rows changed since
+        the last bump under the new version. Incremented in SQL so
+        concurrent writers never hand out the same version twice.
+        """
+        with transaction.atomic():
+            Tournament.objects.filter(pk=self.pk).update(version=models.F("version") + 1)
+            self.refresh_from_db(fields=["version"])
+
+            for qs in (
+                self.entries.all(),
+                self.groups.all(),
+                self.events.all(),
+                HoleResult.objects.filter(entry__tournament=self),
+            ):
+                qs.filter(version__isnull=True).update(version=self.version)
+        return self.version
+
 
 class Season(models.Model):
     name = models.CharField(max_length=200)
@@ -67,7 +124,7 @@ class Season(models.Model):
         return self.name
 
 
-class TournamentEntry(models.Model):
+class TournamentEntry(VersionedRow):
     """
     A golfer (real or human) participating in a tournament.
     """
@@ -97,11 +154,15 @@ class TournamentEntry(models.Model):
     cut = models.BooleanField(default=False)
     sim_state = models.JSONField(default=dict, blank=True)
 
+    class Meta:
+        # Leader lookups (position=1) for the tournament list
+        indexes = [models.Index(fields=["tournament", "position"], name="entry_position_idx")]
+
     def __str__(self):
         return f"{self.display_name} ({'Human' if self.is_human else 'Bot'})"
 
 
-class Group(models.Model):
+class Group(VersionedRow):
     tournament = models.ForeignKey("tournaments.Tournament", on_delete=models.CASCADE, related_name="groups")
     tee_time = models.DateTimeField()
 
@@ -122,7 +183,7 @@ class GroupMember(models.Model):
     class Meta:
         unique_together = [("group", "entry")]
 
-class HoleResult(models.Model):
+class HoleResult(VersionedRow):
     """
     Result of a single player on a single hole in a round.
     """
@@ -131,15 +192,110 @@ class HoleResult(models.Model):
     hole_number = models.PositiveSmallIntegerField()
 
     strokes = models.PositiveSmallIntegerField()
-    stats = models.JSONField(default=dict, blank=True)
+    # Par of the hole when it was played, stamped by the engine on write
+    # (and looked up from the course on save otherwise), so to-par sums are
+    # plain SQL over this table. NULL only on rows that never went through
+    # save() (.update()/bulk_create, or written before these columns
+    # existed; see backfill_hole_par) or whose course has no such hole.
+    # Readers count a NULL-par hole as level par.
+    par = models.PositiveSmallIntegerField(null=True, blank=True)
+    to_par = models.SmallIntegerField(null=True, blank=True)
+
+    # Shot stats from the engine (NULL for human-entered holes), typed so
+    # field-wide aggregates run in SQL. Exposed together as `stats`.
+    fir = models.BooleanField(null=True, blank=True)  # NULL on par 3s
+    gir = models.BooleanField(null=True, blank=True)
+    putts = models.PositiveSmallIntegerField(null=True, blank=True)
+    drive_distance = models.PositiveSmallIntegerField(null=True, blank=True)  # yards
+    prox_to_hole = models.PositiveSmallIntegerField(null=True, blank=True)  # feet
+    commentary = models.TextField(blank=True, default="")
+    excitement = models.PositiveSmallIntegerField(null=True, blank=True)  # 0-10
+
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Keys of the `stats` dict, in the order the API has always sent them
+    STAT_FIELDS = ("fir", "gir", "putts", "drive_distance", "prox_to_hole", "commentary", "excitement")
+
     class Meta:
         unique_together = [("entry", "round_number", "hole_number")]
         ordering = ["round_number", "hole_number"]
+        # Delta sync and bump_version() read a tournament's hole results by
+        # version: per entry, a range scan instead of every hole played
+        indexes = [models.Index(fields=["entry", "version"], name="hole_result_version_idx")]
+
+    @classmethod
+    def stats_from(cls, row: dict) -> dict:
+        """
+        The `stats` dict from a mapping of stat column -> value (e.g. a
+        `.values()` row): every key when the engine recorded the hole,
+        `{}` when nobody did.
+        """
+        if row["commentary"] or any(row[f] is not None for f in cls.STAT_FIELDS if f != "commentary"):
+            return {f: row[f] for f in cls.STAT_FIELDS}
+        return {}
+
+    @property
+    def stats(self) -> dict:
+        return self.stats_from({f: getattr(self, f) for f in self.STAT_FIELDS})
+
+    @stats.setter
+    def stats(self, value: dict):
+        # Accepts the engine's dict (also as a create()/defaults kwarg)
+        value = value or {}
+        for f in self.STAT_FIELDS:
+            setattr(self, f, value.get(f, "" if f == "commentary" else None))
+
+    def save(self, *args, **kwargs):
+        if self.par is None:
+            self.par = (
+                Hole.objects.filter(course__tournament__entries=self.entry_id, number=self.hole_number)
+                .values_list("par", flat=True)
+                .first()
+            )
+        self.to_par = None if self.par is None else self.strokes - self.par
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "par", "to_par"}
+        super().save(*args, **kwargs)
+
+
+class EntryRound(models.Model):
+    """
+    Per-entry, per-round totals over that round's HoleResult rows, kept in
+    step with them (services/rounds.py) so round scores, to-par and thru
+    are indexed reads instead of aggregates over every hole played.
+    """
+    entry = models.ForeignKey(TournamentEntry, on_delete=models.CASCADE, related_name="rounds")
+    round_number = models.PositiveSmallIntegerField()
+
+    strokes = models.PositiveSmallIntegerField(default=0)
+    par_played = models.PositiveSmallIntegerField(default=0)  # par of the holes played so far
+    holes_played = models.PositiveSmallIntegerField(default=0)
+    to_par = models.SmallIntegerField(default=0)
+
+    class Meta:
+        unique_together = [("entry", "round_number")]
+        ordering = ["round_number"]
+
+
+class WinProbSnapshot(models.Model):
+    """
+    One point of a tournament's win-probability time series.
+
+    `probs` is packed rather than a JSON dict: one uint16 per entry
+    (P(win) * 65535) in the tournament's stable entry order (entry id
+    ascending), zlib-compressed. See services/prob_history.py.
+    """
+    tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE, related_name="prob_snapshots")
+    clock = models.DateTimeField()  # tournament.current_time when taken
+    round_number = models.PositiveSmallIntegerField()
+    probs = models.BinaryField()
+
+    class Meta:
+        unique_together = [("tournament", "clock")]
+        ordering = ["clock"]
 
 
-class TournamentEvent(models.Model):
+class TournamentEvent(VersionedRow):
     tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE, related_name="events")
     round_number = models.PositiveSmallIntegerField()
     text = models.CharField(max_length=255)
@@ -150,7 +306,10 @@ class TournamentEvent(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-id"]
+        # Feed reads (recent events, the keyset-paginated /events/ action)
+        # walk one tournament's events newest first straight off this index
+        indexes = [models.Index(fields=["tournament", "-created_at", "-id"], name="event_feed_idx")]
 
     def __str__(self):
         return self.text
@@ -0,0 +1,25 @@
+from rest_framework.pagination import CursorPagination
+
+
+class TournamentCursorPagination(CursorPagination):
+    """
+    Newest first. Cursor (not offset) paging keeps each page an index range
+    scan on (created_at, id) no matter how many seasons have been played.
+    """
+    page_size = 24
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    A tournament's event feed, newest first. `?after=<cursor>` continues
+    from the last page; every page is a range read on event_feed_idx, so it
+    costs the same on the first hole as after four rounds of history.
+    """
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "after"
+    ordering = ("-created_at", "-id")
@@ -1,7 +1,6 @@
 from rest_framework import serializers
 from django.utils import timezone
 from django.db import transaction
-from django.db.models import Sum
 
 from apps.tournaments.models import (
     Season,
@@ -11,6 +10,7 @@ from apps.tournaments.models import (
     Group,
     GroupMember,
     HoleResult,
+    EntryRound,
 )
 from apps.courses.models import Course
 from apps.golfers.models import Golfer
@@ -97,6 +97,17 @@ class HoleResultSerializer(serializers.ModelSerializer):
         fields = ["round_number", "hole_number", "strokes", "stats"]
 
 
+class HoleStrokesSerializer(serializers.ModelSerializer):
+    # Hole rows without stats/commentary; those come from the scorecard endpoint
+    class Meta:
+        model = HoleResult
+        fields = ["round_number", "hole_number", "strokes"]
+
+
+# `holes` serializer context: how much hole-level detail entries embed
+HOLE_DETAIL_MODES = ("full", "strokes", "none")
+
+
 class TournamentEntrySerializer(serializers.ModelSerializer):
     hole_results = HoleResultSerializer(many=True, read_only=True)
     # Expose golfer rating for frontend sorting/display
@@ -122,6 +133,15 @@ class TournamentEntrySerializer(serializers.ModelSerializer):
             "hole_results",
         ]
 
+    def get_fields(self):
+        fields = super().get_fields()
+        holes = self.context.get("holes", "full")
+        if holes == "none":
+            fields.pop("hole_results", None)
+        elif holes == "strokes" and "hole_results" in fields:
+            fields["hole_results"] = HoleStrokesSerializer(many=True, read_only=True)
+        return fields
+
 
 
 class GroupMemberSerializer(serializers.ModelSerializer):
@@ -150,6 +170,17 @@ class GroupSerializer(serializers.ModelSerializer):
         ]
 
 
+class GroupMemberRefSerializer(serializers.ModelSerializer):
+    # Entry by id only; the normalized payload carries each entry once
+    class Meta:
+        model = GroupMember
+        fields = ["id", "entry"]
+
+
+class GroupRefSerializer(GroupSerializer):
+    members = GroupMemberRefSerializer(many=True, read_only=True)
+
+
 class TournamentSerializer(serializers.ModelSerializer):
     entries = TournamentEntrySerializer(many=True, read_only=True)
     groups = GroupSerializer(many=True, read_only=True)
@@ -176,6 +207,9 @@ class TournamentSerializer(serializers.ModelSerializer):
             "session_history",
             "round_conditions",
             "live_win_probs",
+            "live_rank_probs",
+            "live_match_probs",
+            "version",
             "season", 
             "season_order",
             "entries",
@@ -187,7 +221,7 @@ class TournamentSerializer(serializers.ModelSerializer):
 
     def get_recent_events(self, obj):
         # Return last 10 events
-        qs = obj.events.all().order_by("-created_at")[:10]
+        qs = obj.events.all().order_by("-created_at", "-id")[:10]
         return TournamentEventSerializer(qs, many=True).data
 
     def get_best_rounds(self, obj):
@@ -195,64 +229,25 @@ class TournamentSerializer(serializers.ModelSerializer):
         Return top 5 lowest scores for the *current round*
         so far. Useful for 'Big Movers' widget.
         """
-        # We need to compute score relative to par for current round
-        # This is a bit expensive if we do it for everyone.
-        # Faster way: Query HoleResults for current round, aggregate sum strokes
-        # But that doesn't account for how many holes they played ( -2 thru 3 is better than E thru 18? maybe not)
-        # Standard 'Low Round' is total strokes relative to par.
-        
-        # 1. Get all HoleResults for this tournament + current round
-        from django.db.models import Sum, Count, F
-        
-        # We want: Entry ID, sum(strokes), count(holes)
-        # Then we subtract count(holes) * avg_par (or look up pars)
-        
-        current_round = obj.current_round
-        
-        # Aggregate stats for R{current_round}
-        # Filter to entries who have started at least 1 hole in this round
-        results = HoleResult.objects.filter(
-            entry__tournament=obj, round_number=current_round
-        ).values('entry__id', 'entry__display_name').annotate(
-            total_strokes=Sum('strokes'),
-            played_holes=Count('id')
+        # One indexed read of the current round's EntryRound rows,
+        # ordered by to-par and cut to 5 rows by the database.
+        results = (
+            EntryRound.objects.filter(entry__tournament=obj, round_number=obj.current_round)
+            .values("entry_id", "entry__display_name", "strokes", "holes_played", "to_par")
+            .order_by("to_par", "entry_id")[:5]
         )
-        
-        if not results:
-            return []
-            
-        # We need par info. Assuming standard par 4 is avg? No, inaccurate.
-        # Fetch course pars map
-        course_pars = {h.number: h.par for h in obj.course.holes.all()}
-        
-        data = []
-        for r in results:
-            # We must re-query the exact hole numbers played to get exact par
-            # This is N+1 but optimized by just fetching hole numbers
-            played_hole_nums = HoleResult.objects.filter(
-                entry_id=r['entry__id'], 
-                round_number=current_round
-            ).values_list('hole_number', flat=True)
-            
-            par_total = sum(course_pars.get(h, 4) for h in played_hole_nums)
-            score_to_par = r['total_strokes'] - par_total
-            
-            # Format: "-3 (12)" or "-3 (F)"
-            thru = len(played_hole_nums)
-            thru_display = "F" if thru >= 18 else str(thru)
-            
-            data.append({
-                "id": r['entry__id'],
-                "name": r['entry__display_name'],
-                "score": score_to_par,
-                "thru": thru_display,
-                "raw_score": r['total_strokes']
-            })
-            
-        # Sort by score asc (lowest first)
-        data.sort(key=lambda x: x['score'])
-        
-        return data[:5]
+
+        return [
+            {
+                "id": r["entry_id"],
+                "name": r["entry__display_name"],
+                "score": r["to_par"],
+                # Format: "-3 (12)" or "-3 (F)"
+                "thru": "F" if r["holes_played"] >= 18 else str(r["holes_played"]),
+                "raw_score": r["strokes"],
+            }
+            for r in results
+        ]
     
     # def get_projected_cut(self, obj):
     #     """
@@ -262,6 +257,68 @@ class TournamentSerializer(serializers.ModelSerializer):
     #     return obj.projected_cut_score
         
 
+class TournamentSummarySerializer(serializers.ModelSerializer):
+    """
+    List representation: no entries, groups or hole results.
+    `entry_count` and `leader` come from queryset annotations.
+    """
+    course_name = serializers.CharField(source="course.name", read_only=True)
+    entry_count = serializers.IntegerField(read_only=True)
+    leader = serializers.CharField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = Tournament
+        fields = [
+            "id",
+            "name",
+            "course",
+            "course_name",
+            "status",
+            "format",
+            "start_time",
+            "current_round",
+            "entry_count",
+            "leader",
+            "season",
+            "season_order",
+            "created_at",
+        ]
+
+
+class NormalizedTournamentSerializer(TournamentSerializer):
+    """
+    Same data as TournamentSerializer without the duplication: `entries`
+    is keyed by entry id (each with its hole_results exactly once) and
+    groups reference their members by entry id.
+    """
+    groups = GroupRefSerializer(many=True, read_only=True)
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data["entries"] = {str(e["id"]): e for e in data["entries"]}
+        return data
+
+
+class TournamentHeaderSerializer(TournamentSerializer):
+    """
+    Tournament-level fields only; entries and groups are streamed
+    separately by services/export.py.
+    """
+    entries = None
+    groups = None
+
+    class Meta(TournamentSerializer.Meta):
+        fields = [f for f in TournamentSerializer.Meta.fields if f not in ("entries", "groups")]
+
+
+class EntryRowSerializer(TournamentEntrySerializer):
+    # hole_results are merged in from their own cursor when streaming
+    hole_results = None
+
+    class Meta(TournamentEntrySerializer.Meta):
+        fields = [f for f in TournamentEntrySerializer.Meta.fields if f != "hole_results"]
+
+
 class TournamentCreateSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=200)
     course_id = serializers.IntegerField()
@@ -0,0 +1,69 @@
+from apps.tournaments.models import Tournament, HoleResult
+from apps.tournaments.serializers import (
+    GroupRefSerializer,
+    TournamentEventSerializer,
+    TournamentSerializer,
+)
+
+# Tournament-level fields that can change on any mutation (clock, round,
+# cut, probabilities); cheap to resend whole with every delta.
+TOURNAMENT_FIELDS = [
+    "status",
+    "current_time",
+    "current_round",
+    "cut_applied",
+    "session_history",
+    "live_win_probs",
+    "live_rank_probs",
+    "live_match_probs",
+]
+
+ENTRY_FIELDS = ["id", "total_strokes", "tournament_strokes", "thru_hole", "position", "cut"]
+
+
+def changes_since(tournament: Tournament, since: int) -> dict:
+    """
+    Everything published after version `since`, keyed the way the
+    normalized tournament payload is (entries and hole results by entry id,
+    groups referencing entry ids).
+
+    `group_ids` lists every current group so clients can drop groups that a
+    reseed deleted. Rows re-sent from an overlapping poll are identical, so
+    applying a delta twice is harmless.
+    """
+    data = {"version": tournament.version, "since": since}
+    if since >= tournament.version:
+        return data
+
+    data["tournament"] = {field: getattr(tournament, field) for field in TOURNAMENT_FIELDS}
+    data["tournament"]["projected_cut"] = tournament.projected_cut_score
+    data["tournament"]["best_rounds"] = TournamentSerializer().get_best_rounds(tournament)
+
+    data["entries"] = list(
+        tournament.entries.filter(version__gt=since).order_by("id").values(*ENTRY_FIELDS)
+    )
+
+    hole_results = {}
+    for row in (
+        HoleResult.objects.filter(entry__tournament=tournament, version__gt=since)
+        .order_by("entry_id", "round_number", "hole_number")
+        .values("entry_id", "round_number", "hole_number", "strokes", *HoleResult.STAT_FIELDS)
+    ):
+        hole_results.setdefault(str(row["entry_id"]), []).append(
+            {
+                "round_number": row["round_number"],
+                "hole_number": row["hole_number"],
+                "strokes": row["strokes"],
+                "stats": HoleResult.stats_from(row),
+            }
+        )
+    data["hole_results"] = hole_results
+
+    groups = tournament.groups.prefetch_related("members")
+    data["groups"] = GroupRefSerializer(groups.filter(version__gt=since), many=True).data
+    data["group_ids"] = list(groups.values_list("id", flat=True))
+
+    data["events"] = TournamentEventSerializer(
+        tournament.events.filter(version__gt=since), many=True
+    ).data
+    return data
@@ -0,0 +1,88 @@
+from itertools import groupby
+
+from asgiref.sync import sync_to_async
+
+from config.renderers import render_json
+from apps.tournaments.models import Tournament, HoleResult
+from apps.tournaments.serializers import (
+    EntryRowSerializer,
+    GroupRefSerializer,
+    TournamentHeaderSerializer,
+)
+
+CHUNK_SIZE = 500          # rows per server-side cursor fetch
+FLUSH_BYTES = 64 * 1024   # bytes per yielded chunk
+
+
+def stream_tournament_json(tournament: Tournament, chunk_size: int = CHUNK_SIZE):
+    """
+    The normalized tournament payload (see NormalizedTournamentSerializer),
+    rendered incrementally.
+
+    Entries and hole results are read through two server-side cursors, both
+    ordered by entry id, and merged one entry at a time, so memory stays
+    flat however large the field and however many rounds have been played.
+    Yields ~64KB byte chunks.
+    """
+    buffer = []
+    size = 0
+
+    def emit(part: bytes):
+        nonlocal size
+        buffer.append(part)
+        size += len(part)
+
+    header = render_json(TournamentHeaderSerializer(tournament).data)
+    emit(header[:-1] + b',"entries":{')
+
+    hole_rows = (
+        HoleResult.objects.filter(entry__tournament=tournament)
+        .order_by("entry_id", "round_number", "hole_number")
+        .values("entry_id", "round_number", "hole_number", "strokes", *HoleResult.STAT_FIELDS)
+        .iterator(chunk_size=chunk_size)
+    )
+    holes_by_entry = groupby(hole_rows, key=lambda row: row["entry_id"])
+    pending = next(holes_by_entry, None)
+
+    entries = tournament.entries.select_related("golfer").order_by("id").iterator(chunk_size=chunk_size)
+    for i, entry in enumerate(entries):
+        # Advance the hole-result cursor to this entry (both are id-ordered)
+        while pending is not None and pending[0] < entry.id:
+            pending = next(holes_by_entry, None)
+        hole_results = []
+        if pending is not None and pending[0] == entry.id:
+            hole_results = [
+                {
+                    "round_number": row["round_number"],
+                    "hole_number": row["hole_number"],
+                    "strokes": row["strokes"],
+                    "stats": HoleResult.stats_from(row),
+                }
+                for row in pending[1]
+            ]
+            pending = next(holes_by_entry, None)
+
+        row = EntryRowSerializer(entry).data
+        row["hole_results"] = hole_results
+        emit(b"," if i else b"")
+        emit(b'"%d":' % entry.id + render_json(row))
+
+        if size >= FLUSH_BYTES:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+
+    groups = tournament.groups.prefetch_related("members").order_by("id")
+    emit(b'},"groups":' + render_json(GroupRefSerializer(groups, many=True).data) + b"}")
+    yield b"".join(buffer)
+
+
+async def aiter_sync(iterator):
+    """
+    Serve a sync byte iterator from an ASGI response without Django
+    buffering it whole: each chunk is pulled on the same worker thread
+    (so the DB cursors stay on their connection).
+    """
+    sentinel = object()
+    step = sync_to_async(next, thread_sensitive=True)
+    while (part := await step(iterator, sentinel)) is not sentinel:
+        yield part
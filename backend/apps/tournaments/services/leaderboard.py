@@ -0,0 +1,58 @@
+from django.db.models import F
+
+from apps.tournaments.models import Tournament, EntryRound
+
+
+def build_leaderboard(tournament: Tournament) -> dict:
+    """
+    Column-oriented leaderboard: parallel arrays indexed by row, with
+    per-round stroke totals instead of hole rows.
+
+    Two queries regardless of field size: entries and their EntryRound
+    rows.
+    """
+    entries = list(
+        tournament.entries.order_by("cut", F("position").asc(nulls_last=True), "id")
+        .values("id", "display_name", "position", "cut", "is_human", "team")
+    )
+
+    rounds = {}  # entry_id -> {round: (strokes, to_par, holes)}
+    per_round = EntryRound.objects.filter(entry__tournament=tournament).values_list(
+        "entry_id", "round_number", "strokes", "to_par", "holes_played"
+    )
+    for entry_id, round_number, strokes, to_par, holes in per_round:
+        rounds.setdefault(entry_id, {})[round_number] = (strokes, to_par, holes)
+
+    current = tournament.current_round
+    num_rounds = max(4, current)
+    win_probs = tournament.live_win_probs or {}
+
+    columns = {
+        "id": [], "name": [], "position": [], "to_par": [], "thru": [],
+        "today": [], "win_prob": [], "rounds": [], "cut": [], "is_human": [], "team": [],
+    }
+    for e in entries:
+        played = rounds.get(e["id"], {})
+        today = played.get(current)
+
+        columns["id"].append(e["id"])
+        columns["name"].append(e["display_name"])
+        columns["position"].append(e["position"])
+        columns["to_par"].append(sum(to_par for _, to_par, _ in played.values()))
+        columns["thru"].append(today[2] if today else 0)
+        columns["today"].append(today[1] if today else None)
+        columns["win_prob"].append(win_probs.get(str(e["id"]), 0))
+        columns["rounds"].append([played[r][0] if r in played else None for r in range(1, num_rounds + 1)])
+        columns["cut"].append(e["cut"])
+        columns["is_human"].append(e["is_human"])
+        columns["team"].append(e["team"])
+
+    return {
+        "id": tournament.id,
+        "status": tournament.status,
+        "current_round": current,
+        "current_time": tournament.current_time,
+        "cut_applied": tournament.cut_applied,
+        "projected_cut": tournament.projected_cut_score,
+        "columns": columns,
+    }
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from config.renderers import render_json
+from apps.tournaments.models import Tournament
+from apps.tournaments.services.changes import changes_since
+
+
+class LocalBroker:
+    """
+    In-process fan-out for a single server process.
+
+    Broker interface (what a Redis/pub-sub backend would implement):
+        subscribe(tournament_id) -> queue with `async get()`
+        unsubscribe(tournament_id, queue)
+        has_subscribers(tournament_id) -> bool
+        publish(tournament_id, frame: bytes)
+
+    Subscribers are asyncio queues on the server's event loop; publish()
+    may be called from any thread (sync views run in a thread pool under
+    ASGI). Frames are bytes, so every subscriber gets the same object.
+    """
+
+    def __init__(self, queue_size: int = 64):
+        self.queue_size = queue_size
+        self._subscribers = {}  # tournament_id -> {queue: loop}
+        self._lock = threading.Lock()
+
+    def subscribe(self, tournament_id: int) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(tournament_id, {})[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, tournament_id: int, queue: asyncio.Queue) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(tournament_id, {})
+            subscribers.pop(queue, None)
+            if not subscribers:
+                self._subscribers.pop(tournament_id, None)
+
+    def has_subscribers(self, tournament_id: int) -> bool:
+        return bool(self._subscribers.get(tournament_id))
+
+    def publish(self, tournament_id: int, frame: bytes) -> None:
+        with self._lock:
+            targets = list(self._subscribers.get(tournament_id, {}).items())
+        for queue, loop in targets:
+            loop.call_soon_threadsafe(_offer, queue, frame)
+
+
+def _offer(queue: asyncio.Queue, frame: bytes) -> None:
+    # A subscriber that fell this far behind can't catch up frame by frame:
+    # drop its backlog and tell it to refetch.
+    try:
+        queue.put_nowait(frame)
+    except asyncio.QueueFull:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(RESYNC_FRAME)
+
+
+_broker = None
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        _broker = import_string(settings.LIVE_BROKER)()
+    return _broker
+
+
+def sse_frame(event: str, data: dict, event_id=None) -> bytes:
+    lines = [f"id: {event_id}\n".encode()] if event_id is not None else []
+    lines.append(f"event: {event}\n".encode())
+    lines.append(b"data: " + render_json(data) + b"\n\n")
+    return b"".join(lines)
+
+
+RESYNC_FRAME = sse_frame("resync", {})
+
+
+def changes_frame(tournament: Tournament, since: int) -> bytes:
+    return sse_frame("changes", changes_since(tournament, since), event_id=tournament.version)
+
+
+def publish_changes(tournament: Tournament, since: int) -> None:
+    """
+    Push the delta from `since` to the tournament's live subscribers.
+    Serialized once, however many spectators are connected; skipped
+    entirely when nobody is.
+    """
+    broker = get_broker()
+    if broker.has_subscribers(tournament.pk):
+        broker.publish(tournament.pk, changes_frame(tournament, since))
@@ -0,0 +1,177 @@
+import numpy as np
+
+from apps.tournaments.models import Tournament, GroupMember, HoleResult
+from apps.tournaments.services.probability import (
+    HUMAN_OVERALL,
+    PER_HOLE_SIGMA,
+    SIMULATIONS,
+    skill_adjustment,
+)
+
+
+def _banked_points(tournament: Tournament) -> tuple[float, float, int]:
+    """
+    (USA, EUR, matches) already settled in session_history.
+    """
+    usa = eur = 0.0
+    played = 0
+    for results in (tournament.session_history or {}).values():
+        for r in results:
+            played += 1
+            if r.get("winner") == "USA":
+                usa += 1
+            elif r.get("winner") == "EUR":
+                eur += 1
+            else:
+                usa += 0.5
+                eur += 0.5
+    return usa, eur, played
+
+
+def live_matches(tournament: Tournament) -> list[dict]:
+    """
+    Current-session matches (one per group) with their holes-up state,
+    built from live hole results in a constant number of queries.
+
+    Each match: {"group_id", "usa": [skill_adj...], "eur": [skill_adj...],
+                 "usa_up": int, "thru": int}
+    """
+    if tournament.status == "finished" or f"R{tournament.current_round}" in (tournament.session_history or {}):
+        return []
+
+    members = list(
+        GroupMember.objects.filter(group__tournament=tournament)
+        .order_by("group__tee_time", "group_id", "id")
+        .values("group_id", "entry_id", "entry__team", "entry__is_human", "entry__golfer__overall")
+    )
+
+    scores = {}  # entry_id -> {hole: strokes}
+    for entry_id, hole_num, strokes in HoleResult.objects.filter(
+        entry_id__in=[m["entry_id"] for m in members], round_number=tournament.current_round
+    ).values_list("entry_id", "hole_number", "strokes"):
+        scores.setdefault(entry_id, {})[hole_num] = strokes
+
+    groups = {}
+    for m in members:
+        if m["entry__is_human"]:
+            overall = HUMAN_OVERALL
+        elif m["entry__golfer__overall"] is not None:
+            overall = m["entry__golfer__overall"]
+        else:
+            overall = 75
+        side = "usa" if m["entry__team"] == "USA" else "eur"
+        group = groups.setdefault(m["group_id"], {"group_id": m["group_id"], "usa": [], "eur": [], "ids": {"usa": [], "eur": []}})
+        group[side].append(skill_adjustment(overall))
+        group["ids"][side].append(m["entry_id"])
+
+    matches = []
+    for group in groups.values():
+        if not group["usa"] or not group["eur"]:
+            continue
+
+        # Better ball per side; a hole counts once both sides have a score
+        usa_up = thru = 0
+        for hole_num in range(1, 19):
+            usa_best = [scores.get(e, {}).get(hole_num) for e in group["ids"]["usa"]]
+            eur_best = [scores.get(e, {}).get(hole_num) for e in group["ids"]["eur"]]
+            usa_best = min((s for s in usa_best if s is not None), default=None)
+            eur_best = min((s for s in eur_best if s is not None), default=None)
+            if usa_best is None or eur_best is None:
+                continue
+            thru += 1
+            usa_up += (usa_best < eur_best) - (eur_best < usa_best)
+
+        del group["ids"]
+        group.update({"usa_up": usa_up, "thru": thru})
+        matches.append(group)
+
+    return matches
+
+
+def _state_label(usa_up: int, thru: int) -> str:
+    if thru == 0:
+        return "-"
+    if usa_up == 0:
+        return f"AS thru {thru}"
+    return f"{'USA' if usa_up > 0 else 'EUR'} {abs(usa_up)} UP thru {thru}"
+
+
+def calculate_match_probabilities(tournament: Tournament, simulations: int = SIMULATIONS) -> dict:
+    """
+    Match-play odds for the Ryder Cup format.
+
+    Every live match plays out its remaining holes in one batched draw:
+    each player scores N(skill_adj, 0.45) per hole (par cancels out), the
+    side's better ball wins, ties halve. The final holes-up sign decides
+    the match. Match points plus points banked in session_history give the
+    team point distribution.
+
+    Returns a compact, column-oriented dict:
+        {"matches": {"group_id", "state", "usa", "halve", "eur"},
+         "teams": {"USA": {...}, "EUR": {...}}, "tie": p,
+         "points_available": n, "distribution": {"usa_points", "prob"}}
+    """
+    banked_usa, banked_eur, banked_matches = _banked_points(tournament)
+    matches = live_matches(tournament)
+    m = len(matches)
+
+    if m:
+        remaining = np.array([18 - x["thru"] for x in matches])
+        holes = max(1, int(remaining.max()))
+        width = max(len(x[side]) for x in matches for side in ("usa", "eur"))
+
+        def side_skill(side):
+            # (matches, players) padded with +inf so padding never has the better ball
+            out = np.full((m, width), np.inf)
+            for i, x in enumerate(matches):
+                out[i, : len(x[side])] = x[side]
+            return out
+
+        rng = np.random.default_rng()
+        shape = (simulations, m, holes, width)
+        usa = np.rint(side_skill("usa")[None, :, None, :] + PER_HOLE_SIGMA * rng.standard_normal(shape)).min(axis=3)
+        eur = np.rint(side_skill("eur")[None, :, None, :] + PER_HOLE_SIGMA * rng.standard_normal(shape)).min(axis=3)
+
+        in_play = np.arange(holes)[None, :] < remaining[:, None]  # (matches, holes)
+        swing = np.where(in_play, np.sign(eur - usa), 0).sum(axis=2)
+        final_up = np.array([x["usa_up"] for x in matches]) + swing  # (sims, matches)
+
+        usa_win = (final_up > 0).mean(axis=0)
+        eur_win = (final_up < 0).mean(axis=0)
+        halve = 1.0 - usa_win - eur_win
+        usa_points = banked_usa + np.where(final_up > 0, 1.0, np.where(final_up == 0, 0.5, 0.0)).sum(axis=1)
+    else:
+        usa_win = eur_win = halve = np.zeros(0)
+        usa_points = np.full(simulations, banked_usa)
+
+    available = banked_matches + m
+    eur_points = available - usa_points
+    halves, counts = np.unique(np.rint(usa_points * 2).astype(int), return_counts=True)
+
+    return {
+        "matches": {
+            "group_id": [x["group_id"] for x in matches],
+            "state": [_state_label(x["usa_up"], x["thru"]) for x in matches],
+            "usa": [round(float(p), 4) for p in usa_win],
+            "halve": [round(float(p), 4) for p in halve],
+            "eur": [round(float(p), 4) for p in eur_win],
+        },
+        "teams": {
+            "USA": {
+                "banked": banked_usa,
+                "expected": round(float(usa_points.mean()), 2),
+                "win": round(float((usa_points > available / 2).mean()), 4),
+            },
+            "EUR": {
+                "banked": banked_eur,
+                "expected": round(float(eur_points.mean()), 2),
+                "win": round(float((eur_points > available / 2).mean()), 4),
+            },
+        },
+        "tie": round(float((usa_points * 2 == available).mean()), 4),
+        "points_available": available,
+        "distribution": {
+            "usa_points": [h / 2 for h in halves.tolist()],
+            "prob": [round(c / simulations, 4) for c in counts.tolist()],
+        },
+    }
@@ -0,0 +1,40 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F
+
+
+def backfill_hole_par(hole_result_model, hole_model, batch_size: int = 2000, log=None) -> int:
+    """
+    Stamp `par` and `to_par` on hole results written before the engine
+    stored them. Walks the NULL rows in primary-key batches; each batch is
+    one short transaction of a few UPDATEs (one per distinct par), so it
+    can run against a live database. Migration 0023 carries a frozen copy
+    of this walk.
+
+    Returns the number of rows updated.
+    """
+    pars = {
+        (course_id, number): par
+        for course_id, number, par in hole_model.objects.values_list("course_id", "number", "par")
+    }
+    pending = hole_result_model.objects.filter(par__isnull=True).order_by("pk")
+
+    updated = last_pk = 0
+    while True:
+        batch = list(
+            pending.filter(pk__gt=last_pk).values_list("pk", "entry__tournament__course_id", "hole_number")[:batch_size]
+        )
+        if not batch:
+            return updated
+
+        by_par = defaultdict(list)
+        for pk, course_id, hole_number in batch:
+            by_par[pars.get((course_id, hole_number), 4)].append(pk)
+        with transaction.atomic():
+            for par, pks in by_par.items():
+                updated += hole_result_model.objects.filter(pk__in=pks).update(par=par, to_par=F("strokes") - par)
+
+        last_pk = batch[-1][0]
+        if log:
+            log(f"{updated} hole results stamped (through id {last_pk})")
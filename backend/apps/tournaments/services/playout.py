@@ -0,0 +1,123 @@
+"""
+Vectorized play-out of the remaining holes with the real scoring kernel.
+
+Pure numpy on purpose: this module runs inside process-pool workers, so it
+must not import Django models. The Django side (probability.py) builds the
+per-player hole profiles from `scoring.hole_scoring_profile` and ships them
+here as plain arrays.
+"""
+import time
+
+import numpy as np
+
+# Draws per deadline check in `play_out_until`
+BATCH_SIZE = 50
+
+
+def rank_bounds(scores: np.ndarray):
+    """
+    For an integer score matrix (draws x players) return, per cell, how many
+    players finished strictly ahead (`lo`) and how many finished ahead or
+    level (`hi`). A player's shared position is `lo + 1`; `hi - lo` is the
+    number of players tied on that score.
+    """
+    draws, n = scores.shape
+    base = scores.min()
+    span = int(scores.max() - base) + 1
+
+    # Offset every draw into its own disjoint band so one flat searchsorted
+    # ranks all draws at once.
+    keyed = (scores - base) + (np.arange(draws, dtype=np.int64) * span)[:, None]
+    flat_sorted = np.sort(keyed, axis=1).ravel()
+    row_start = (np.arange(draws, dtype=np.int64) * n)[:, None]
+
+    lo = np.searchsorted(flat_sorted, keyed.ravel(), side="left").reshape(draws, n) - row_start
+    hi = np.searchsorted(flat_sorted, keyed.ravel(), side="right").reshape(draws, n) - row_start
+    return lo, hi
+
+
+def play_out(inputs: dict, simulations: int, seed) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Play every player's remaining holes `simulations` times.
+
+    `inputs` (N players, K = most holes anyone has left, padded):
+        to_par      (N,)   score to par so far
+        expected    (N, K) state-free expected strokes (hole_scoring_profile)
+        sigma       (N, K) state-free stroke spread
+        par         (N, K)
+        active      (N, K) False on padding
+        new_round   (N, K) first hole of a round: fresh form, momentum reset
+        pressure    (N, K) round 4 back nine (Sunday pressure applies if top 5)
+        cut_step    (N,)   holes left until 36 are complete (0 = already there)
+        form, momentum, form_sigma, clutch, streak, decay  (N,)
+
+    Returns (at_cut, final): whole-stroke scores to par, each (simulations, N).
+    """
+    rng = np.random.default_rng(seed)
+    n, k_max = inputs["expected"].shape
+
+    total = np.broadcast_to(inputs["to_par"].astype(np.int64), (simulations, n)).copy()
+    at_cut = total.copy()
+    form = np.broadcast_to(inputs["form"], (simulations, n)).copy()
+    momentum = np.broadcast_to(inputs["momentum"], (simulations, n)).copy()
+
+    clutch = inputs["clutch"]
+    streak = inputs["streak"]
+    decay = inputs["decay"]
+    cut_step = inputs["cut_step"]
+
+    for k in range(k_max):
+        active = inputs["active"][:, k]
+        if not active.any():
+            break
+
+        fresh = inputs["new_round"][:, k]
+        if fresh.any():
+            draw = rng.standard_normal((simulations, n)) * inputs["form_sigma"]
+            form = np.where(fresh, draw, form)
+            momentum = np.where(fresh, 0.0, momentum)
+
+        pressure = np.zeros((simulations, n))
+        sunday = inputs["pressure"][:, k]
+        if sunday.any():
+            # Position is the running leaderboard inside each draw
+            lo, _ = rank_bounds(total)
+            position = lo + 1
+            intensity = np.where(position <= 3, 1.0, 0.5)
+            pressure = np.where(sunday & (position <= 5), (0.75 - clutch) * 0.6 * intensity, 0.0)
+
+        par = inputs["par"][:, k]
+        mean = inputs["expected"][:, k] + form + momentum + pressure
+        spread = inputs["sigma"][:, k] + np.where(pressure > 0.05, 0.20, 0.0)
+
+        strokes = np.rint(mean + spread * rng.standard_normal((simulations, n)))
+        strokes = np.clip(strokes, par - 2, par + 4)
+
+        delta = par - strokes  # birdie=+1, bogey=-1
+        momentum = np.where(active, np.clip(momentum * decay + streak * delta, -0.75, 0.75), momentum)
+        total += np.where(active, -delta, 0).astype(np.int64)
+
+        at_cut = np.where(cut_step == k + 1, total, at_cut)
+
+    return at_cut, total
+
+
+def play_out_until(inputs: dict, simulations: int, seed, deadline: float, batch_size: int = BATCH_SIZE):
+    """
+    `play_out` in batches of `batch_size` draws, stopping at the first batch
+    boundary past `deadline` (a `time.time()` timestamp, which is shared
+    across the pool's processes). Returns whatever was played, possibly
+    zero draws, so a worker never runs more than one batch over budget.
+    """
+    parts = []
+    played = 0
+    while played < simulations and time.time() < deadline:
+        size = min(batch_size, simulations - played)
+        parts.append(play_out(inputs, size, seed.spawn(1)[0]))
+        played += size
+
+    if not parts:
+        n = len(inputs["to_par"])
+        empty = np.empty((0, n), dtype=np.int64)
+        return empty, empty
+    return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
@@ -0,0 +1,103 @@
+import sys
+import zlib
+from array import array
+
+from apps.tournaments.models import Tournament, WinProbSnapshot
+
+SCALE = 65535  # uint16 quantization: ~0.0015% resolution
+
+
+def entry_order(tournament: Tournament) -> list[int]:
+    """
+    Stable entry ordering for packed snapshots. Entries are fixed once a
+    tournament is created, so id order never shifts between snapshots.
+    """
+    return list(tournament.entries.order_by("id").values_list("id", flat=True))
+
+
+def pack_probs(values) -> bytes:
+    packed = array("H", (min(SCALE, max(0, round(v * SCALE))) for v in values))
+    if sys.byteorder == "big":
+        packed.byteswap()  # store little-endian
+    return zlib.compress(packed.tobytes())
+
+
+def unpack_probs(blob: bytes) -> list[float]:
+    packed = array("H")
+    packed.frombytes(zlib.decompress(bytes(blob)))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return [v / SCALE for v in packed]
+
+
+def record_snapshot(tournament: Tournament, distribution: dict, order: list[int] | None = None):
+    """
+    Append the current P(win) column to the history, keyed by tournament
+    clock. Several updates at the same clock (e.g. human score entry
+    without the clock moving) keep only the latest.
+    """
+    order = order if order is not None else entry_order(tournament)
+    win = dict(zip(distribution.get("ids", []), distribution.get("win", [])))
+    WinProbSnapshot.objects.update_or_create(
+        tournament=tournament,
+        clock=tournament.current_time,
+        defaults={
+            "round_number": tournament.current_round,
+            "probs": pack_probs(win.get(str(entry_id), 0.0) for entry_id in order),
+        },
+    )
+
+
+def probability_history(
+    tournament: Tournament,
+    start=None,
+    end=None,
+    points: int = 200,
+    entry_ids: list[int] | None = None,
+) -> dict:
+    """
+    Downsampled series for charting.
+
+    Picks at most `points` evenly spaced snapshots in [start, end] (always
+    keeping the first and last) and only unpacks those. Without `entry_ids`
+    the series covers the 10 entries with the highest latest P(win).
+
+    Returns {"clock": [...], "round": [...], "entry_ids": [...], "series": {entry_id: [...]}}
+    """
+    qs = WinProbSnapshot.objects.filter(tournament=tournament)
+    if start:
+        qs = qs.filter(clock__gte=start)
+    if end:
+        qs = qs.filter(clock__lte=end)
+
+    index = list(qs.order_by("clock").values_list("id", flat=True))
+    if len(index) > points > 1:
+        step = (len(index) - 1) / (points - 1)
+        index = [index[round(i * step)] for i in range(points)]
+
+    snapshots = list(
+        WinProbSnapshot.objects.filter(id__in=index)
+        .order_by("clock")
+        .values_list("clock", "round_number", "probs")
+    )
+
+    order = entry_order(tournament)
+    columns = [unpack_probs(blob) for _, _, blob in snapshots]
+
+    if entry_ids is None:
+        latest = columns[-1] if columns else []
+        ranked = sorted(range(len(latest)), key=lambda i: -latest[i])[:10]
+        entry_ids = [order[i] for i in ranked if i < len(order)]
+
+    positions = {entry_id: i for i, entry_id in enumerate(order)}
+    wanted = [e for e in entry_ids if e in positions]
+
+    return {
+        "clock": [clock for clock, _, _ in snapshots],
+        "round": [rnd for _, rnd, _ in snapshots],
+        "entry_ids": wanted,
+        "series": {
+            str(e): [round(col[positions[e]], 4) if positions[e] < len(col) else 0.0 for col in columns]
+            for e in wanted
+        },
+    }
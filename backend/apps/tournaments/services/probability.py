@@ -1,127 +1,464 @@
-import random
-import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict
-from django.db.models import Sum, Q
-from apps.tournaments.models import Tournament, TournamentEntry
-from apps.courses.models import Hole
 
-def calculate_win_probabilities(tournament: Tournament) -> Dict[str, float]:
+import numpy as np
+from django.conf import settings
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+
+from apps.tournaments.models import Tournament, TournamentEntry, GroupMember, HoleResult
+from apps.tournaments.services.playout import BATCH_SIZE, play_out_until, rank_bounds
+from apps.tournaments.services.routing import hole_sequence
+from apps.tournaments.services.scoring import form_sigma, hole_scoring_profile
+
+SIMULATIONS = 2000  # Increased for better resolution
+PER_HOLE_SIGMA = 0.45
+TOP_N_MARKETS = (5, 10)
+HUMAN_OVERALL = 92
+PLAYOUT_GRACE = 0.25  # seconds past the budget before a busy pool is dropped
+
+
+def skill_adjustment(overall: float) -> float:
     """
-    Monte Carlo simulation to estimate win probability for each player.
-    Returns dict: {entry_id: probability (0.0 - 1.0)}
+    Expected strokes to par per hole for a rating (negative = under par).
     """
-    # 1. Gather meaningful entries (those who haven't missed cut / withdrawn)
-    # If cut is applied, filter out cut players
-    entries = tournament.entries.all()
+    return 0.10 - 0.005 * (overall - 50)
+
+
+def _field_inputs(tournament: Tournament) -> list:
+    """
+    Per-entry scoring state used by every market:
+    score to par so far, holes left (split at the 36-hole cut line) and
+    the expected strokes-to-par per remaining hole.
+
+    One aggregate query over the active entries' EntryRound rows (at most
+    four per entry), so the cost does not grow with holes played.
+    """
+    # Gather meaningful entries (those who haven't missed cut / withdrawn)
+    entries = TournamentEntry.objects.filter(tournament=tournament)
     if tournament.cut_applied:
         entries = entries.filter(cut=False)
-    
-    # Pre-fetch needed data to avoid N+1 queries during loop setup
-    # Update: Use actual hole_results to calculate score_to_par instead of fuzzy math
-    
-    course = tournament.course
-    holes = list(course.holes.order_by('number'))
-    par_map = {h.number: h.par for h in holes}
-    
-    # Get all hole results for active players (who made cut)
-    # This is efficient because 'entries' are already filtered for cut=False
-    entry_ids = [e.id for e in entries]
-    
-    # We can fetch all results in one go, but grouping them by entry_id in Python is easier
-    # Or, we can iterate entries and use the prefetched `hole_results` (Django prefetch_related)
-    # The ViewSet usually prefetches `hole_results`.
-    
-    active_players = []
-    current_round = tournament.current_round
+
+    rows = (
+        entries.order_by("id")
+        .values("id", "is_human", "golfer_id", "golfer__overall")
+        .annotate(
+            to_par=Coalesce(Sum("rounds__to_par"), 0),
+            holes_played=Coalesce(Sum("rounds__holes_played"), 0),
+        )
+    )
+
     total_holes = 4 * 18
-    
-    for e in entries:
-        # 1. Calculate Score To Par EXACTLY
-        # Use prefetched results if available, else query (should be prefetched)
-        results = e.hole_results.all()
-        
-        strokes = 0
-        par = 0
-        completed_holes_count = 0
-        
-        for hr in results:
-            strokes += hr.strokes
-            par += par_map.get(hr.hole_number, 4)
-            completed_holes_count += 1
-            
-        score_to_par = strokes - par
-        
-        # 2. Check Remaining Holes
-        # If simulation is imperfect, `completed_holes_count` is the truth.
-        remaining = total_holes - completed_holes_count
-        if remaining < 0: remaining = 0
-        
-        # 3. Skill Rating
+    players = []
+
+    for row in rows:
+        # If simulation is imperfect, `holes_played` is the truth.
+        remaining = max(0, total_holes - row["holes_played"])
+        remaining_to_cut = max(0, 36 - row["holes_played"])
+
+        # Skill Rating
         overall = 75
-        if e.is_human:
-            overall = 92
-        elif e.golfer:
-            overall = e.golfer.overall
-            
-        skill_adj = 0.10 - 0.005 * (overall - 50)
-        
-        # 4. Expected Final Score
-        exp_final = score_to_par + (remaining * skill_adj)
-        
-        sigma = 0.45 * math.sqrt(remaining) if remaining > 0 else 0.001
-        
-        active_players.append({
-            "id": str(e.id),
-            "exp": exp_final,
-            "sigma": sigma,
-            "wins": 0
+        if row["is_human"]:
+            overall = HUMAN_OVERALL
+        elif row["golfer_id"]:
+            overall = row["golfer__overall"]
+
+        players.append({
+            "id": str(row["id"]),
+            "is_human": row["is_human"],
+            "to_par": row["to_par"],
+            "remaining": remaining,
+            "remaining_to_cut": remaining_to_cut,
+            "skill_adj": skill_adjustment(overall),
         })
-        
-    if not active_players:
+
+    return players
+
+
+def _top_n_share(lo: np.ndarray, hi: np.ndarray, top_n: int) -> np.ndarray:
+    """
+    Dead-heat share of a top-N finish: players tied across the cutoff split
+    the places that fall inside it (a two-way tie for the win pays 1/2 each).
+    """
+    inside = np.clip(np.minimum(hi, top_n) - lo, 0, None)
+    return inside / (hi - lo)
+
+
+def _model_inputs(tournament: Tournament):
+    """
+    Arrays for `playout.play_out`: every remaining regulation hole for every
+    active entry, profiled with the live scoring kernel (course, weather,
+    current form and momentum from `sim_state`).
+    """
+    entries = tournament.entries.select_related("golfer")
+    if tournament.cut_applied:
+        entries = entries.filter(cut=False)
+    entries = list(entries.order_by("id"))
+    if not entries:
+        return [], None
+
+    course_holes = {h.number: h for h in tournament.course.holes.select_related("course")}
+    par_map = {num: h.par for num, h in course_holes.items()}
+    conditions = tournament.round_conditions or {}
+    current_round = tournament.current_round
+
+    played = {}  # entry_id -> {(round, hole): to_par}
+    for entry_id, rnd, hole_num, to_par in HoleResult.objects.filter(entry__in=entries).values_list(
+        "entry_id", "round_number", "hole_number", "to_par"
+    ):
+        played.setdefault(entry_id, {})[(rnd, hole_num)] = to_par or 0  # no recorded par: level
+
+    start_holes = dict(
+        GroupMember.objects.filter(group__tournament=tournament).values_list("entry_id", "group__start_hole")
+    )
+
+    human_skill = skill_adjustment(HUMAN_OVERALL)
+    bots = [e for e in entries if e.golfer]
+    field_form_sigma = sum(form_sigma(e.golfer) for e in bots) / len(bots) if bots else 0.0
+    players, rows, profiles = [], [], {}
+
+    for e in entries:
+        results = played.get(e.id, {})
+        to_par = sum(results.values())
+
+        # Remaining regulation holes, in playing order
+        steps = []
+        for rnd in range(current_round, 5):
+            order = hole_sequence(start_holes.get(e.id, 1)) if rnd == current_round else list(range(1, 19))
+            steps.extend((rnd, h) for h in order if (rnd, h) not in results and h in course_holes)
+
+        # Form and momentum carry over only within a round already under way
+        state = (e.sim_state or {}).get(str(current_round))
+        previous = [(current_round if state else None, None)] + steps[:-1]
+        row = {
+            "to_par": to_par,
+            "steps": steps,
+            "cut_step": sum(1 for rnd, _ in steps if rnd <= 2) if current_round <= 2 else 0,
+            "new_round": [rnd != prev_rnd for (rnd, _), (prev_rnd, _) in zip(steps, previous)],
+            "form": float(state.get("form", 0.0)) if state else 0.0,
+            "momentum": float(state.get("momentum", 0.0)) if state else 0.0,
+        }
+
+        if e.golfer:
+            for rnd, h in steps:
+                key = (e.golfer_id, rnd, h)
+                if key not in profiles:
+                    profiles[key] = hole_scoring_profile(e.golfer, course_holes[h], conditions.get(str(rnd)))
+            sample = profiles[(e.golfer_id, *steps[0])] if steps else {}
+            row.update({
+                "expected": [profiles[(e.golfer_id, rnd, h)]["expected"] for rnd, h in steps],
+                "sigma": [profiles[(e.golfer_id, rnd, h)]["sigma"] for rnd, h in steps],
+                "form_sigma": form_sigma(e.golfer),
+                "clutch": sample.get("clutch", 0.75),
+                "streak": sample.get("streak", 0.0),
+                "decay": sample.get("decay", 0.0),
+            })
+        else:
+            # Humans enter their own scores; filled in from the field below
+            row.update({
+                "form_sigma": field_form_sigma,
+                "clutch": 0.75,  # no pressure term
+                "streak": 0.0,
+                "decay": 0.0,
+            })
+
+        players.append({"id": str(e.id), "is_human": e.is_human})
+        rows.append(row)
+
+    # A human plays the field-average hole, shifted by the same rating edge
+    # the fast model gives them (overall 92 vs the bots in this field).
+    field_skill = (
+        sum(skill_adjustment(e.golfer.overall) for e in bots) / len(bots) if bots else human_skill
+    )
+    field_hole = {}
+    for (_, rnd, h), profile in profiles.items():
+        field_hole.setdefault((rnd, h), []).append(profile)
+
+    for row in rows:
+        if "expected" in row:
+            continue
+        expected, sigma = [], []
+        for rnd, h in row["steps"]:
+            hole_profiles = field_hole.get((rnd, h))
+            if hole_profiles:
+                expected.append(sum(p["expected"] for p in hole_profiles) / len(hole_profiles) + human_skill - field_skill)
+                sigma.append(sum(p["sigma"] for p in hole_profiles) / len(hole_profiles))
+            else:
+                expected.append(par_map[h] + human_skill)
+                sigma.append(PER_HOLE_SIGMA)
+        row["expected"], row["sigma"] = expected, sigma
+
+    n = len(rows)
+    k_max = max((len(r["steps"]) for r in rows), default=0)
+    inputs = {
+        "to_par": np.array([r["to_par"] for r in rows], dtype=np.int64),
+        "expected": np.zeros((n, k_max)),
+        "sigma": np.zeros((n, k_max)),
+        "par": np.zeros((n, k_max)),
+        "active": np.zeros((n, k_max), dtype=bool),
+        "new_round": np.zeros((n, k_max), dtype=bool),
+        "pressure": np.zeros((n, k_max), dtype=bool),
+        "cut_step": np.array([r["cut_step"] for r in rows], dtype=np.int64),
+    }
+    for key in ("form", "momentum", "form_sigma", "clutch", "streak", "decay"):
+        inputs[key] = np.array([r[key] for r in rows], dtype=float)
+
+    for i, r in enumerate(rows):
+        k = len(r["steps"])
+        inputs["expected"][i, :k] = r["expected"]
+        inputs["sigma"][i, :k] = r["sigma"]
+        inputs["par"][i, :k] = [par_map[h] for _, h in r["steps"]]
+        inputs["active"][i, :k] = True
+        inputs["new_round"][i, :k] = r["new_round"]
+        inputs["pressure"][i, :k] = [rnd == 4 and h >= 10 for rnd, h in r["steps"]]
+
+    return players, inputs
+
+
+_POOL = None
+
+
+def _playout_pool() -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=getattr(settings, "WIN_PROB_WORKERS", None))
+    return _POOL
+
+
+def _model_draws(inputs: dict, simulations: int, time_budget: float):
+    """
+    Spread the play-out across the process pool, one chunk per worker, and
+    keep whatever is played inside the time budget. Workers check the
+    deadline between small batches (`playout.play_out_until`), so they stop
+    on their own; a pool still busy after PLAYOUT_GRACE is dropped rather
+    than left to delay the next call. Returns None if nothing was played.
+    """
+    global _POOL
+    workers = getattr(settings, "WIN_PROB_WORKERS", None) or os.cpu_count() or 1
+    chunks = max(1, min(workers, simulations // BATCH_SIZE))
+    sizes = [simulations // chunks + (1 if i < simulations % chunks else 0) for i in range(chunks)]
+    seeds = np.random.SeedSequence().spawn(chunks)
+    deadline = time.time() + time_budget
+
+    try:
+        pool = _playout_pool()
+        futures = [pool.submit(play_out_until, inputs, size, seed, deadline) for size, seed in zip(sizes, seeds)]
+    except BrokenProcessPool:
+        _POOL = None
+        return None
+
+    done, pending = wait(futures, timeout=max(0.0, deadline - time.time()) + PLAYOUT_GRACE)
+    if pending:
+        # Still starting up or stuck in a batch: don't queue the next call behind it
+        pool.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+    parts = [f.result() for f in done if f.exception() is None]
+    parts = [p for p in parts if len(p[1])]
+    if not parts:
+        if any(isinstance(f.exception(), BrokenProcessPool) for f in done):
+            _POOL = None
+        return None
+    return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
+
+
+def _fast_draws(players: list, simulations: int):
+    """
+    Normal approximation: each player finishes N(score_to_par + remaining * skill_adj,
+    0.45 * sqrt(remaining)), split at the 36-hole line.
+    """
+    to_par = np.array([p["to_par"] for p in players], dtype=float)
+    skill = np.array([p["skill_adj"] for p in players], dtype=float)
+    remaining = np.array([p["remaining"] for p in players], dtype=float)
+    to_cut = np.array([p["remaining_to_cut"] for p in players], dtype=float)
+    after_cut = remaining - to_cut
+
+    # Split each player's remaining holes at the 36-hole line so the cut and
+    # the final leaderboard come from the same path. The two independent
+    # halves add up to the usual 0.45 * sqrt(remaining) spread.
+    rng = np.random.default_rng()
+    n = len(players)
+    at_cut = to_par + to_cut * skill + PER_HOLE_SIGMA * np.sqrt(to_cut) * rng.standard_normal((simulations, n))
+    final = at_cut + after_cut * skill + PER_HOLE_SIGMA * np.sqrt(after_cut) * rng.standard_normal((simulations, n))
+    return np.rint(at_cut).astype(np.int64), np.rint(final).astype(np.int64)
+
+
+def _markets(tournament: Tournament, players: list, at_cut: np.ndarray, final: np.ndarray) -> dict:
+    """
+    Settle every market from one set of whole-stroke draws (draws x players).
+    """
+    n = len(players)
+    cut_size = tournament.cut_size or 65
+    cut_pending = (
+        tournament.format == "stroke"
+        and not tournament.cut_applied
+        and tournament.current_round <= 2
+        and n > cut_size
+    )
+
+    if cut_pending:
+        # Top 65 + ties, and humans are never cut
+        cut_lo, _ = rank_bounds(at_cut)
+        is_human = np.array([p["is_human"] for p in players])
+        made = (cut_lo < cut_size) | is_human
+        # Missed-cut players cannot finish ahead of anyone who played all four rounds
+        final = np.where(made, final, final.max() + 1)
+        make_cut = made.mean(axis=0)
+    else:
+        make_cut = np.ones(n)
+
+    lo, hi = rank_bounds(final)
+
+    markets = {
+        "ids": [p["id"] for p in players],
+        "win": _top_n_share(lo, hi, 1).mean(axis=0),
+    }
+    for top_n in TOP_N_MARKETS:
+        markets[f"top{top_n}"] = _top_n_share(lo, hi, top_n).mean(axis=0)
+    markets["make_cut"] = make_cut
+    markets["exp_finish"] = (lo + 1).mean(axis=0)
+
+    # Compact: 4 decimals is well below Monte Carlo noise
+    for key, values in markets.items():
+        if key != "ids":
+            markets[key] = [round(float(v), 4) for v in values]
+
+    return markets
+
+
+def calculate_finish_distribution(
+    tournament: Tournament,
+    simulations: int = SIMULATIONS,
+    mode: str | None = None,
+) -> dict:
+    """
+    Monte Carlo finish-position distribution for every active entry.
+
+    One batch of draws produces every market: P(win), P(top 5), P(top 10),
+    P(make cut) and expected finish. Final scores are whole strokes so ties
+    are real; shared positions are settled with dead-heat shares.
+
+    mode="fast" (default) uses the normal approximation. mode="model" plays
+    out every remaining hole with the scoring kernel on a process pool within
+    `WIN_PROB_TIME_BUDGET` seconds, falling back to "fast" if nothing finishes.
+
+    Returns a column-oriented dict:
+        {"ids": [...], "win": [...], "top5": [...], "top10": [...],
+         "make_cut": [...], "exp_finish": [...]}
+    """
+    mode = mode or getattr(settings, "WIN_PROB_MODE", "fast")
+
+    if mode == "model":
+        players, inputs = _model_inputs(tournament)
+        if not players:
+            return {}
+        draws = _model_draws(inputs, simulations, getattr(settings, "WIN_PROB_TIME_BUDGET", 2.0))
+        if draws is not None:
+            return _markets(tournament, players, *draws)
+
+    players = _field_inputs(tournament)
+    if not players:
         return {}
+    return _markets(tournament, players, *_fast_draws(players, simulations))
 
-    # 2. Run Simulations
-    SIMULATIONS = 2000 # Increased for better resolution
-    
-    # Sort by expected score
-    active_players.sort(key=lambda x: x["exp"])
-    
-    # Widen the contender window slightly to capture "tied for lead" outliers
-    leader_exp = active_players[0]["exp"]
-    contenders = [p for p in active_players if p["exp"] < leader_exp + 15] # Widened from 12 to 15
-    
-    if not contenders:
-        contenders = active_players[:5] # Fallback
-        
-    # Run
-    for _ in range(SIMULATIONS):
-        winner_score = 9999
-        winners = []
-        
-        # Draw for each contender
-        for p in contenders:
-            score = random.gauss(p["exp"], p["sigma"])
-            
-            if score < winner_score:
-                winner_score = score
-                winners = [p]
-            elif abs(score - winner_score) < 0.01: # Tie
-                winners.append(p)
-        
-        # Assign wins
-        # If tie, split the win? Or just giving to all?
-        # Simple: 1 / len(winners)
-        win_share = 1.0 / len(winners)
-        for w in winners:
-            w["wins"] += win_share
-
-    # 3. Format results
+
+def win_probabilities_from_distribution(distribution: dict) -> Dict[str, float]:
+    """
+    Collapse a finish distribution into the legacy {entry_id: P(win)} shape.
+    """
     results = {}
-    for p in contenders:
-        prob = (p["wins"] / SIMULATIONS)
-        if prob > 0.001: # Cutoff 0.1%
-            results[p["id"]] = prob
-            
-    # Normalize if slightly off? No need.
-    
+    for entry_id, prob in zip(distribution.get("ids", []), distribution.get("win", [])):
+        if prob > 0.001:  # Cutoff 0.1%
+            results[entry_id] = prob
     return results
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    """
+    Standard normal CDF, vectorized (Abramowitz & Stegun 7.1.26, |error| < 1.5e-7).
+    """
+    z = np.abs(x) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-z * z)
+    return 0.5 * (1.0 + np.sign(x) * erf)
+
+
+def _matchups_from_draws(final: np.ndarray) -> np.ndarray:
+    """
+    P(row beats col) from simulated whole-stroke finals (draws x players),
+    one row at a time so memory stays at draws x players.
+    """
+    n = final.shape[1]
+    matrix = np.empty((n, n))
+    for a in range(n):
+        matrix[a] = (final[:, a, None] < final).mean(axis=0)
+    np.fill_diagonal(matrix, 0.0)
+    return matrix
+
+
+def calculate_head_to_head(
+    tournament: Tournament,
+    simulations: int = SIMULATIONS,
+    mode: str | None = None,
+) -> dict:
+    """
+    Matchup probabilities for every pair in the active field.
+
+    mode="fast" (default) is closed form, from the same per-player final
+    score distributions as the fast finish simulation:
+    N(score_to_par + remaining * skill_adj, 0.45 * sqrt(remaining)). Final
+    scores are whole strokes, so P(A beats B) = P(B - A >= 1) with a
+    continuity correction. mode="model" counts wins over the kernel
+    play-out draws instead (same pool and time budget as the finish
+    distribution), falling back to the closed form if nothing finishes.
+    Either way the cut is ignored (both players play 72 holes) and
+    P(tie) is 1 - matrix[a][b] - matrix[b][a].
+
+    Returns: {"ids": [...], "matrix": [[P(row beats col), ...], ...]}
+    """
+    mode = mode or getattr(settings, "WIN_PROB_MODE", "fast")
+
+    if mode == "model":
+        players, inputs = _model_inputs(tournament)
+        if not players:
+            return {"ids": [], "matrix": []}
+        draws = _model_draws(inputs, simulations, getattr(settings, "WIN_PROB_TIME_BUDGET", 2.0))
+        if draws is not None:
+            return {
+                "ids": [p["id"] for p in players],
+                "matrix": np.round(_matchups_from_draws(draws[1]), 3).tolist(),
+            }
+
+    players = _field_inputs(tournament)
+    if not players:
+        return {"ids": [], "matrix": []}
+
+    to_par = np.array([p["to_par"] for p in players], dtype=float)
+    skill = np.array([p["skill_adj"] for p in players], dtype=float)
+    remaining = np.array([p["remaining"] for p in players], dtype=float)
+
+    mean = to_par + remaining * skill
+    var = (PER_HOLE_SIGMA ** 2) * remaining
+
+    # margin[a, b] = B's final minus A's final (positive => A is ahead)
+    margin = mean[None, :] - mean[:, None]
+    sd = np.sqrt(var[:, None] + var[None, :] + 1e-9)
+    matrix = _norm_cdf((margin - 0.5) / sd)
+    np.fill_diagonal(matrix, 0.0)
+
+    return {
+        "ids": [p["id"] for p in players],
+        "matrix": np.round(matrix, 3).tolist(),
+    }
+
+
+def calculate_win_probabilities(tournament: Tournament) -> Dict[str, float]:
+    """
+    Monte Carlo simulation to estimate win probability for each player.
+    Returns dict: {entry_id: probability (0.0 - 1.0)}
+    """
+    return win_probabilities_from_distribution(calculate_finish_distribution(tournament))
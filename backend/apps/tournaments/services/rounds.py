@@ -0,0 +1,44 @@
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import Coalesce
+
+from apps.tournaments.models import EntryRound, HoleResult, TournamentEntry
+
+
+def refresh_entry_round(entry: TournamentEntry, round_number: int) -> list[EntryRound]:
+    """
+    Recompute entry's EntryRound for `round_number` from its hole results
+    (at most 18 rows, read through the (entry, round, hole) unique index)
+    and return all of the entry's rounds, refreshed, in round order.
+
+    Call it after writing hole results; it runs in the caller's
+    transaction (or its own). The entry row is locked before anything is
+    read, so concurrent writers for the same entry serialize even when the
+    round row does not exist yet (two first holes would otherwise both try
+    to insert it).
+    """
+    with transaction.atomic():
+        TournamentEntry.objects.select_for_update().only("id").get(pk=entry.pk)
+        totals = HoleResult.objects.filter(entry=entry, round_number=round_number).aggregate(
+            total=Coalesce(Sum("strokes"), 0),
+            # A hole with no recorded par counts as level, as everywhere else
+            par_played=Coalesce(Sum(Coalesce("par", "strokes")), 0),
+            holes=Count("id"),
+        )
+        rounds = {r.round_number: r for r in EntryRound.objects.filter(entry=entry)}
+
+        row = rounds.get(round_number)
+        if totals["holes"] == 0:
+            if row is not None:
+                row.delete()
+                del rounds[round_number]
+        else:
+            if row is None:
+                row = rounds[round_number] = EntryRound(entry=entry, round_number=round_number)
+            row.strokes = totals["total"]
+            row.par_played = totals["par_played"]
+            row.holes_played = totals["holes"]
+            row.to_par = totals["total"] - totals["par_played"]
+            row.save()
+
+    return [rounds[r] for r in sorted(rounds)]
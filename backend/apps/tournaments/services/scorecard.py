@@ -0,0 +1,39 @@
+from apps.tournaments.models import HoleResult, TournamentEntry
+
+
+def build_scorecard(entry: TournamentEntry) -> dict:
+    """
+    One entry's hole-by-hole card, grouped by round, with the per-hole
+    stats and commentary the tournament payload can leave out (`?holes=`).
+
+    One query: par and to-par are stored on the hole results (a hole with
+    no recorded par counts as level).
+    """
+    rounds = {}
+    for r in entry.hole_results.order_by("round_number", "hole_number").values(
+        "round_number", "hole_number", "strokes", "par", "to_par", *HoleResult.STAT_FIELDS
+    ):
+        card = rounds.setdefault(
+            r["round_number"], {"round_number": r["round_number"], "strokes": 0, "to_par": 0, "holes": []}
+        )
+        card["strokes"] += r["strokes"]
+        card["to_par"] += r["to_par"] or 0
+        card["holes"].append(
+            {
+                "hole_number": r["hole_number"],
+                "par": r["par"],
+                "strokes": r["strokes"],
+                "to_par": r["to_par"],
+                "stats": HoleResult.stats_from(r),
+            }
+        )
+
+    return {
+        "id": entry.id,
+        "tournament": entry.tournament_id,
+        "display_name": entry.display_name,
+        "position": entry.position,
+        "cut": entry.cut,
+        "to_par": sum(card["to_par"] for card in rounds.values()),
+        "rounds": list(rounds.values()),
+    }
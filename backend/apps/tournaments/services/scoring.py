@@ -61,6 +61,18 @@ def _clamp(v: float, lo: float, hi: float) -> float:
     return lo if v < lo else hi if v > hi else v
 
 
+def form_sigma(golfer) -> float:
+    """
+    Spread of a golfer's day-to-day form, in strokes per hole.
+    """
+    vol = float(getattr(golfer, "volatility", 1.0) or 1.0) if golfer else 1.0
+    consistency = float(getattr(golfer, "consistency", 50) or 50) if golfer else 50
+
+    # Less consistent players have bigger day-to-day form swings
+    sigma = 0.18 + (1.0 - (consistency / 100.0)) * 0.22  # ~0.18..0.40
+    return sigma * _clamp(vol, 0.6, 2.0)
+
+
 def _get_round_state(entry, round_number: int):
     """
     Per-round sim state:
@@ -71,15 +83,7 @@ def _get_round_state(entry, round_number: int):
     rkey = str(round_number)
 
     if rkey not in state:
-        golfer = getattr(entry, "golfer", None)
-        vol = float(getattr(golfer, "volatility", 1.0) or 1.0) if golfer else 1.0
-        consistency = float(getattr(golfer, "consistency", 50) or 50) if golfer else 50
-
-        # Less consistent players have bigger day-to-day form swings
-        form_sigma = 0.18 + (1.0 - (consistency / 100.0)) * 0.22  # ~0.18..0.40
-        form_sigma *= _clamp(vol, 0.6, 2.0)
-
-        form = random.gauss(0.0, form_sigma)  # strokes per hole-ish
+        form = random.gauss(0.0, form_sigma(getattr(entry, "golfer", None)))  # strokes per hole-ish
         state[rkey] = {"form": form, "momentum": 0.0}
 
     return state, rkey, state[rkey]
@@ -205,17 +209,20 @@ def _generate_commentary(par, strokes, stats, golfer_name):
 
 # ---------- core sim ----------
 
-def simulate_strokes_for_entry_with_stats(entry, hole: Hole, round_number: int) -> tuple[int, dict]:
-    """
-    Returns (strokes, stats_dict)
+def _norm_rating(x) -> float:
+    # Normalize skills to 0..1
+    return _clamp(float(x or 0) / 100.0, 0.0, 1.0)
+
+
+def hole_scoring_profile(golfer: Golfer, hole: Hole, round_conditions: dict | None = None) -> dict:
     """
-    golfer: Golfer = entry.golfer
-    if not golfer:
-        # Fallback for human or empty (shouldn't happen for bots)
-        return (hole.par, {})
+    The state-free part of the hole model for one golfer on one hole:
+    everything except day form, momentum and Sunday pressure.
+    Shared by the live sim and the probability playout so odds and play agree.
 
-    # Normalize skills to 0..1
-    def n(x): return _clamp(float(x or 0) / 100.0, 0.0, 1.0)
+    Returns {"expected", "sigma", "clutch", "streak", "decay"}
+    """
+    n = _norm_rating
 
     driving_power = n(golfer.driving_power)
     driving_accuracy = n(golfer.driving_accuracy)
@@ -278,10 +285,7 @@ def simulate_strokes_for_entry_with_stats(entry, hole: Hole, round_number: int)
 
     # 5. Weather Conditions (New)
     weather_penalty = 0.0
-    tournament = entry.tournament
-    # Need to access 'round_conditions' safely
-    conds = getattr(tournament, "round_conditions", {}) or {}
-    r_cond = conds.get(str(round_number)) or {}
+    r_cond = round_conditions or {}
     
     wind_mph = float(r_cond.get("wind_mph", 0))
     rain = r_cond.get("rain", "None")
@@ -322,34 +326,10 @@ def simulate_strokes_for_entry_with_stats(entry, hole: Hole, round_number: int)
     baseline = 0.70
     skill_strokes = (baseline - skill) * 1.15  # positive => worse, negative => better
 
-    # Round state (streakiness)
-    state, rkey, rstate = _get_round_state(entry, round_number)
-    form = float(rstate.get("form", 0.0))
-    momentum = float(rstate.get("momentum", 0.0))
-
     # Risk: slightly lower mean (more birdie tries) but higher variance
     risk_mean = -(risk - 0.5) * 0.06  # -0.03..+0.03
     # Clutch: helps on “save” situations; model it as a tiny counter to difficulty
     clutch_help = -(clutch - 0.5) * (0.04 + 0.04 * messy)
-    
-    # "Sunday Pressure" Mechanic
-    # If Round 4 and Back 9 and In Contention
-    pressure_penalty = 0.0
-    if round_number == 4 and hole.number >= 10:
-        # Check position. If human, never pressure? Or yes? Yes for realism.
-        pos = getattr(entry, "position", 999) or 999
-        if pos <= 5: # Top 5
-             # Pressure is ON.
-             # Players with Low Clutch (<0.7) get penalized.
-             # Players with High Clutch (>0.85) get a boost.
-             
-             # Closer to lead = more intensity
-             intensity = 1.0 if pos <= 3 else 0.5
-             
-             # Calculate penalty
-             # Clutch 0.5 -> (0.75 - 0.5) = 0.25 (Positive = Worse score)
-             # Clutch 0.9 -> (0.75 - 0.9) = -0.15 (Negative = Better score)
-             pressure_penalty = (0.75 - clutch) * 0.6 * intensity
 
     expected = (
         par
@@ -362,17 +342,83 @@ def simulate_strokes_for_entry_with_stats(entry, hole: Hole, round_number: int)
         + putting_penalty
         + weather_penalty
         + skill_strokes
-        + form
-        + momentum
         + risk_mean
         + clutch_help
-        + pressure_penalty
     )
 
     # Variance: higher volatility + lower consistency = wider spread
     base_sigma = 0.38 + (1.0 - consistency) * 0.35  # ~0.38..0.73
     sigma = base_sigma * _clamp(vol, 0.6, 2.0)
     sigma += risk * 0.06  # risk adds a bit of chaos
+
+    return {
+        "expected": expected,
+        "sigma": sigma,
+        "clutch": clutch,
+        # Less consistent golfers “ride” momentum harder (both hot & cold)
+        "streak": 0.10 + (1.0 - consistency) * 0.12,  # ~0.10..0.22
+        "decay": 0.62 + consistency * 0.20,           # ~0.62..0.82 (consistent = steadier, less swing)
+    }
+
+
+def sunday_pressure(clutch: float, round_number: int, hole_number: int, position: int) -> float:
+    """
+    "Sunday Pressure" Mechanic
+    If Round 4 and Back 9 and In Contention
+    """
+    pressure_penalty = 0.0
+    if round_number == 4 and hole_number >= 10:
+        # Check position. If human, never pressure? Or yes? Yes for realism.
+        if position <= 5: # Top 5
+             # Pressure is ON.
+             # Players with Low Clutch (<0.7) get penalized.
+             # Players with High Clutch (>0.85) get a boost.
+             
+             # Closer to lead = more intensity
+             intensity = 1.0 if position <= 3 else 0.5
+             
+             # Calculate penalty
+             # Clutch 0.5 -> (0.75 - 0.5) = 0.25 (Positive = Worse score)
+             # Clutch 0.9 -> (0.75 - 0.9) = -0.15 (Negative = Better score)
+             pressure_penalty = (0.75 - clutch) * 0.6 * intensity
+    return pressure_penalty
+
+
+def simulate_strokes_for_entry_with_stats(entry, hole: Hole, round_number: int) -> tuple[int, dict]:
+    """
+    Returns (strokes, stats_dict)
+    """
+    golfer: Golfer = entry.golfer
+    if not golfer:
+        # Fallback for human or empty (shouldn't happen for bots)
+        return (hole.par, {})
+
+    n = _norm_rating
+
+    driving_power = n(golfer.driving_power)
+    driving_accuracy = n(golfer.driving_accuracy)
+    approach = n(golfer.approach)
+    short_game = n(golfer.short_game)
+    course_mgmt = n(golfer.course_management)
+    risk = n(golfer.risk_tolerance)
+
+    # Need to access 'round_conditions' safely
+    conds = getattr(entry.tournament, "round_conditions", {}) or {}
+    profile = hole_scoring_profile(golfer, hole, conds.get(str(round_number)))
+
+    par = int(hole.par)
+
+    # Round state (streakiness)
+    state, rkey, rstate = _get_round_state(entry, round_number)
+    form = float(rstate.get("form", 0.0))
+    momentum = float(rstate.get("momentum", 0.0))
+
+    pressure_penalty = sunday_pressure(
+        profile["clutch"], round_number, hole.number, getattr(entry, "position", 999) or 999
+    )
+
+    expected = profile["expected"] + form + momentum + pressure_penalty
+    sigma = profile["sigma"]
     
     # High pressure adds variance for everyone except the ice-cold clutchness
     if pressure_penalty > 0.05:
@@ -384,12 +430,8 @@ def simulate_strokes_for_entry_with_stats(entry, hole: Hole, round_number: int)
     strokes = max(par - 2, min(par + 4, strokes))
 
     # Update momentum (streakiness within the round)
-    # Less consistent golfers “ride” momentum harder (both hot & cold)
     delta = par - strokes  # birdie=+1, bogey=-1
-    streak_factor = 0.10 + (1.0 - consistency) * 0.12  # ~0.10..0.22
-    decay = 0.62 + consistency * 0.20                 # ~0.62..0.82 (consistent = steadier, less swing)
-
-    momentum = (momentum * decay) + (streak_factor * delta)
+    momentum = (momentum * profile["decay"]) + (profile["streak"] * delta)
     momentum = _clamp(momentum, -0.75, 0.75)
 
     rstate["momentum"] = float(momentum)
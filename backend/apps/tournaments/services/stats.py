@@ -0,0 +1,75 @@
+from django.db.models import Avg, Count, F, FloatField, Q
+from django.db.models.functions import Cast, NullIf
+
+from apps.tournaments.models import Tournament, HoleResult
+
+# ?sort= key -> (aggregate, whether higher is better). Aggregates are not
+# named after their columns, which would shadow them in the FILTER clauses.
+STAT_SORTS = {
+    "gir": ("gir_pct", True),
+    "fir": ("fir_pct", True),
+    "drive_distance": ("avg_drive", True),
+    "putts": ("putts_per_round", False),
+}
+
+
+def _stat_aggregates() -> dict:
+    """
+    SQL aggregates over engine-recorded hole results. Percentages are
+    computed in the database; FIR and driving distance only count driving
+    holes (fir is NULL on par 3s).
+    """
+    def pct(field):
+        hits = Cast(Count("id", filter=Q(**{field: True})), FloatField())
+        return 100.0 * hits / NullIf(Count("id", filter=Q(**{f"{field}__isnull": False})), 0)
+
+    return {
+        "holes": Count("id"),
+        "fir_pct": pct("fir"),
+        "gir_pct": pct("gir"),
+        "putts_per_round": 18.0 * Avg(Cast("putts", FloatField())),
+        "avg_drive": Avg(Cast("drive_distance", FloatField()), filter=Q(fir__isnull=False)),
+    }
+
+
+def stat_leaders(tournament: Tournament, round_number: int | None = None, sort: str = "gir") -> dict:
+    """
+    Field-wide stat table, column-oriented like the leaderboard: per
+    entry FIR %, GIR %, putts per 18 holes and average drive, sorted by
+    `sort`, plus the field averages.
+
+    Two aggregate queries (per entry, and field-wide); human-entered holes
+    carry no stats and are left out.
+    """
+    results = HoleResult.objects.filter(entry__tournament=tournament, gir__isnull=False)
+    if round_number is not None:
+        results = results.filter(round_number=round_number)
+
+    stat, higher_is_better = STAT_SORTS[sort]
+    order = F(stat).desc(nulls_last=True) if higher_is_better else F(stat).asc(nulls_last=True)
+    rows = (
+        results.values("entry_id", "entry__display_name")
+        .annotate(**_stat_aggregates())
+        .order_by(order, "entry_id")
+    )
+
+    def rounded(value):
+        return None if value is None else round(value, 1)
+
+    stats = [stat for stat, _ in STAT_SORTS.values()]
+    columns = {"id": [], "name": [], "holes": [], **{stat: [] for stat in stats}}
+    for row in rows:
+        columns["id"].append(row["entry_id"])
+        columns["name"].append(row["entry__display_name"])
+        columns["holes"].append(row["holes"])
+        for stat in stats:
+            columns[stat].append(rounded(row[stat]))
+
+    field = results.aggregate(**_stat_aggregates())
+    return {
+        "id": tournament.id,
+        "round": round_number,
+        "sort": sort,
+        "field": {stat: rounded(value) if stat != "holes" else value for stat, value in field.items()},
+        "columns": columns,
+    }
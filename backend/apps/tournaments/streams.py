@@ -0,0 +1,152 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+
+from config.renderers import render_json
+from apps.tournaments.models import Tournament
+from apps.tournaments.services.changes import changes_since
+from apps.tournaments.services.leaderboard import build_leaderboard
+from apps.tournaments.services.live import changes_frame, get_broker
+
+HEARTBEAT_SECONDS = 15
+
+# Long-poll: default/maximum wait, and how often to re-read the version in
+# case the change was published by another process the local broker can't see
+WAIT_TIMEOUT_SECONDS = 25
+WAIT_TIMEOUT_MAX_SECONDS = 60
+WAIT_RECHECK_SECONDS = 5
+
+
+def _catch_up_frame(pk: int, since: int) -> bytes:
+    tournament = Tournament.objects.select_related("course").get(pk=pk)
+    return changes_frame(tournament, since)
+
+
+async def tournament_stream(request, pk: int):
+    """
+    Server-sent events for one tournament: a `changes` frame (the
+    changes?since= delta, id = version) after every tick or score.
+
+    Resume with `?since=<version>` or the browser's Last-Event-ID header
+    to get one catch-up frame first. Needs the ASGI server to scale: each
+    open stream is a coroutine, not a worker thread.
+    """
+    version = await Tournament.objects.filter(pk=pk).values_list("version", flat=True).afirst()
+    if version is None:
+        raise Http404
+
+    since = request.headers.get("Last-Event-ID") or request.GET.get("since")
+    since = int(since) if since and since.isdigit() else None
+
+    async def events():
+        broker = get_broker()
+        # Subscribe before the catch-up so nothing published in between is lost
+        queue = broker.subscribe(pk)
+        try:
+            if since is not None and since < version:
+                yield await sync_to_async(_catch_up_frame)(pk, since)
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield b": ping\n\n"  # keeps proxies from closing an idle stream
+        finally:
+            broker.unsubscribe(pk, queue)
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def _current_version(pk: int):
+    return await Tournament.objects.filter(pk=pk).values_list("version", flat=True).afirst()
+
+
+async def _wait_for_change(pk: int, version: int, timeout: float):
+    """
+    Block (as a coroutine) until the tournament version differs from
+    `version` or `timeout` passes. Returns the new version, or None.
+    """
+    broker = get_broker()
+    # Subscribe before checking so a publish in between still wakes us
+    queue = broker.subscribe(pk)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while True:
+            current = await _current_version(pk)
+            if current != version:
+                return current
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(queue.get(), min(remaining, WAIT_RECHECK_SECONDS))
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        broker.unsubscribe(pk, queue)
+
+
+# Payloads being built for waiters, keyed (pk, since, version, view): every
+# waiter woken by the same change shares one build
+_building = {}
+
+
+async def _shared_payload(pk: int, since: int, view: str) -> bytes:
+    key = (pk, since, await _current_version(pk), view)
+    task = _building.get(key)
+    if task is None:
+        task = asyncio.ensure_future(sync_to_async(_wait_payload)(pk, since, view))
+        _building[key] = task
+
+        def forget(done):
+            # Finished, failed or cancelled: the next waiter builds afresh
+            if _building.get(key) is done:
+                del _building[key]
+
+        task.add_done_callback(forget)
+    # shield: one waiter disconnecting must not cancel the others' build
+    return await asyncio.shield(task)
+
+
+def _wait_payload(pk: int, since: int, view: str) -> bytes:
+    tournament = Tournament.objects.select_related("course").get(pk=pk)
+    if view == "leaderboard":
+        data = build_leaderboard(tournament)
+        data["version"] = tournament.version
+    else:
+        data = changes_since(tournament, since)
+    return render_json(data)
+
+
+async def tournament_wait(request, pk: int):
+    """
+    Long-poll for clients that can't hold a stream open:
+    `?version=<last seen>` waits until the tournament changes, then returns
+    the delta since that version (or `?view=leaderboard` for the columnar
+    leaderboard). Answers 204 if nothing changed within `?timeout=` seconds
+    (default 25, max 60). Waiting holds a coroutine, not a worker thread.
+    """
+    try:
+        version = int(request.GET["version"])
+        timeout = min(float(request.GET.get("timeout", WAIT_TIMEOUT_SECONDS)), WAIT_TIMEOUT_MAX_SECONDS)
+    except (KeyError, ValueError):
+        return JsonResponse({"error": "version must be an integer and timeout a number"}, status=400)
+    view = request.GET.get("view", "changes")
+    if view not in ("changes", "leaderboard"):
+        return JsonResponse({"error": "view must be 'changes' or 'leaderboard'"}, status=400)
+
+    current = await _current_version(pk)
+    if current is None:
+        raise Http404
+    if not 0 <= version <= current:
+        return JsonResponse({"error": f"version must be between 0 and {current}"}, status=400)
+
+    if version == current and await _wait_for_change(pk, version, max(timeout, 0)) is None:
+        return HttpResponse(status=204)
+
+    body = await _shared_payload(pk, version, view)
+    return HttpResponse(body, content_type="application/json")
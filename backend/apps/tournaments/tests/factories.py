@@ -0,0 +1,59 @@
+from rest_framework.test import APIClient
+
+from apps.courses.models import Course, Hole, TeeBox
+from apps.golfers.models import Golfer
+
+# A plain par-72 layout: four par 3s, four par 5s, ten par 4s
+PARS = (4, 5, 4, 3, 4, 4, 5, 3, 4, 4, 3, 4, 5, 4, 4, 3, 5, 4)
+YARDAGE = {3: 185, 4: 430, 5: 560}
+
+
+def make_course(name: str = "Test National") -> Course:
+    course = Course.objects.create(name=name, location="Testville")
+    for number, par in enumerate(PARS, start=1):
+        hole = Hole.objects.create(course=course, number=number, par=par, stroke_index=number)
+        TeeBox.objects.create(hole=hole, name="Champ", yardage=YARDAGE[par])
+    return course
+
+
+def make_golfers(count: int) -> list[Golfer]:
+    golfers = []
+    for i in range(count):
+        rating = 90 - (i % 40)
+        golfers.append(
+            Golfer.objects.create(
+                name=f"Golfer {i:03d}",
+                country="USA",
+                driving_power=rating,
+                driving_accuracy=rating,
+                approach=rating,
+                short_game=rating,
+                putting=rating,
+                ball_striking=rating,
+                consistency=rating,
+            )
+        )
+    return golfers
+
+
+def create_tournament(client: APIClient, course: Course, golfer_count: int = 12, fmt: str = "stroke", humans=()) -> int:
+    response = client.post(
+        "/api/tournaments/",
+        {
+            "name": "Test Open",
+            "course_id": course.id,
+            "golfer_count": golfer_count,
+            "field_type": "top_ranked",
+            "format": fmt,
+            "humans": list(humans),
+        },
+        format="json",
+    )
+    assert response.status_code == 201, response.content[:500]
+    return response.json()["id"]
+
+
+def tick(client: APIClient, tournament_id: int, minutes: int = 60):
+    response = client.post(f"/api/tournaments/{tournament_id}/tick/", {"minutes": minutes}, format="json")
+    assert response.status_code == 200, response.content[:500]
+    return response
@@ -0,0 +1,85 @@
+import copy
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.tournaments.models import HoleResult
+from apps.tournaments.services.changes import ENTRY_FIELDS
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers, tick
+
+
+def apply_delta(payload: dict, delta: dict) -> dict:
+    """What a client does with a `changes` response: patch its last normalized payload."""
+    for row in delta["entries"]:
+        payload["entries"][str(row["id"])].update(row)
+    for entry_id, results in delta["hole_results"].items():
+        holes = payload["entries"][entry_id]["hole_results"]
+        by_hole = {(h["round_number"], h["hole_number"]): h for h in holes}
+        for result in results:
+            by_hole[(result["round_number"], result["hole_number"])] = result
+        payload["entries"][entry_id]["hole_results"] = [by_hole[k] for k in sorted(by_hole)]
+    groups = {g["id"]: g for g in payload["groups"]}
+    groups.update({g["id"]: g for g in delta["groups"]})
+    payload["groups"] = [groups[g] for g in delta["group_ids"]]
+    payload.update(delta["tournament"])
+    payload["version"] = delta["version"]
+    return payload
+
+
+class ChangesSinceTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(12)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament_id = create_tournament(self.client, self.course)
+        self.url = f"/api/tournaments/{self.tournament_id}/"
+
+    def normalized(self):
+        return self.client.get(self.url, {"shape": "normalized"}).json()
+
+    def changes(self, since):
+        return self.client.get(f"{self.url}changes/", {"since": since})
+
+    def test_delta_brings_old_payload_up_to_date(self):
+        tick(self.client, self.tournament_id, 60)
+        old = self.normalized()
+        for _ in range(2):
+            tick(self.client, self.tournament_id, 45)
+
+        response = self.changes(old["version"])
+        self.assertEqual(response.status_code, 200)
+        delta = response.json()
+
+        # Only rows written since the old version come back
+        resent = sum(len(v) for v in delta["hole_results"].values())
+        total = HoleResult.objects.filter(entry__tournament_id=self.tournament_id).count()
+        self.assertTrue(0 < resent < total)
+
+        patched = apply_delta(old, delta)
+        fresh = self.normalized()
+        self.assertEqual(patched["version"], fresh["version"])
+        self.assertEqual(patched["current_time"], fresh["current_time"])
+        self.assertEqual(
+            {g["id"] for g in patched["groups"]}, {g["id"] for g in fresh["groups"]}
+        )
+        for entry_id, entry in fresh["entries"].items():
+            mine = patched["entries"][entry_id]
+            self.assertEqual({f: mine[f] for f in ENTRY_FIELDS}, {f: entry[f] for f in ENTRY_FIELDS})
+            self.assertEqual(mine["hole_results"], entry["hole_results"])
+
+    def test_applying_twice_is_harmless(self):
+        old = self.normalized()
+        tick(self.client, self.tournament_id, 60)
+        delta = self.changes(old["version"]).json()
+        once = apply_delta(copy.deepcopy(old), delta)
+        twice = apply_delta(apply_delta(copy.deepcopy(old), delta), delta)
+        self.assertEqual(once, twice)
+
+    def test_current_version_is_empty_and_bad_since_is_400(self):
+        version = self.normalized()["version"]
+        self.assertEqual(self.changes(version).json(), {"version": version, "since": version})
+        for since in (-1, version + 1, "x"):
+            self.assertEqual(self.changes(since).status_code, 400, since)
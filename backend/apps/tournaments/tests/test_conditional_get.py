@@ -0,0 +1,72 @@
+from django.core.cache import cache, caches
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.tournaments.models import Tournament
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers, tick
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(12)
+
+    def setUp(self):
+        cache.clear()
+        caches["pinned"].clear()
+        self.client = APIClient()
+        self.tournament_id = create_tournament(self.client, self.course)
+        self.url = f"/api/tournaments/{self.tournament_id}/"
+
+    def test_matching_etag_is_304_with_one_query(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+
+        with CaptureQueriesContext(connection) as queries:
+            again = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again["ETag"], etag)
+        self.assertEqual(len(queries), 1)
+
+    def test_tick_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        tick(self.client, self.tournament_id, 30)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_representations_have_their_own_etags(self):
+        full = self.client.get(self.url)["ETag"]
+        leaderboard = self.client.get(f"{self.url}leaderboard/")["ETag"]
+        self.assertNotEqual(full, leaderboard)
+        self.assertEqual(self.client.get(f"{self.url}leaderboard/", HTTP_IF_NONE_MATCH=full).status_code, 200)
+
+    def test_cached_body_served_without_orm(self):
+        first = self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(self.url)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(len(queries), 1)  # the version lookup
+
+    def test_finished_payload_is_pinned(self):
+        tournament = Tournament.objects.get(pk=self.tournament_id)
+        tournament.status = "finished"
+        tournament.save(update_fields=["status"])
+        tournament.bump_version()
+
+        etag = self.client.get(self.url)["ETag"]
+        key = f"tournament:response:{etag}"
+        self.assertIsNotNone(caches["pinned"].get(key))
+        self.assertIsNone(cache.get(key))
+
+        # Live churn in the default cache doesn't touch it
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.assertEqual(len(queries), 1)
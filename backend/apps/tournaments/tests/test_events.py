@@ -0,0 +1,142 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.tournaments.models import Tournament, TournamentEvent
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers
+
+
+def add_events(tournament_id: int, count: int, importance=lambda i: 1 + i % 4) -> list[TournamentEvent]:
+    # bulk_create stamps them all with the same created_at: the cursor has to break ties on id
+    return TournamentEvent.objects.bulk_create(
+        TournamentEvent(tournament_id=tournament_id, round_number=1, text=f"Event {i}", importance=importance(i))
+        for i in range(count)
+    )
+
+
+class EventFeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(4)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament_id = create_tournament(self.client, self.course, golfer_count=4)
+        TournamentEvent.objects.filter(tournament_id=self.tournament_id).delete()
+        self.url = f"/api/tournaments/{self.tournament_id}/events/"
+
+        events = add_events(self.tournament_id, 45)
+        # Spread a third of them over the past hour, leaving runs of equal timestamps
+        now = timezone.now()
+        for i, event in enumerate(events[::3]):
+            TournamentEvent.objects.filter(pk=event.pk).update(created_at=now - timedelta(minutes=i % 5))
+
+    def walk(self, **params) -> list[int]:
+        ids = []
+        response = self.client.get(self.url, params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            ids.extend(event["id"] for event in data["results"])
+            if not data["next"]:
+                return ids
+            response = self.client.get(data["next"])
+
+    def expected(self, **filters) -> list[int]:
+        return list(
+            TournamentEvent.objects.filter(tournament_id=self.tournament_id, **filters)
+            .order_by("-created_at", "-id")
+            .values_list("id", flat=True)
+        )
+
+    def test_pages_have_no_gaps_or_duplicates(self):
+        for page_size in (1, 7, 20, 100):
+            self.assertEqual(self.walk(page_size=page_size), self.expected(), page_size)
+
+    def test_new_events_do_not_shift_later_pages(self):
+        first = self.client.get(self.url, {"page_size": 10}).json()
+        seen = [event["id"] for event in first["results"]]
+        add_events(self.tournament_id, 5)  # newer than everything on page one
+
+        response = self.client.get(first["next"])
+        while True:
+            data = response.json()
+            seen.extend(event["id"] for event in data["results"])
+            if not data["next"]:
+                break
+            response = self.client.get(data["next"])
+
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(seen, [e for e in self.expected() if e in set(seen)])
+        self.assertEqual(len(seen), 45)
+
+    def test_min_importance(self):
+        self.assertEqual(self.walk(page_size=4, min_importance=3), self.expected(importance__gte=3))
+        response = self.client.get(self.url, {"min_importance": "high"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_tournament_is_404(self):
+        self.assertEqual(self.client.get("/api/tournaments/999999/events/").status_code, 404)
+
+
+@override_settings(EVENT_RETENTION_DAYS=10, EVENT_KEEP_IMPORTANCE=3, EVENT_KEEP_RECENT=5)
+class CompactEventsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(4)
+
+    def setUp(self):
+        client = APIClient()
+        self.finished_id = create_tournament(client, self.course, golfer_count=4)
+        self.live_id = create_tournament(client, self.course, golfer_count=4)
+        Tournament.objects.filter(pk=self.finished_id).update(status="finished")
+        TournamentEvent.objects.all().delete()
+
+        now = timezone.now()
+        for tournament_id in (self.finished_id, self.live_id):
+            events = add_events(tournament_id, 40)
+            # Events 0-29 are old, 30-39 inside the window; newer index = newer event
+            for i, event in enumerate(events):
+                age = timedelta(days=40 - i) if i < 30 else timedelta(hours=40 - i)
+                TournamentEvent.objects.filter(pk=event.pk).update(created_at=now - age)
+        TournamentEvent.objects.filter(text="Event 0").update(importance=4)
+
+    def compact(self, *args) -> str:
+        out = StringIO()
+        call_command("compact_events", *args, stdout=out)
+        return out.getvalue()
+
+    def survivors(self, tournament_id) -> set[str]:
+        return set(TournamentEvent.objects.filter(tournament_id=tournament_id).values_list("text", flat=True))
+
+    def test_keeps_the_configured_window(self):
+        self.compact("--batch-size", "3")
+
+        expected = set()
+        for i in range(40):
+            importance = 4 if i == 0 else 1 + i % 4
+            if importance >= 3 or i >= 30:  # a highlight, or younger than EVENT_RETENTION_DAYS
+                expected.add(f"Event {i}")
+        self.assertEqual(self.survivors(self.finished_id), expected)
+
+        # Live tournaments are never compacted
+        self.assertEqual(len(self.survivors(self.live_id)), 40)
+
+    def test_keep_recent_outside_the_window(self):
+        TournamentEvent.objects.filter(tournament_id=self.finished_id, text__in=[f"Event {i}" for i in range(30, 40)]).delete()
+        self.compact()
+        # Events 25-29 are old but the newest left, so they stay whatever their importance
+        self.assertTrue({f"Event {i}" for i in range(25, 30)} <= self.survivors(self.finished_id))
+        self.assertNotIn("Event 24", self.survivors(self.finished_id))  # importance 1
+
+    def test_dry_run(self):
+        before = TournamentEvent.objects.count()
+        output = self.compact("--dry-run")
+        self.assertEqual(TournamentEvent.objects.count(), before)
+        self.assertIn("Would prune", output)
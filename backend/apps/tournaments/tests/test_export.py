@@ -0,0 +1,64 @@
+import json
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from config.renderers import render_json
+from apps.tournaments.models import HoleResult, Tournament
+from apps.tournaments.serializers import NormalizedTournamentSerializer
+from apps.tournaments.services import export
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers, tick
+
+
+class StreamedExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(10)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament_id = create_tournament(
+            self.client, self.course, golfer_count=10, humans=[{"name": "Me", "country": "CAN"}]
+        )
+        tick(self.client, self.tournament_id, 45)
+        self.tournament = Tournament.objects.get(pk=self.tournament_id)
+
+        entries = list(self.tournament.entries.order_by("id"))
+        # The last bot has played two rounds; the human (no holes) sits in between
+        multi = [e for e in entries if not e.is_human][-1]
+        for round_number in (1, 2):
+            for hole_number in range(1, 19):
+                HoleResult.objects.update_or_create(
+                    entry=multi, round_number=round_number, hole_number=hole_number, defaults={"strokes": 4}
+                )
+        self.entries = entries
+        self.multi = multi
+
+    def expected(self):
+        self.tournament.refresh_from_db()
+        return json.loads(render_json(NormalizedTournamentSerializer(self.tournament).data))
+
+    def test_stream_equals_serializer(self):
+        counts = {e.id: e.hole_results.count() for e in self.entries}
+        self.assertIn(0, counts.values())
+        self.assertEqual(
+            set(self.multi.hole_results.values_list("round_number", flat=True)), {1, 2}
+        )
+
+        # Tiny cursor fetches and flushes so every merge boundary is crossed
+        with mock.patch.object(export, "FLUSH_BYTES", 256):
+            chunks = list(export.stream_tournament_json(self.tournament, chunk_size=3))
+        self.assertGreater(len(chunks), 1)
+        streamed = json.loads(b"".join(chunks))
+
+        self.assertEqual(streamed, self.expected())
+        for entry_id, count in counts.items():
+            self.assertEqual(len(streamed["entries"][str(entry_id)]["hole_results"]), count)
+
+    def test_export_endpoint(self):
+        response = self.client.get(f"/api/tournaments/{self.tournament_id}/export/")
+        self.assertEqual(response.status_code, 200)
+        body = b"".join(response.streaming_content) if response.streaming else response.content
+        self.assertEqual(json.loads(body), self.expected())
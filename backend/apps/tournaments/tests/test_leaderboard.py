@@ -0,0 +1,63 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.tournaments.models import EntryRound, Tournament, TournamentEntry
+from apps.tournaments.services.leaderboard import build_leaderboard
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers, tick
+
+
+class LeaderboardTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(10)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament_id = create_tournament(self.client, self.course, golfer_count=10)
+        tick(self.client, self.tournament_id, 90)
+        self.tournament = Tournament.objects.get(pk=self.tournament_id)
+
+    def test_cut_last_and_unranked_after_ranked(self):
+        entries = list(self.tournament.entries.order_by("id"))
+        # Missed-cut entries keep a (good) position but still sort last
+        TournamentEntry.objects.filter(pk__in=[entries[0].pk, entries[1].pk]).update(cut=True, position=1)
+        TournamentEntry.objects.filter(pk__in=[entries[2].pk, entries[3].pk]).update(position=None)
+        # Ranked in reverse id order, tied in pairs (ties fall back to id)
+        ranked = entries[4:][::-1]
+        for rank, entry in enumerate(ranked, start=1):
+            TournamentEntry.objects.filter(pk=entry.pk).update(position=(rank + 1) // 2)
+
+        columns = build_leaderboard(self.tournament)["columns"]
+        ranked_ids = [e.id for e in ranked]
+        for i in range(0, len(ranked_ids), 2):
+            ranked_ids[i : i + 2] = sorted(ranked_ids[i : i + 2])
+        expected = ranked_ids + [entries[2].id, entries[3].id, entries[0].id, entries[1].id]
+        self.assertEqual(columns["id"], expected)
+        self.assertEqual(columns["position"], [1, 1, 2, 2, 3, 3, None, None, 1, 1])
+        self.assertEqual(columns["cut"], [False] * 8 + [True] * 2)
+
+    def test_scores_come_from_entry_rounds(self):
+        response = self.client.get(f"/api/tournaments/{self.tournament_id}/leaderboard/")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        columns = data["columns"]
+        self.assertEqual(len(columns["id"]), 10)
+        for column in columns.values():
+            self.assertEqual(len(column), 10)
+
+        rounds = {}
+        for r in EntryRound.objects.filter(entry__tournament_id=self.tournament_id):
+            rounds.setdefault(r.entry_id, {})[r.round_number] = r
+        self.assertTrue(rounds)
+
+        current = data["current_round"]
+        for i, entry_id in enumerate(columns["id"]):
+            played = rounds.get(entry_id, {})
+            today = played.get(current)
+            self.assertEqual(columns["to_par"][i], sum(r.to_par for r in played.values()))
+            self.assertEqual(columns["thru"][i], today.holes_played if today else 0)
+            self.assertEqual(columns["today"][i], today.to_par if today else None)
+            self.assertEqual(
+                columns["rounds"][i], [played[n].strokes if n in played else None for n in range(1, 5)]
+            )
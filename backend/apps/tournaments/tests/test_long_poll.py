@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+from asgiref.sync import sync_to_async
+from django.test import AsyncClient, TestCase
+from rest_framework.test import APIClient
+
+from apps.tournaments.models import Tournament
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers, tick
+
+
+class TournamentWaitTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(8)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament_id = create_tournament(self.client, self.course, golfer_count=8)
+        self.url = f"/api/tournaments/{self.tournament_id}/wait/"
+
+    async def version(self):
+        return await Tournament.objects.filter(pk=self.tournament_id).values_list("version", flat=True).afirst()
+
+    async def wait(self, **params):
+        return await AsyncClient().get(self.url, params)
+
+    async def test_timeout_is_204(self):
+        started = time.monotonic()
+        response = await self.wait(version=await self.version(), timeout=0.2)
+        self.assertEqual(response.status_code, 204)
+        self.assertLess(time.monotonic() - started, 3)
+
+    async def test_bad_params_are_400(self):
+        current = await self.version()
+        for params in (
+            {},
+            {"version": "x"},
+            {"version": -1},
+            {"version": current + 1},
+            {"version": current, "timeout": "soon"},
+            {"version": current, "view": "full"},
+        ):
+            response = await self.wait(**params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertIn("error", response.json())
+
+    async def test_behind_returns_immediately(self):
+        since = await self.version()
+        await sync_to_async(tick)(self.client, self.tournament_id, 30)
+
+        started = time.monotonic()
+        response = await self.wait(version=since, timeout=30)
+        self.assertLess(time.monotonic() - started, 3)
+        self.assertEqual(response.status_code, 200)
+        delta = response.json()
+        self.assertEqual((delta["since"], delta["version"]), (since, await self.version()))
+
+        leaderboard = (await self.wait(version=since, view="leaderboard")).json()
+        self.assertEqual(leaderboard["version"], await self.version())
+        self.assertIn("id", leaderboard)
+
+    async def test_publish_wakes_the_waiter(self):
+        since = await self.version()
+        pending = asyncio.ensure_future(self.wait(version=since, timeout=10))
+        await asyncio.sleep(0.2)  # let it subscribe
+        self.assertFalse(pending.done())
+
+        started = time.monotonic()
+        await sync_to_async(tick)(self.client, self.tournament_id, 30)
+        response = await asyncio.wait_for(pending, 5)
+        self.assertLess(time.monotonic() - started, 3)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["version"], await self.version())
@@ -0,0 +1,98 @@
+import random
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.golfers.models import Golfer
+from apps.tournaments.models import GroupMember, HoleResult, Tournament
+from apps.tournaments.services.match_play import calculate_match_probabilities, live_matches
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers
+from apps.tournaments.views import TournamentViewSet
+
+
+class MatchProbabilityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        golfers = make_golfers(8)
+        Golfer.objects.filter(pk__in=[g.pk for g in golfers[::2]]).update(country="ENG")
+        # Evenly matched sides, so only the holes-up state separates them
+        Golfer.objects.update(overall=80)
+
+    def setUp(self):
+        client = APIClient()
+        self.tournament = Tournament.objects.get(pk=create_tournament(client, self.course, golfer_count=8, fmt="match"))
+        self.sides = {}  # group_id -> {"USA": [entry_id...], "EUR": [...]}
+        for group_id, entry_id, team in GroupMember.objects.filter(group__tournament=self.tournament).values_list(
+            "group_id", "entry_id", "entry__team"
+        ):
+            self.sides.setdefault(group_id, {"USA": [], "EUR": []})["USA" if team == "USA" else "EUR"].append(entry_id)
+        self.assertTrue(self.sides)
+
+    def play(self, group_id: int, holes: list[tuple[int, int]]):
+        """Record (usa, eur) strokes for holes 1..len(holes) for every player on each side."""
+        round_number = self.tournament.current_round
+        for hole_number, strokes in enumerate(holes, start=1):
+            for side, score in zip(("USA", "EUR"), strokes):
+                for entry_id in self.sides[group_id][side]:
+                    HoleResult.objects.update_or_create(
+                        entry_id=entry_id,
+                        round_number=round_number,
+                        hole_number=hole_number,
+                        defaults={"strokes": score},
+                    )
+
+    def odds(self, simulations: int = 4000) -> dict:
+        matches = calculate_match_probabilities(self.tournament, simulations=simulations)["matches"]
+        return {
+            group_id: (usa, halve, eur)
+            for group_id, usa, halve, eur in zip(matches["group_id"], matches["usa"], matches["halve"], matches["eur"])
+        }
+
+    def test_decided_matches_are_certain(self):
+        closed_out, dormie = list(self.sides)[:2]
+        self.play(closed_out, [(3, 4)] * 10)  # 10 up with 8 to play
+        self.play(dormie, [(5, 4)] * 4 + [(4, 4)] * 10)  # EUR 4 up with 4 to play
+
+        odds = self.odds()
+        self.assertEqual(odds[closed_out], (1.0, 0.0, 0.0))
+
+        usa, halve, eur = odds[dormie]
+        self.assertEqual(usa, 0.0)  # can still be halved, never lost
+        self.assertGreater(eur, 0.5)
+        self.assertAlmostEqual(eur + halve, 1.0, places=3)
+
+    def test_all_square_is_symmetric(self):
+        group_id = next(iter(self.sides))
+        self.play(group_id, [(4, 3), (3, 4)] * 4 + [(4, 4)])  # AS thru 9
+
+        match = next(m for m in live_matches(self.tournament) if m["group_id"] == group_id)
+        self.assertEqual((match["usa_up"], match["thru"]), (0, 9))
+
+        usa, halve, eur = self.odds(simulations=20000)[group_id]
+        self.assertAlmostEqual(usa, eur, delta=0.03)
+        self.assertGreater(halve, 0.0)
+
+    def test_finished_matches_agree_with_archived_result(self):
+        rng = random.Random(5)
+        for group_id in self.sides:
+            self.play(group_id, [(rng.randint(3, 5), rng.randint(3, 5)) for _ in range(18)])
+
+        odds = self.odds(simulations=200)
+        TournamentViewSet()._archive_match_results(self.tournament)
+        self.tournament.refresh_from_db()
+
+        results = self.tournament.session_history[f"R{self.tournament.current_round}"]
+        self.assertEqual(len(results), len(self.sides))
+        expected = {"USA": (1.0, 0.0, 0.0), "Halved": (0.0, 1.0, 0.0), "EUR": (0.0, 0.0, 1.0)}
+        for result in results:
+            self.assertEqual(odds[result["group_id"]], expected[result["winner"]], result)
+
+        # Archived matches are banked, not simulated again
+        banked = calculate_match_probabilities(self.tournament, simulations=200)
+        self.assertEqual(banked["matches"]["group_id"], [])
+        self.assertEqual(banked["points_available"], len(results))
+        self.assertEqual(
+            banked["teams"]["USA"]["banked"],
+            sum(1.0 if r["winner"] == "USA" else 0.5 if r["winner"] == "Halved" else 0.0 for r in results),
+        )
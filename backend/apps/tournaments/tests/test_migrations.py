@@ -0,0 +1,100 @@
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+
+class MigrationTestCase(TransactionTestCase):
+    """
+    Migrates the test database back to `migrate_from`, lets the test build
+    rows on the historical models, then runs the migration under test.
+    The database is returned to the latest schema afterwards.
+    """
+    migrate_from = None
+    migrate_to = None
+
+    def setUp(self):
+        self.executor = MigrationExecutor(connection)
+        self.executor.migrate([self.migrate_from])
+        self.old_apps = self.executor.loader.project_state([self.migrate_from]).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def migrate(self, target):
+        executor = MigrationExecutor(connection)
+        executor.migrate([target])
+        return executor.loader.project_state([target]).apps
+
+    def make_entry(self, apps, pars):
+        Course = apps.get_model("courses", "Course")
+        Hole = apps.get_model("courses", "Hole")
+        Tournament = apps.get_model("tournaments", "Tournament")
+        TournamentEntry = apps.get_model("tournaments", "TournamentEntry")
+
+        course = Course.objects.create(name="Migration Links")
+        for number, par in enumerate(pars, start=1):
+            Hole.objects.create(course=course, number=number, par=par)
+        now = timezone.now()
+        tournament = Tournament.objects.create(name="Old Open", course=course, start_time=now, current_time=now)
+        return TournamentEntry.objects.create(tournament=tournament, display_name="Old Timer", is_human=True)
+
+
+class HoleParMigrationTests(MigrationTestCase):
+    migrate_from = ("tournaments", "0022_entry_round")
+    migrate_to = ("tournaments", "0023_hole_result_par")
+
+    def test_backfill_stamps_par_and_reverses(self):
+        entry = self.make_entry(self.old_apps, (4, 3, 5))
+        HoleResult = self.old_apps.get_model("tournaments", "HoleResult")
+        # Hole 4 is not on the course: falls back to par 4
+        for hole_number, strokes in ((1, 5), (2, 2), (3, 5), (4, 6)):
+            HoleResult.objects.create(entry_id=entry.id, round_number=1, hole_number=hole_number, strokes=strokes)
+
+        apps = self.migrate(self.migrate_to)
+        rows = apps.get_model("tournaments", "HoleResult").objects.order_by("hole_number")
+        self.assertEqual(
+            list(rows.values_list("hole_number", "par", "to_par")),
+            [(1, 4, 1), (2, 3, -1), (3, 5, 0), (4, 4, 2)],
+        )
+
+        apps = self.migrate(self.migrate_from)
+        rows = apps.get_model("tournaments", "HoleResult").objects.order_by("hole_number")
+        self.assertEqual(list(rows.values_list("hole_number", "strokes")), [(1, 5), (2, 2), (3, 5), (4, 6)])
+
+
+class HoleStatColumnsMigrationTests(MigrationTestCase):
+    migrate_from = ("tournaments", "0023_hole_result_par")
+    migrate_to = ("tournaments", "0024_hole_stat_columns")
+
+    ENGINE_STATS = {
+        "fir": True, "gir": False, "putts": 2, "drive_distance": 301,
+        "prox_to_hole": 14, "commentary": "Finds the fairway.", "excitement": 3,
+    }
+    PAR3_STATS = {
+        "fir": None, "gir": True, "putts": 1, "drive_distance": None,
+        "prox_to_hole": 6, "commentary": "", "excitement": 7,
+    }
+
+    def test_split_and_join_round_trip(self):
+        entry = self.make_entry(self.old_apps, (4, 3, 5))
+        HoleResult = self.old_apps.get_model("tournaments", "HoleResult")
+        for hole_number, stats in ((1, self.ENGINE_STATS), (2, self.PAR3_STATS), (3, {})):
+            HoleResult.objects.create(entry_id=entry.id, round_number=1, hole_number=hole_number, strokes=4, stats=stats)
+
+        apps = self.migrate(self.migrate_to)
+        rows = {
+            r["hole_number"]: r
+            for r in apps.get_model("tournaments", "HoleResult").objects.values(
+                "hole_number", "fir", "gir", "putts", "drive_distance", "prox_to_hole", "commentary", "excitement"
+            )
+        }
+        self.assertEqual({k: rows[1][k] for k in self.ENGINE_STATS}, self.ENGINE_STATS)
+        self.assertEqual({k: rows[2][k] for k in self.PAR3_STATS}, self.PAR3_STATS)
+        self.assertEqual(rows[3]["commentary"], "")
+        self.assertTrue(all(rows[3][k] is None for k in self.ENGINE_STATS if k != "commentary"))
+
+        apps = self.migrate(self.migrate_from)
+        stats = dict(apps.get_model("tournaments", "HoleResult").objects.values_list("hole_number", "stats"))
+        self.assertEqual(stats, {1: self.ENGINE_STATS, 2: self.PAR3_STATS, 3: {}})
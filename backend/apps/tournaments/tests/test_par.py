@@ -0,0 +1,46 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.tournaments.models import EntryRound, HoleResult, Tournament, TournamentEntry
+from apps.tournaments.services.probability import calculate_finish_distribution
+from apps.tournaments.services.rounds import refresh_entry_round
+from apps.tournaments.services.scorecard import build_scorecard
+from apps.tournaments.tests.factories import PARS, create_tournament, make_course, make_golfers
+
+
+class HoleParTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(8)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament = Tournament.objects.get(pk=create_tournament(self.client, self.course, golfer_count=8))
+        self.entry = TournamentEntry.objects.filter(tournament=self.tournament).first()
+
+    def test_save_derives_par_from_course(self):
+        result = HoleResult.objects.create(entry=self.entry, round_number=1, hole_number=2, strokes=4)
+        self.assertEqual((result.par, result.to_par), (PARS[1], 4 - PARS[1]))
+
+        result.strokes = 7
+        result.save(update_fields=["strokes"])
+        result.refresh_from_db()
+        self.assertEqual(result.to_par, 7 - PARS[1])
+
+    def test_missing_par_counts_as_level(self):
+        HoleResult.objects.create(entry=self.entry, round_number=1, hole_number=1, strokes=3)
+        HoleResult.objects.create(entry=self.entry, round_number=1, hole_number=2, strokes=6)
+        # Written around save(): no par recorded
+        HoleResult.objects.filter(hole_number=2).update(par=None, to_par=None)
+
+        refresh_entry_round(self.entry, 1)
+        row = EntryRound.objects.get(entry=self.entry, round_number=1)
+        self.assertEqual((row.strokes, row.to_par), (9, 3 - PARS[0]))
+
+        card = build_scorecard(self.entry)
+        self.assertEqual(card["to_par"], 3 - PARS[0])
+
+        for mode in ("fast", "model"):
+            distribution = calculate_finish_distribution(self.tournament, simulations=200, mode=mode)
+            self.assertIn(str(self.entry.id), distribution["ids"])
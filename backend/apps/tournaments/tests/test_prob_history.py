@@ -0,0 +1,90 @@
+import random
+from datetime import timedelta
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.tournaments.models import Tournament, WinProbSnapshot
+from apps.tournaments.services.prob_history import (
+    SCALE,
+    entry_order,
+    pack_probs,
+    probability_history,
+    record_snapshot,
+    unpack_probs,
+)
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers
+
+
+class PackingTests(TestCase):
+    def test_round_trip_within_one_step(self):
+        rng = random.Random(3)
+        values = [0.0, 1.0, 0.5, 1 / SCALE, 1 - 1 / SCALE] + [rng.random() for _ in range(500)]
+        unpacked = unpack_probs(pack_probs(values))
+        self.assertEqual(len(unpacked), len(values))
+        for original, restored in zip(values, unpacked):
+            self.assertLessEqual(abs(original - restored), 1 / SCALE)
+
+    def test_out_of_range_is_clamped(self):
+        self.assertEqual(unpack_probs(pack_probs([-0.2, 1.3])), [0.0, 1.0])
+
+
+class ProbabilityHistoryTests(TestCase):
+    STEPS = 50
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(14)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament_id = create_tournament(self.client, self.course, golfer_count=14)
+        self.tournament = Tournament.objects.get(pk=self.tournament_id)
+        self.order = entry_order(self.tournament)
+
+        # Entry i's P(win) at step k is (i + k) / 100, so every value is recoverable
+        start = self.tournament.current_time
+        for k in range(self.STEPS):
+            self.tournament.current_time = start + timedelta(minutes=10 * k)
+            distribution = {"ids": [str(e) for e in self.order], "win": [(i + k) / 100 for i in range(len(self.order))]}
+            record_snapshot(self.tournament, distribution, self.order)
+        self.clocks = list(WinProbSnapshot.objects.filter(tournament=self.tournament).values_list("clock", flat=True))
+        self.assertEqual(len(self.clocks), self.STEPS)
+
+    def test_downsampling_keeps_ends(self):
+        history = probability_history(self.tournament, points=7)
+        self.assertEqual(len(history["clock"]), 7)
+        self.assertEqual((history["clock"][0], history["clock"][-1]), (self.clocks[0], self.clocks[-1]))
+        self.assertEqual(history["clock"], sorted(set(history["clock"])))
+
+        # Each kept point carries its own snapshot's column
+        steps = [self.clocks.index(clock) for clock in history["clock"]]
+        for entry_id, series in history["series"].items():
+            i = self.order.index(int(entry_id))
+            self.assertEqual(series, [round((i + k) / 100, 4) for k in steps])
+
+        # Fewer snapshots than points: all of them
+        self.assertEqual(probability_history(self.tournament, points=500)["clock"], self.clocks)
+
+    def test_default_entries_are_latest_top_ten(self):
+        history = probability_history(self.tournament)
+        self.assertEqual(history["entry_ids"], self.order[::-1][:10])
+        self.assertEqual(set(history["series"]), {str(e) for e in history["entry_ids"]})
+
+    def test_entry_ids_filter(self):
+        wanted = [self.order[2], self.order[0], 999999]
+        history = probability_history(self.tournament, entry_ids=wanted)
+        self.assertEqual(history["entry_ids"], wanted[:2])  # unknown ids are dropped, order kept
+        self.assertEqual(history["series"][str(self.order[0])][0], 0.0)
+
+    def test_endpoint(self):
+        url = f"/api/tournaments/{self.tournament_id}/win-prob-history/"
+        response = self.client.get(url, {"points": 5, "entries": f"{self.order[1]},{self.order[3]}"})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data["clock"]), 5)
+        self.assertEqual(data["entry_ids"], [self.order[1], self.order[3]])
+        self.assertEqual(len(data["series"][str(self.order[3])]), 5)
+
+        self.assertEqual(self.client.get(url, {"entries": "1,x"}).status_code, 400)
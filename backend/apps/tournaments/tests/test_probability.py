@@ -0,0 +1,150 @@
+import math
+import random
+import time
+
+import numpy as np
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.tournaments.models import Tournament
+from apps.tournaments.services.playout import rank_bounds
+from apps.tournaments.services.probability import (
+    PLAYOUT_GRACE,
+    PER_HOLE_SIGMA,
+    _field_inputs,
+    _model_draws,
+    _model_inputs,
+    calculate_finish_distribution,
+    calculate_head_to_head,
+)
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers, tick
+
+
+def legacy_win_probabilities(players: list, simulations: int) -> dict:
+    """The per-draw Python loop the batched simulation replaced, scored in whole strokes."""
+    wins = {p["id"]: 0.0 for p in players}
+    for _ in range(simulations):
+        scores = {}
+        for p in players:
+            exp = p["to_par"] + p["remaining"] * p["skill_adj"]
+            sigma = PER_HOLE_SIGMA * math.sqrt(p["remaining"]) if p["remaining"] else 0.001
+            scores[p["id"]] = round(random.gauss(exp, sigma))
+        best = min(scores.values())
+        winners = [pid for pid, score in scores.items() if score == best]
+        for pid in winners:
+            wins[pid] += 1.0 / len(winners)
+    return {pid: w / simulations for pid, w in wins.items()}
+
+
+class FinishDistributionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(12)
+
+    def setUp(self):
+        client = APIClient()
+        tournament_id = create_tournament(client, self.course)
+        tick(client, tournament_id, 180)
+        self.tournament = Tournament.objects.get(pk=tournament_id)
+
+    def test_rank_bounds_match_loop(self):
+        scores = np.random.default_rng(7).integers(-3, 4, size=(200, 9))
+        lo, hi = rank_bounds(scores)
+        for d, row in enumerate(scores):
+            for i, score in enumerate(row):
+                self.assertEqual(lo[d, i], sum(other < score for other in row))
+                self.assertEqual(hi[d, i], sum(other <= score for other in row))
+
+    def test_batched_win_matches_loop(self):
+        random.seed(11)
+        legacy = legacy_win_probabilities(_field_inputs(self.tournament), 4000)
+        batched = calculate_finish_distribution(self.tournament, simulations=20000, mode="fast")
+
+        for pid, prob in zip(batched["ids"], batched["win"]):
+            self.assertAlmostEqual(prob, legacy[pid], delta=0.04, msg=pid)
+
+    def test_markets_are_consistent(self):
+        d = calculate_finish_distribution(self.tournament, simulations=5000, mode="fast")
+        n = len(d["ids"])
+        self.assertEqual(n, 12)
+        # Dead-heat shares hand out exactly N places per market
+        self.assertAlmostEqual(sum(d["win"]), 1.0, delta=0.01)
+        self.assertAlmostEqual(sum(d["top5"]), 5.0, delta=0.01)
+        self.assertAlmostEqual(sum(d["top10"]), 10.0, delta=0.01)
+        for win, top5, top10 in zip(d["win"], d["top5"], d["top10"]):
+            self.assertLessEqual(win, top5 + 1e-4)
+            self.assertLessEqual(top5, top10 + 1e-4)
+        self.assertEqual(d["make_cut"], [1.0] * n)  # field smaller than the cut
+        self.assertTrue(all(1 <= f <= n for f in d["exp_finish"]))
+
+
+class HeadToHeadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(12)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament_id = create_tournament(self.client, self.course)
+        tick(self.client, self.tournament_id, 120)
+        self.tournament = Tournament.objects.get(pk=self.tournament_id)
+
+    def test_modes_agree(self):
+        fast = calculate_head_to_head(self.tournament, mode="fast")
+        model = calculate_head_to_head(self.tournament, simulations=4000, mode="model")
+        self.assertEqual(fast["ids"], model["ids"])
+
+        for result in (fast, model):
+            matrix = np.array(result["matrix"])
+            self.assertTrue((np.diag(matrix) == 0).all())
+            # Win + loss + tie = 1 for every pair
+            self.assertTrue((matrix + matrix.T <= 1.0 + 1e-3).all())
+
+        # Different models of the same field: close, not identical
+        self.assertLess(np.abs(np.array(fast["matrix"]) - np.array(model["matrix"])).mean(), 0.15)
+
+    @override_settings(WIN_PROB_MODE="model")
+    def test_endpoint_honors_mode(self):
+        response = self.client.get(f"/api/tournaments/{self.tournament_id}/head-to-head/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["ids"]), 12)
+
+
+class ModelTimeBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(40)
+
+    def setUp(self):
+        client = APIClient()
+        self.tournament = Tournament.objects.get(pk=create_tournament(client, self.course, golfer_count=40))
+        _, self.inputs = _model_inputs(self.tournament)
+        _model_draws(self.inputs, 100, 5.0)  # warm the pool
+
+    def test_partial_draws_within_budget(self):
+        budget = 0.3
+        started = time.monotonic()
+        draws = _model_draws(self.inputs, 10_000_000, budget)
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, budget + PLAYOUT_GRACE + 0.5)
+        self.assertIsNotNone(draws)
+        at_cut, final = draws
+        self.assertEqual(at_cut.shape, final.shape)
+        self.assertTrue(0 < len(final) < 10_000_000)
+
+        # The workers stopped on their own: the next call isn't queued behind them
+        started = time.monotonic()
+        self.assertEqual(len(_model_draws(self.inputs, 200, 5.0)[1]), 200)
+        self.assertLess(time.monotonic() - started, 2.0)
+
+    @override_settings(WIN_PROB_TIME_BUDGET=0.0)
+    def test_fallback_returns_within_budget(self):
+        started = time.monotonic()
+        distribution = calculate_finish_distribution(self.tournament, simulations=10_000, mode="model")
+        self.assertLess(time.monotonic() - started, PLAYOUT_GRACE + 1.0)
+        self.assertEqual(len(distribution["ids"]), 40)
+        self.assertAlmostEqual(sum(distribution["win"]), 1.0, delta=0.01)
@@ -0,0 +1,110 @@
+from django.contrib import admin
+from django.db.models import Count, Sum
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.tournaments.models import EntryRound, HoleResult, TournamentEntry
+from apps.tournaments.services.rounds import refresh_entry_round
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers, tick
+
+
+class EntryRoundTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(12)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament_id = create_tournament(self.client, self.course, humans=[{"name": "Me", "country": "CAN"}])
+
+    def assertRoundsMatchHoles(self):
+        expected = {
+            (row["entry_id"], row["round_number"]): (row["strokes"], row["par"], row["holes"])
+            for row in HoleResult.objects.filter(entry__tournament_id=self.tournament_id)
+            .values("entry_id", "round_number")
+            .annotate(strokes=Sum("strokes"), par=Sum("par"), holes=Count("id"))
+        }
+        actual = {
+            (r.entry_id, r.round_number): (r.strokes, r.par_played, r.holes_played)
+            for r in EntryRound.objects.filter(entry__tournament_id=self.tournament_id)
+        }
+        self.assertEqual(actual, expected)
+        for r in EntryRound.objects.filter(entry__tournament_id=self.tournament_id):
+            self.assertEqual(r.to_par, r.strokes - r.par_played)
+
+    def test_engine_keeps_rounds_in_step(self):
+        for _ in range(4):
+            tick(self.client, self.tournament_id, 60)
+        self.assertTrue(EntryRound.objects.filter(entry__tournament_id=self.tournament_id).exists())
+        self.assertRoundsMatchHoles()
+
+        for entry in TournamentEntry.objects.filter(tournament_id=self.tournament_id, is_human=False):
+            rounds = list(entry.rounds.all())
+            self.assertEqual(entry.tournament_strokes, sum(r.strokes for r in rounds))
+
+    def test_human_resubmission_replaces_hole(self):
+        human = TournamentEntry.objects.get(tournament_id=self.tournament_id, is_human=True)
+        url = f"/api/tournaments/{self.tournament_id}/hole-result/"
+        for strokes in (6, 3):
+            response = self.client.post(
+                url, {"entry_id": human.id, "hole_number": 1, "round_number": 1, "strokes": strokes}, format="json"
+            )
+            self.assertEqual(response.status_code, 200, response.content[:500])
+
+        row = EntryRound.objects.get(entry=human, round_number=1)
+        self.assertEqual((row.strokes, row.par_played, row.holes_played, row.to_par), (3, 4, 1, -1))
+        human.refresh_from_db()
+        self.assertEqual(human.tournament_strokes, 3)
+
+    def test_refresh_drops_round_without_holes(self):
+        tick(self.client, self.tournament_id, 60)
+        entry = EntryRound.objects.filter(entry__tournament_id=self.tournament_id).first().entry
+
+        HoleResult.objects.filter(entry=entry, round_number=1).delete()
+        self.assertEqual(refresh_entry_round(entry, 1), [])
+        self.assertFalse(entry.rounds.exists())
+
+    def test_admin_edits_refresh_rounds(self):
+        tick(self.client, self.tournament_id, 60)
+        model_admin = admin.site._registry[HoleResult]
+        result = HoleResult.objects.filter(entry__tournament_id=self.tournament_id).first()
+
+        result.strokes += 2
+        model_admin.save_model(None, result, None, change=True)
+        self.assertRoundsMatchHoles()
+        entry = TournamentEntry.objects.get(pk=result.entry_id)
+        self.assertEqual(entry.tournament_strokes, sum(r.strokes for r in entry.rounds.all()))
+
+        model_admin.delete_model(None, result)
+        self.assertRoundsMatchHoles()
+
+        model_admin.delete_queryset(None, HoleResult.objects.filter(entry_id=result.entry_id))
+        self.assertFalse(EntryRound.objects.filter(entry_id=result.entry_id).exists())
+
+    def test_admin_edits_publish_a_new_version(self):
+        tick(self.client, self.tournament_id, 60)
+        url = f"/api/tournaments/{self.tournament_id}/"
+        before = self.client.get(url)
+        version = before.json()["version"]
+
+        result = HoleResult.objects.filter(entry__tournament_id=self.tournament_id).first()
+        result.strokes += 1
+        admin.site._registry[HoleResult].save_model(None, result, None, change=True)
+
+        after = self.client.get(url, HTTP_IF_NONE_MATCH=before["ETag"])
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after["ETag"], before["ETag"])
+
+        delta = self.client.get(f"{url}changes/", {"since": version}).json()
+        self.assertEqual(delta["version"], version + 1)
+        holes = delta["hole_results"][str(result.entry_id)]
+        self.assertEqual(
+            [(h["round_number"], h["hole_number"], h["strokes"]) for h in holes],
+            [(result.round_number, result.hole_number, result.strokes)],
+        )
+        entry = TournamentEntry.objects.get(pk=result.entry_id)
+        self.assertIn(
+            {"id": entry.id, "tournament_strokes": entry.tournament_strokes},
+            [{"id": e["id"], "tournament_strokes": e["tournament_strokes"]} for e in delta["entries"]],
+        )
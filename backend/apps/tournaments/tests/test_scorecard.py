@@ -0,0 +1,68 @@
+from django.db.models import Sum
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.tournaments.models import HoleResult, TournamentEntry
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers, tick
+
+
+class ScorecardTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(8)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament_id = create_tournament(
+            self.client, self.course, golfer_count=8, humans=[{"name": "Me", "country": "CAN"}]
+        )
+
+    def url(self, entry_id, tournament_id=None):
+        return f"/api/tournaments/{tournament_id or self.tournament_id}/entries/{entry_id}/scorecard/"
+
+    def test_entry_without_holes(self):
+        human = TournamentEntry.objects.get(tournament_id=self.tournament_id, is_human=True)
+        response = self.client.get(self.url(human.id))
+        self.assertEqual(response.status_code, 200)
+        card = response.json()
+        self.assertEqual((card["id"], card["display_name"]), (human.id, "Me"))
+        self.assertEqual((card["to_par"], card["rounds"]), (0, []))
+
+    def test_card_matches_hole_rows(self):
+        tick(self.client, self.tournament_id, 90)
+        result = HoleResult.objects.filter(entry__tournament_id=self.tournament_id).first()
+
+        response = self.client.get(self.url(result.entry_id))
+        self.assertEqual(response.status_code, 200)
+        card = response.json()
+
+        rows = list(
+            HoleResult.objects.filter(entry_id=result.entry_id).order_by("round_number", "hole_number")
+        )
+        holes = [hole for rnd in card["rounds"] for hole in rnd["holes"]]
+        self.assertEqual(
+            [(h["hole_number"], h["par"], h["strokes"], h["to_par"]) for h in holes],
+            [(r.hole_number, r.par, r.strokes, r.to_par) for r in rows],
+        )
+        self.assertEqual(set(holes[0]["stats"]), set(HoleResult.STAT_FIELDS))
+        for rnd in card["rounds"]:
+            self.assertEqual(rnd["strokes"], sum(h["strokes"] for h in rnd["holes"]))
+            self.assertEqual(rnd["to_par"], sum(h["to_par"] for h in rnd["holes"]))
+        self.assertEqual(
+            card["to_par"], HoleResult.objects.filter(entry_id=result.entry_id).aggregate(t=Sum("to_par"))["t"]
+        )
+
+    def test_conditional_get(self):
+        entry = TournamentEntry.objects.filter(tournament_id=self.tournament_id).first()
+        first = self.client.get(self.url(entry.id))
+        self.assertEqual(self.client.get(self.url(entry.id), HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+
+        tick(self.client, self.tournament_id, 30)
+        self.assertEqual(self.client.get(self.url(entry.id), HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 200)
+
+    def test_entry_of_another_tournament_is_404(self):
+        other_id = create_tournament(self.client, self.course, golfer_count=8)
+        entry = TournamentEntry.objects.filter(tournament_id=other_id).first()
+        self.assertEqual(self.client.get(self.url(entry.id)).status_code, 404)
+        self.assertEqual(self.client.get(self.url(entry.id, tournament_id=other_id)).status_code, 200)
@@ -0,0 +1,84 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.tournaments.models import HoleResult
+from apps.tournaments.services.stats import STAT_SORTS
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers, tick
+
+
+def pct(hits, total):
+    return round(100.0 * hits / total, 1) if total else None
+
+
+class StatLeadersTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(12)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament_id = create_tournament(self.client, self.course, humans=[{"name": "Me", "country": "CAN"}])
+        for _ in range(3):
+            tick(self.client, self.tournament_id, 60)
+        self.url = f"/api/tournaments/{self.tournament_id}/stats/"
+
+    def expected(self, round_number=None):
+        # The same numbers, computed in Python from the hole rows
+        results = HoleResult.objects.filter(entry__tournament_id=self.tournament_id, gir__isnull=False)
+        if round_number is not None:
+            results = results.filter(round_number=round_number)
+        per_entry = {}
+        for r in results:
+            per_entry.setdefault(r.entry_id, []).append(r)
+
+        table = {}
+        for entry_id, rows in per_entry.items():
+            driving = [r for r in rows if r.fir is not None]
+            table[entry_id] = {
+                "holes": len(rows),
+                "fir_pct": pct(sum(r.fir for r in driving), len(driving)),
+                "gir_pct": pct(sum(r.gir for r in rows), len(rows)),
+                "putts_per_round": round(18.0 * sum(r.putts for r in rows) / len(rows), 1),
+                "avg_drive": round(sum(r.drive_distance for r in driving) / len(driving), 1) if driving else None,
+            }
+        return table
+
+    def test_aggregates_match_hole_rows(self):
+        response = self.client.get(self.url, {"sort": "putts"})
+        self.assertEqual(response.status_code, 200)
+        columns = response.json()["columns"]
+
+        expected = self.expected()
+        self.assertTrue(expected)
+        self.assertEqual(sorted(columns["id"]), sorted(expected))
+        for i, entry_id in enumerate(columns["id"]):
+            for stat in ("holes", *(stat for stat, _ in STAT_SORTS.values())):
+                self.assertAlmostEqual(columns[stat][i], expected[entry_id][stat], delta=0.05, msg=stat)
+
+        # putts: lower is better
+        self.assertEqual(columns["putts_per_round"], sorted(columns["putts_per_round"]))
+
+    def test_round_filter_and_human_rows(self):
+        response = self.client.get(self.url, {"round": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sorted(response.json()["columns"]["id"]), sorted(self.expected(1)))
+
+        # Human-entered holes carry no stats and are left out
+        human_ids = set(
+            HoleResult.objects.filter(entry__tournament_id=self.tournament_id, entry__is_human=True).values_list(
+                "entry_id", flat=True
+            )
+        )
+        self.assertFalse(human_ids & set(response.json()["columns"]["id"]))
+
+    def test_bad_params_and_etags(self):
+        for params in ({"round": 0}, {"round": "x"}, {"sort": "eagles"}):
+            self.assertEqual(self.client.get(self.url, params).status_code, 400, params)
+
+        all_rounds = self.client.get(self.url)
+        round_one = self.client.get(self.url, {"round": 1})
+        self.assertNotEqual(all_rounds["ETag"], round_one["ETag"])
+
+        again = self.client.get(self.url, HTTP_IF_NONE_MATCH=all_rounds["ETag"])
+        self.assertEqual(again.status_code, 304)
@@ -0,0 +1,98 @@
+import asyncio
+import json
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import AsyncClient, TestCase
+from rest_framework.test import APIClient
+
+from apps.tournaments import streams
+from apps.tournaments.models import Tournament
+from apps.tournaments.tests.factories import create_tournament, make_course, make_golfers, tick
+
+
+def parse_frame(frame: bytes) -> dict:
+    fields = {}
+    for line in frame.decode().strip().splitlines():
+        name, _, value = line.partition(": ")
+        fields[name] = value
+    if "data" in fields:
+        fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+class TournamentStreamTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.course = make_course()
+        make_golfers(8)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.tournament_id = create_tournament(self.client, self.course, golfer_count=8)
+        self.url = f"/api/tournaments/{self.tournament_id}/stream/"
+
+    async def open_stream(self, **headers):
+        response = await AsyncClient().get(self.url, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        return response, aiter(response.streaming_content)
+
+    async def version(self):
+        return await Tournament.objects.filter(pk=self.tournament_id).values_list("version", flat=True).afirst()
+
+    async def test_catch_up_frame_is_current_version(self):
+        since = await self.version()
+        for _ in range(2):
+            await sync_to_async(tick)(self.client, self.tournament_id, 30)
+        current = await self.version()
+
+        response, frames = await self.open_stream(**{"Last-Event-ID": str(since)})
+        try:
+            frame = parse_frame(await asyncio.wait_for(anext(frames), 5))
+        finally:
+            await response.streaming_content.aclose()
+
+        self.assertEqual(frame["event"], "changes")
+        self.assertEqual(int(frame["id"]), current)
+        self.assertEqual((frame["data"]["since"], frame["data"]["version"]), (since, current))
+        self.assertTrue(frame["data"]["hole_results"])
+
+    async def test_publish_wakes_the_stream(self):
+        since = await self.version()
+        response, frames = await self.open_stream()
+        try:
+            pending = asyncio.ensure_future(anext(frames))
+            await asyncio.sleep(0.1)  # let the stream subscribe
+            self.assertFalse(pending.done())
+
+            await sync_to_async(tick)(self.client, self.tournament_id, 30)
+            frame = parse_frame(await asyncio.wait_for(pending, 5))
+        finally:
+            await response.streaming_content.aclose()
+
+        self.assertEqual(int(frame["id"]), await self.version())
+        self.assertEqual(frame["data"]["since"], since)
+
+    async def test_idle_stream_sends_keepalive(self):
+        with mock.patch.object(streams, "HEARTBEAT_SECONDS", 0.05):
+            response, frames = await self.open_stream()
+            try:
+                self.assertEqual(await asyncio.wait_for(anext(frames), 5), b": ping\n\n")
+            finally:
+                await response.streaming_content.aclose()
+
+    async def test_unknown_tournament_is_404(self):
+        response = await AsyncClient().get("/api/tournaments/999999/stream/")
+        self.assertEqual(response.status_code, 404)
+
+    async def test_failed_build_is_not_left_in_flight(self):
+        with mock.patch.object(streams, "_wait_payload", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                await streams._shared_payload(self.tournament_id, 0, "changes")
+        self.assertEqual(streams._building, {})
+
+        # The next waiter builds afresh instead of awaiting the dead future
+        body = await streams._shared_payload(self.tournament_id, 0, "changes")
+        self.assertEqual(json.loads(body)["since"], 0)
+        self.assertEqual(streams._building, {})
@@ -1,4 +1,6 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
+from apps.tournaments.streams import tournament_stream, tournament_wait
 from apps.tournaments.views import TournamentViewSet, HistoryViewSet, SeasonViewSet
 
 router = DefaultRouter()
@@ -6,4 +8,7 @@ router.register(r"tournaments", TournamentViewSet, basename="tournament")
 router.register(r"history", HistoryViewSet, basename="history")
 router.register(r"seasons", SeasonViewSet, basename="season")
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("tournaments/<int:pk>/stream/", tournament_stream, name="tournament-stream"),
+    path("tournaments/<int:pk>/wait/", tournament_wait, name="tournament-wait"),
+] + router.urls
@@ -1,41 +1,240 @@
-from django.db import models
-from django.db.models import Sum, Q, Value, IntegerField
+from django.db import models, transaction
+from django.core.cache import cache, caches
+from django.db.models import Sum, Q, Value, IntegerField, Count
 from django.db.models.functions import Coalesce
 from django.utils import timezone
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils.dateparse import parse_datetime
+from django.utils.http import parse_etags
 
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from apps.courses.models import Hole, Course
-from apps.tournaments.models import Tournament, HoleResult, TournamentEvent, Season, TournamentEntry
-from apps.tournaments.serializers import TournamentSerializer, TournamentCreateSerializer, SeasonSerializer
+from apps.tournaments.models import (
+    Tournament,
+    HoleResult,
+    TournamentEvent,
+    Season,
+    TournamentEntry,
+    EntryRound,
+    Group,
+    GroupMember,
+)
+from apps.tournaments.serializers import (
+    TournamentSerializer,
+    TournamentSummarySerializer,
+    NormalizedTournamentSerializer,
+    TournamentCreateSerializer,
+    TournamentEventSerializer,
+    HOLE_DETAIL_MODES,
+    SeasonSerializer,
+)
+from apps.tournaments.pagination import EventCursorPagination, TournamentCursorPagination
+from apps.tournaments.services.changes import changes_since
 from apps.tournaments.services.pace import minutes_for_hole
+from apps.tournaments.services.export import aiter_sync, stream_tournament_json
+from apps.tournaments.services.leaderboard import build_leaderboard
+from apps.tournaments.services.live import publish_changes
+from apps.tournaments.services.match_play import calculate_match_probabilities
+from apps.tournaments.services.prob_history import probability_history, record_snapshot
+from apps.tournaments.services.rounds import refresh_entry_round
 from apps.tournaments.services.routing import next_hole
+from apps.tournaments.services.scorecard import build_scorecard
+from apps.tournaments.services.stats import STAT_SORTS, stat_leaders
 from apps.tournaments.services.scoring import simulate_strokes_for_entry, simulate_strokes_for_entry_with_stats
-from apps.tournaments.services.probability import calculate_win_probabilities
+from apps.tournaments.services.probability import (
+    calculate_finish_distribution,
+    calculate_head_to_head,
+    win_probabilities_from_distribution,
+)
 
 
 class TournamentViewSet(viewsets.ModelViewSet):
-    queryset = (
-        Tournament.objects.all()
-        .prefetch_related(
-            "entries",
-            "entries__hole_results",
-            "groups",
+    queryset = Tournament.objects.all()
+    serializer_class = TournamentSerializer
+    pagination_class = TournamentCursorPagination
+
+    # Actions that play holes: they walk groups -> members -> entry -> golfer
+    # and read everything else through aggregates, so hole results stay out.
+    SIMULATION_ACTIONS = ("tick", "sim_to_tee", "sim_to_end_of_day")
+
+    def get_queryset(self):
+        if self.action == "list":
+            return self._summary_queryset()
+        if self.action == "retrieve":
+            return self._payload_queryset()
+        if self.action in self.SIMULATION_ACTIONS:
+            return (
+                Tournament.objects.select_related("course")
+                .prefetch_related("groups__members__entry__golfer")
+            )
+        return Tournament.objects.all()
+
+    def _summary_queryset(self):
+        """
+        Summary rows for the list, filtered by `?status=` (comma separated)
+        and `?season=` (an id, or `none` for standalone events).
+        """
+        leader = (
+            TournamentEntry.objects.filter(tournament=models.OuterRef("pk"), position=1)
+            .order_by("id")
+            .values("display_name")[:1]
+        )
+        qs = (
+            Tournament.objects.select_related("course")
+            .annotate(entry_count=Count("entries"), leader=models.Subquery(leader))
+        )
+
+        params = self.request.query_params
+        if params.get("status"):
+            qs = qs.filter(status__in=params["status"].split(","))
+        season = params.get("season")
+        if season == "none":
+            qs = qs.filter(season__isnull=True)
+        elif season and season.isdigit():
+            qs = qs.filter(season_id=int(season))
+        return qs
+
+    def _payload_queryset(self):
+        """
+        Prefetches for serializing full tournament payloads. Entries load
+        their golfer (overall_rating) and hole results once; the nested shape
+        needs them again under group members, the normalized shape only
+        needs member entry ids. `?holes=strokes` skips the stat columns and
+        `?holes=none` skips hole results altogether.
+        """
+        holes = self._hole_detail()
+        entries = TournamentEntry.objects.select_related("golfer")
+        if holes == "full":
+            entries = entries.prefetch_related("hole_results")
+        elif holes == "strokes":
+            entries = entries.prefetch_related(
+                models.Prefetch("hole_results", queryset=HoleResult.objects.defer(*HoleResult.STAT_FIELDS))
+            )
+        qs = Tournament.objects.prefetch_related(
+            models.Prefetch("entries", queryset=entries),
             "groups__members",
-            "groups__members__entry",
-            "groups__members__entry__golfer",
-            "groups__members__entry__hole_results", # Ensure stats are loaded for sidebar
         )
-    )
-    serializer_class = TournamentSerializer
+        if not self._wants_normalized():
+            qs = qs.prefetch_related(models.Prefetch("groups__members__entry", queryset=entries))
+        return qs
 
     def get_serializer_class(self):
         if self.action == "create":
             return TournamentCreateSerializer
+        if self.action == "list":
+            return TournamentSummarySerializer
+        if self._wants_normalized():
+            return NormalizedTournamentSerializer
         return TournamentSerializer
 
+    def _wants_normalized(self):
+        """
+        `?shape=normalized` returns entries once, keyed by id, with groups
+        referencing entry ids instead of embedding them again.
+        """
+        request = getattr(self, "request", None)
+        return request is not None and request.query_params.get("shape") == "normalized"
+
+    def _hole_detail(self):
+        """
+        `?holes=` picks how much hole-level detail entries embed: `full`
+        (default, with stats), `strokes` (scores only) or `none`. Clients
+        that drop it load one card at a time from the scorecard action.
+        """
+        request = getattr(self, "request", None)
+        holes = request.query_params.get("holes") if request is not None else None
+        return holes if holes in HOLE_DETAIL_MODES else "full"
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["holes"] = self._hole_detail()
+        return context
+
+    def _payload_kind(self):
+        # Part of the ETag and response cache key: one per representation
+        kind = "normalized" if self._wants_normalized() else "full"
+        holes = self._hole_detail()
+        return kind if holes == "full" else f"{kind}-{holes}"
+
+    def _tournament_payload(self, tournament):
+        context = {"holes": self._hole_detail()}
+        if self._wants_normalized():
+            return NormalizedTournamentSerializer(tournament, context=context).data
+        return TournamentSerializer(tournament, context=context).data
+
+    def _not_modified(self, request, pk, kind):
+        """
+        Conditional GET on the tournament version. Returns (etag, response):
+        a 304 response when If-None-Match already names the current version.
+        Costs a single primary-key lookup either way.
+        """
+        version = Tournament.objects.filter(pk=pk).values_list("version", flat=True).first()
+        if version is None:
+            raise Http404
+        etag = f'W/"t{pk}-{kind}-v{version}"'
+        client_etags = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag in client_etags or "*" in client_etags:
+            return etag, Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return etag, None
+
+    def _cached_render(self, request, etag, build):
+        """
+        Rendered JSON from the shared response cache, keyed by the ETag
+        (tournament id, representation, version) so a version bump is the
+        invalidation. A hit skips the ORM and the serializer entirely.
+        `build()` returns (data, finished); finished tournaments go to the
+        "pinned" cache without a timeout, out of reach of live churn (still
+        capped, see settings.PINNED_CACHE_MAX_ENTRIES).
+        """
+        if request.accepted_renderer.format != "json":
+            data, _ = build()  # browsable API: nothing worth caching
+            return Response(data, headers={"ETag": etag})
+
+        key = f"tournament:response:{etag}"
+        pinned = caches["pinned"]
+        body = cache.get(key)
+        if body is None:
+            body = pinned.get(key)
+        if body is None:
+            data, finished = build()
+            body = request.accepted_renderer.render(data, request.accepted_media_type, self.get_renderer_context())
+            if finished:
+                pinned.set(key, body, None)
+            else:
+                cache.set(key, body, settings.RESPONSE_CACHE_TTL)
+
+        response = HttpResponse(body, content_type=request.accepted_media_type)
+        response["ETag"] = etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        etag, not_modified = self._not_modified(request, kwargs["pk"], self._payload_kind())
+        if not_modified:
+            return not_modified
+
+        def build():
+            tournament = self.get_object()
+            return self.get_serializer(tournament).data, tournament.status == "finished"
+
+        return self._cached_render(request, etag, build)
+
+    def perform_update(self, serializer):
+        self._publish(serializer.save())
+
+    def _publish(self, tournament):
+        """
+        Bump the version (publishing changed rows) and push the delta to
+        live subscribers. Call once at the end of every mutating path.
+        """
+        since = tournament.version
+        tournament.bump_version()
+        publish_changes(tournament, since)
+
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -64,7 +263,8 @@ class TournamentViewSet(viewsets.ModelViewSet):
         tournament.round_conditions = conditions
         tournament.save(update_fields=["round_conditions"])
 
-        return Response(TournamentSerializer(tournament).data, status=status.HTTP_201_CREATED)
+        tournament = self._payload_queryset().get(pk=tournament.pk)
+        return Response(self._tournament_payload(tournament), status=status.HTTP_201_CREATED)
 
     def _archive_match_results(self, tournament):
         """
@@ -74,7 +274,14 @@ class TournamentViewSet(viewsets.ModelViewSet):
         holes_map = {h.number: h for h in Hole.objects.filter(course=tournament.course)}
         
         results = []
-        
+
+        # All scores for the session in one query: entry_id -> {hole: strokes}
+        scores = {}
+        for entry_id, hole_num, strokes in HoleResult.objects.filter(
+            entry__tournament=tournament, round_number=tournament.current_round
+        ).values_list("entry_id", "hole_number", "strokes"):
+            scores.setdefault(entry_id, {})[hole_num] = strokes
+
         for group in tournament.groups.all():
             members = list(group.members.all())
             if not members:
@@ -84,9 +291,6 @@ class TournamentViewSet(viewsets.ModelViewSet):
             # In Four-Ball (4 members): 2 USA, 2 EUR
             # In Singles (2 members): 1 USA, 1 EUR
             
-            # Prefetched entries might not return hole_results properly if generic prefetch
-            # But we added it in queryset
-            
             usa_entries = [m.entry for m in members if m.entry.team == 'USA']
             eur_entries = [m.entry for m in members if m.entry.team != 'USA']
             
@@ -99,16 +303,9 @@ class TournamentViewSet(viewsets.ModelViewSet):
             
             # Helper to get best score for a side on a hole
             def get_best_score(entries, hole_num):
-                best = 999
-                # Need to fetch hole result from DB or via prefetch
-                scores = []
-                for e in entries:
-                     # Access pre-fetched hole_results (filtered by round?? No, contains all)
-                     # We need to filter manually in Python
-                     hr = next((r for r in e.hole_results.all() if r.hole_number == hole_num and r.round_number == tournament.current_round), None)
-                     if hr:
-                         scores.append(hr.strokes)
-                return min(scores) if scores else None
+                side = [scores.get(e.id, {}).get(hole_num) for e in entries]
+                side = [s for s in side if s is not None]
+                return min(side) if side else None
 
             processed_holes = 0
             # Iterate 1..18
@@ -169,8 +366,10 @@ class TournamentViewSet(viewsets.ModelViewSet):
                 last_score = score
                 last_cut = is_cut
             
-            e.position = rank
-            e.save(update_fields=["position"])
+            # Only write (and mark changed for delta sync) rows that moved
+            if e.position != rank:
+                e.position = rank
+                e.save(update_fields=["position"])
 
     def _reseed_groups(
         self,
@@ -216,10 +415,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
         if invert_split:
             # Sort by PRIOR rounds cumulative strokes: worst first => earliest tee, best last => leaders last.
             prior_total = Coalesce(
-                Sum(
-                    "hole_results__strokes",
-                    filter=Q(hole_results__round_number__lt=tournament.current_round),
-                ),
+                Sum("rounds__strokes", filter=Q(rounds__round_number__lt=tournament.current_round)),
                 Value(10_000),
                 output_field=IntegerField(),
             )
@@ -257,10 +453,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
         elif leaders_last:
             # Sort by PRIOR rounds cumulative strokes: worst first => earliest tee, best last => leaders last.
             prior_total = Coalesce(
-                Sum(
-                    "hole_results__strokes",
-                    filter=Q(hole_results__round_number__lt=tournament.current_round),
-                ),
+                Sum("rounds__strokes", filter=Q(rounds__round_number__lt=tournament.current_round)),
                 Value(10_000),
                 output_field=IntegerField(),
             )
@@ -365,7 +558,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
                     g.save(update_fields=["tee_time", "next_action_time"])
 
         # reset per-round display fields for the new round
-        tournament.entries.update(thru_hole=0, total_strokes=0, position=None)
+        tournament.entries.update(thru_hole=0, total_strokes=0, position=None, version=None)
 
     def _apply_cut(self, tournament: Tournament):
         """
@@ -373,10 +566,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
         """
         totals = (
             tournament.entries.annotate(
-                r12_total=Sum(
-                    "hole_results__strokes",
-                    filter=models.Q(hole_results__round_number__in=[1, 2]),
-                )
+                r12_total=Sum("rounds__strokes", filter=models.Q(rounds__round_number__in=[1, 2]))
             )
             .order_by("r12_total", "id")
         )
@@ -413,29 +603,13 @@ class TournamentViewSet(viewsets.ModelViewSet):
         if tournament.current_round > 2:
             return
         
-        # We need par map
-        holes = Hole.objects.filter(course=tournament.course).order_by('number')
-        par_map = {h.number: h.par for h in holes}
-
-        results = HoleResult.objects.filter(entry__tournament=tournament).values('entry_id', 'strokes', 'hole_number')
-        
-        # Group in Python to avoid complex DB aggregations involving mapped par
-        # entry_id -> {strokes: 0, par: 0}
-        player_scores = {}
-        
-        for hr in results:
-            eid = hr['entry_id']
-            if eid not in player_scores:
-                player_scores[eid] = {"strokes": 0, "par": 0}
-            
-            player_scores[eid]["strokes"] += hr['strokes']
-            player_scores[eid]["par"] += par_map.get(hr['hole_number'], 4)
-            
-        # Calculate to_par list
-        to_par_list = []
-        for eid, data in player_scores.items():
-            to_par = data["strokes"] - data["par"]
-            to_par_list.append(to_par)
+        # Score to par of everyone who has played a hole, from EntryRound
+        to_par_list = list(
+            EntryRound.objects.filter(entry__tournament=tournament)
+            .values("entry_id")
+            .annotate(to_par=Sum("to_par"))
+            .values_list("to_par", flat=True)
+        )
             
         if not to_par_list:
             return
@@ -457,24 +631,44 @@ class TournamentViewSet(viewsets.ModelViewSet):
             tournament.save(update_fields=["projected_cut_score"])
 
 
+    def _update_live_probs(self, tournament: Tournament):
+        """
+        Refresh every probability market from a single batch of draws.
+        `live_win_probs` keeps its {entry_id: P(win)} shape for existing clients.
+        Match play has no individual stroke ranking; it gets match/team odds instead.
+        """
+        if tournament.format == "match":
+            tournament.live_match_probs = calculate_match_probabilities(tournament)
+            tournament.save(update_fields=["live_match_probs"])
+            return
+
+        distribution = calculate_finish_distribution(tournament)
+        tournament.live_rank_probs = distribution
+        tournament.live_win_probs = win_probabilities_from_distribution(distribution)
+        tournament.save(update_fields=["live_win_probs", "live_rank_probs"])
+        record_snapshot(tournament, distribution)
+
     def _update_entry_totals(self, entry, round_number: int):
         """
         Updates:
         - total_strokes for the given round
         - tournament_strokes cumulative across all rounds
         Does NOT blindly advance thru_hole (caller decides that).
+        Refreshes the entry's EntryRound in the same transaction.
         """
-        entry.total_strokes = (
-            HoleResult.objects.filter(entry=entry, round_number=round_number)
-            .aggregate(models.Sum("strokes"))["strokes__sum"]
-            or 0
-        )
-        entry.tournament_strokes = (
-            HoleResult.objects.filter(entry=entry)
-            .aggregate(models.Sum("strokes"))["strokes__sum"]
-            or 0
-        )
-        entry.save(update_fields=["total_strokes", "tournament_strokes", "thru_hole"])
+        with transaction.atomic():
+            rounds = refresh_entry_round(entry, round_number)
+            entry.total_strokes = next((r.strokes for r in rounds if r.round_number == round_number), 0)
+            entry.tournament_strokes = sum(r.strokes for r in rounds)
+            entry.save(update_fields=["total_strokes", "tournament_strokes", "thru_hole"])
+
+    def _course_pars(self, tournament_id: int) -> dict[int, int]:
+        # Hole -> par for the tournament's course, loaded once per request
+        # (stamped on human-submitted hole results)
+        pars = getattr(self, "_pars", None)
+        if pars is None or pars[0] != tournament_id:
+            pars = self._pars = (tournament_id, dict(Hole.objects.filter(course__tournament=tournament_id).values_list("number", "par")))
+        return pars[1]
 
     @action(detail=True, methods=["post"], url_path="sim-to-end-of-day")
     def sim_to_end_of_day(self, request, pk=None):
@@ -512,8 +706,9 @@ class TournamentViewSet(viewsets.ModelViewSet):
                 break
                 
             safety += 1
-            
-        return Response(TournamentSerializer(tournament).data)
+
+        tournament = self._payload_queryset().get(pk=tournament.pk)
+        return Response(self._tournament_payload(tournament))
 
     @action(detail=True, methods=["post"], url_path="sim-to-tee")
     def sim_to_tee(self, request, pk=None):
@@ -535,8 +730,8 @@ class TournamentViewSet(viewsets.ModelViewSet):
         
         if human_group.tee_time <= tournament.current_time:
             # Already at or past tee time
-            tournament = self.get_queryset().get(pk=tournament.pk)
-            return Response(TournamentSerializer(tournament).data)
+            tournament = self._payload_queryset().get(pk=tournament.pk)
+            return Response(self._tournament_payload(tournament))
         
         # Calculate minutes to advance
         time_diff = human_group.tee_time - tournament.current_time
@@ -598,7 +793,8 @@ class TournamentViewSet(viewsets.ModelViewSet):
                         defaults={
                             "strokes": simulate_strokes_for_entry(
                                 entry, hole, tournament.current_round
-                            )
+                            ),
+                            "par": hole.par,
                         },
                     )
 
@@ -677,17 +873,17 @@ class TournamentViewSet(viewsets.ModelViewSet):
         self._recompute_positions(tournament)
 
         # Update Win Probabilities
-        probs = calculate_win_probabilities(tournament)
-        tournament.live_win_probs = probs
-        tournament.save(update_fields=["live_win_probs"])
+        self._update_live_probs(tournament)
+
+        self._publish(tournament)
 
         # re-fetch with prefetch
-        tournament = self.get_queryset().get(pk=tournament.pk)
-        return Response(TournamentSerializer(tournament).data)
+        tournament = self._payload_queryset().get(pk=tournament.pk)
+        return Response(self._tournament_payload(tournament))
 
     @action(detail=True, methods=["post"])
     def tick(self, request, pk=None):
-        # Use prefetched queryset explicitly to avoid N+1 surprises
+        # Simulation prefetch (groups/members/golfers) to avoid N+1 surprises
         tournament = self.get_queryset().get(pk=pk)
 
         minutes = int(request.data.get("minutes", 11))
@@ -750,6 +946,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
                         hole_number=hole_num,
                         defaults={
                             "strokes": strokes,
+                            "par": hole.par,
                             "stats": stats
                         },
                     )
@@ -897,9 +1094,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
              self._update_projected_cut(tournament)
 
         # Update Win Probabilities live
-        probs = calculate_win_probabilities(tournament)
-        tournament.live_win_probs = probs
-        tournament.save(update_fields=["live_win_probs"])
+        self._update_live_probs(tournament)
 
         # rollover + cut
         all_finished = tournament.groups.filter(is_finished=False).count() == 0
@@ -955,9 +1150,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
                 self._recompute_positions(tournament)
                 
                 # Update Win Probabilities at end of round
-                probs = calculate_win_probabilities(tournament)
-                tournament.live_win_probs = probs
-                tournament.save(update_fields=["live_win_probs"])
+                self._update_live_probs(tournament)
 
             else:
                 # End of Regulation (Round 4 or Match Play end)
@@ -987,9 +1180,11 @@ class TournamentViewSet(viewsets.ModelViewSet):
                     tournament.status = "finished"
                     tournament.save(update_fields=["status"])
 
+        self._publish(tournament)
+
         # re-fetch to avoid stale prefetch caches after reseeding
-        tournament = self.get_queryset().get(pk=tournament.pk)
-        return Response(TournamentSerializer(tournament).data)
+        tournament = self._payload_queryset().get(pk=tournament.pk)
+        return Response(self._tournament_payload(tournament))
 
     @action(detail=True, methods=["post"], url_path="shuffle-pairings")
     def shuffle_pairings(self, request, pk=None):
@@ -1046,9 +1241,222 @@ class TournamentViewSet(viewsets.ModelViewSet):
             if p2: GroupMember.objects.create(group=g, entry=p2)
             
             pair_idx += 1
-            
+
+        # Membership changed: publish these groups in the next delta
+        Group.objects.filter(pk__in=[g.pk for g in groups]).update(version=None)
+        self._publish(tournament)
         return Response({"status": "shuffled"})
 
+    @action(detail=True, methods=["get"])
+    def leaderboard(self, request, pk=None):
+        """
+        Compact, column-oriented leaderboard for polling clients:
+        parallel arrays of id, name, position, to-par, thru, today and
+        win probability, with per-round totals instead of hole rows.
+        """
+        etag, not_modified = self._not_modified(request, pk, "leaderboard")
+        if not_modified:
+            return not_modified
+
+        def build():
+            tournament = Tournament.objects.select_related("course").get(pk=pk)
+            return build_leaderboard(tournament), tournament.status == "finished"
+
+        return self._cached_render(request, etag, build)
+
+    @action(detail=True, methods=["get"], url_path=r"entries/(?P<entry_id>\d+)/scorecard")
+    def scorecard(self, request, pk=None, entry_id=None):
+        """
+        One entry's rounds, hole by hole, with stats and commentary. Pairs
+        with `?holes=strokes|none` on the tournament payload so polling
+        clients only pull the card that is actually open.
+        """
+        etag, not_modified = self._not_modified(request, pk, f"scorecard{entry_id}")
+        if not_modified:
+            return not_modified
+
+        entry = (
+            TournamentEntry.objects.select_related("tournament__course")
+            .filter(tournament_id=pk, pk=entry_id)
+            .first()
+        )
+        if entry is None:
+            raise Http404
+        return Response(build_scorecard(entry), headers={"ETag": etag})
+
+    @action(detail=True, methods=["get"], url_path="stats")
+    def stat_leaders(self, request, pk=None):
+        """
+        Field-wide shot stats (FIR %, GIR %, putts per round, driving
+        distance) aggregated in SQL. `?round=` limits it to one round,
+        `?sort=gir|fir|putts|drive_distance` picks the ranking.
+        """
+        sort = request.query_params.get("sort", "gir")
+        if sort not in STAT_SORTS:
+            return Response(
+                {"error": f"sort must be one of {', '.join(STAT_SORTS)}"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        round_number = request.query_params.get("round")
+        if round_number is not None:
+            if not round_number.isdigit() or int(round_number) < 1:
+                return Response({"error": "round must be a positive integer"}, status=status.HTTP_400_BAD_REQUEST)
+            round_number = int(round_number)
+
+        scope = "all" if round_number is None else round_number
+        etag, not_modified = self._not_modified(request, pk, f"stats-r{scope}-{sort}")
+        if not_modified:
+            return not_modified
+
+        def build():
+            tournament = Tournament.objects.get(pk=pk)
+            return stat_leaders(tournament, round_number, sort), tournament.status == "finished"
+
+        return self._cached_render(request, etag, build)
+
+    @action(detail=True, methods=["get"])
+    def events(self, request, pk=None):
+        """
+        The tournament's event feed, newest first, keyset paginated:
+        follow `next` (an `?after=` cursor) for older events.
+        `?min_importance=` (1-4) keeps only birdies and up, eagles and up...
+        """
+        qs = TournamentEvent.objects.filter(tournament_id=pk)
+        min_importance = request.query_params.get("min_importance")
+        if min_importance:
+            try:
+                qs = qs.filter(importance__gte=int(min_importance))
+            except ValueError:
+                return Response({"error": "min_importance must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+
+        paginator = EventCursorPagination()
+        page = paginator.paginate_queryset(qs, request, view=self)
+        if not page and not Tournament.objects.filter(pk=pk).exists():
+            raise Http404
+        return paginator.get_paginated_response(TournamentEventSerializer(page, many=True).data)
+
+    @action(detail=True, methods=["get"])
+    def export(self, request, pk=None):
+        """
+        The normalized tournament payload, streamed: entries and hole
+        results go out as they are read from server-side cursors, so memory
+        stays flat for any field size. `?download=1` adds an attachment
+        filename.
+        """
+        tournament = Tournament.objects.select_related("course").get(pk=pk)
+        content = stream_tournament_json(tournament)
+        if isinstance(request._request, ASGIRequest):
+            # Django would buffer a sync iterator whole under ASGI
+            content = aiter_sync(content)
+
+        response = StreamingHttpResponse(content, content_type="application/json")
+        if request.query_params.get("download"):
+            response["Content-Disposition"] = f'attachment; filename="tournament-{tournament.pk}.json"'
+        return response
+
+    @action(detail=True, methods=["get"])
+    def changes(self, request, pk=None):
+        """
+        Delta sync: hole results, entry totals/positions, group states,
+        events and probabilities published after `?since=<version>`.
+        Clients apply it to their last payload and keep the returned version.
+        """
+        try:
+            since = int(request.query_params["since"])
+        except (KeyError, ValueError):
+            return Response({"error": "since must be an integer version"}, status=status.HTTP_400_BAD_REQUEST)
+
+        tournament = Tournament.objects.select_related("course").get(pk=pk)
+        if since < 0 or since > tournament.version:
+            return Response(
+                {"error": f"since must be between 0 and {tournament.version}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(changes_since(tournament, since))
+
+    @action(detail=True, methods=["get"], url_path="head-to-head")
+    def head_to_head(self, request, pk=None):
+        """
+        P(row player beats column player) for the whole active field,
+        plus the sub-matrix for each group's members.
+        Cached until the tournament version changes.
+        """
+        tournament = Tournament.objects.select_related("course").get(pk=pk)
+
+        cache_key = f"tournament:{tournament.pk}:h2h:v{tournament.version}"
+        data = cache.get(cache_key)
+        if data is None:
+            data = calculate_head_to_head(tournament)
+
+            index = {entry_id: i for i, entry_id in enumerate(data["ids"])}
+            members = {}
+            for group_id, entry_id in (
+                GroupMember.objects.filter(group__tournament=tournament)
+                .order_by("group__tee_time", "group_id", "id")
+                .values_list("group_id", "entry_id")
+            ):
+                if str(entry_id) in index:
+                    members.setdefault(group_id, []).append(index[str(entry_id)])
+
+            data["groups"] = [
+                {
+                    "group_id": group_id,
+                    "ids": [data["ids"][i] for i in idx],
+                    "matrix": [[data["matrix"][a][b] for b in idx] for a in idx],
+                }
+                for group_id, idx in members.items()
+            ]
+            cache.set(cache_key, data, 60 * 60)
+
+        return Response(data)
+
+    @action(detail=True, methods=["get"], url_path="match-odds")
+    def match_odds(self, request, pk=None):
+        """
+        Compact Ryder Cup odds: per-match outcome probabilities and team
+        point distribution, as stored by the last tick. Clients can poll
+        this and only refetch the full tournament when `clock` moves.
+        """
+        tournament = Tournament.objects.only(
+            "id", "format", "status", "current_round", "current_time", "live_match_probs"
+        ).get(pk=pk)
+        if tournament.format != "match":
+            return Response({"error": "Not a match play tournament"}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "clock": tournament.current_time,
+            "status": tournament.status,
+            "current_round": tournament.current_round,
+            **(tournament.live_match_probs or {}),
+        })
+
+    @action(detail=True, methods=["get"], url_path="win-prob-history")
+    def win_prob_history(self, request, pk=None):
+        """
+        Win-probability time series for "odds over time" charts.
+
+        Query params:
+        - start / end: ISO datetimes on the tournament clock
+        - points: max snapshots returned, evenly downsampled (default 200)
+        - entries: comma-separated entry ids (default: current top 10)
+        """
+        tournament = Tournament.objects.get(pk=pk)
+
+        try:
+            points = max(2, min(1000, int(request.query_params.get("points", 200))))
+            entries = request.query_params.get("entries")
+            entry_ids = [int(e) for e in entries.split(",") if e] if entries else None
+        except ValueError:
+            return Response({"error": "points and entries must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = probability_history(
+            tournament,
+            start=parse_datetime(request.query_params.get("start", "") or "") or None,
+            end=parse_datetime(request.query_params.get("end", "") or "") or None,
+            points=points,
+            entry_ids=entry_ids,
+        )
+        return Response(data)
+
     @action(detail=True, methods=["post"], url_path="hole-result")
     def hole_result(self, request, pk=None):
         tournament = self.get_queryset().get(pk=pk)
@@ -1064,7 +1472,7 @@ class TournamentViewSet(viewsets.ModelViewSet):
             entry=entry,
             round_number=round_number,
             hole_number=hole_number,
-            defaults={"strokes": strokes},
+            defaults={"strokes": strokes, "par": self._course_pars(tournament.id).get(hole_number, 4)},
         )
 
         # Only advance thru_hole for that entry for that round
@@ -1074,12 +1482,12 @@ class TournamentViewSet(viewsets.ModelViewSet):
         self._recompute_positions(tournament)
 
         # Update Win Probabilities live
-        probs = calculate_win_probabilities(tournament)
-        tournament.live_win_probs = probs
-        tournament.save(update_fields=["live_win_probs"])
+        self._update_live_probs(tournament)
 
-        tournament = self.get_queryset().get(pk=tournament.pk)
-        return Response(TournamentSerializer(tournament).data)
+        self._publish(tournament)
+
+        tournament = self._payload_queryset().get(pk=tournament.pk)
+        return Response(self._tournament_payload(tournament))
 
 
 class HistoryViewSet(viewsets.ViewSet):
@@ -1095,7 +1503,7 @@ class HistoryViewSet(viewsets.ViewSet):
 
         for t in finished_tournaments:
             # Determine winners (handle ties)
-            winners_qs = t.entries.filter(position=1)
+            winners_qs = t.entries.filter(position=1).annotate(to_par=Coalesce(Sum("rounds__to_par"), 0))
             if not winners_qs.exists():
                 winner_names = "Abandoned"
                 score = 0
@@ -1112,13 +1520,7 @@ class HistoryViewSet(viewsets.ViewSet):
                 # Score info
                 first_winner = winner_objs[0]
                 score = first_winner.tournament_strokes
-                
-                # Calculate Par
-                # Need hole pars
-                holes = t.course.holes.all()
-                par_total = sum(h.par for h in holes) * t.current_round 
-                
-                to_par = score - par_total
+                to_par = first_winner.to_par
             
             history_list.append({
                 "id": t.id,
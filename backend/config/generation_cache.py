@@ -0,0 +1,59 @@
+import time
+
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from rest_framework.response import Response
+
+
+class GenerationCache:
+    """
+    Response cache for read APIs over data that rarely changes (the golfer
+    directory, the course catalog). Keys embed the namespace's current
+    generation, so `invalidate()` retires every cached response at once on
+    any cache backend, without scanning keys. The generation is seeded from
+    the clock so an evicted counter never comes back as a generation that
+    stale responses were stored under.
+
+    Entries have no timeout and live in their own cache alias ("catalog"),
+    so churn in the default cache can't cull them; past that alias's
+    MAX_ENTRIES a culled one is simply rebuilt.
+    """
+
+    def __init__(self, namespace: str, alias: str = "catalog"):
+        self.namespace = namespace
+        self.alias = alias
+        self.generation_key = f"{namespace}:generation"
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def generation(self) -> int:
+        return self.cache.get_or_set(self.generation_key, time.time_ns, None)
+
+    def invalidate(self, **kwargs) -> None:
+        # **kwargs so it can be connected as a signal receiver
+        try:
+            self.cache.incr(self.generation_key)
+        except ValueError:
+            self.cache.set(self.generation_key, time.time_ns(), None)
+
+    def watch(self, *models) -> None:
+        """Invalidate whenever one of `models` is saved or deleted."""
+        for model in models:
+            for name, signal in (("save", post_save), ("delete", post_delete)):
+                signal.connect(
+                    self.invalidate, sender=model, weak=False, dispatch_uid=f"{self.namespace}:{name}:{model._meta.label}"
+                )
+
+    def response(self, request, build) -> Response:
+        """
+        The cached data for this request's full URL (query string included),
+        or `build()`'s result, stored under the current generation.
+        """
+        key = f"{self.namespace}:{self.generation()}:{request.build_absolute_uri()}"
+        data = self.cache.get(key)
+        if data is None:
+            data = build()
+            self.cache.set(key, data, None)
+        return Response(data)
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import dj_database_url
 from pathlib import Path
 
@@ -40,6 +41,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    "config.middleware.CompressionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -111,6 +113,92 @@ USE_I18N = True
 USE_TZ = True
 
 
+# FAST_JSON=1 renders API responses with orjson (see config/renderers.py)
+FAST_JSON = os.environ.get("FAST_JSON", "0") == "1"
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "config.renderers.ORJSONRenderer" if FAST_JSON else "rest_framework.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+}
+
+# Cache (rendered tournament payloads keyed by version, head-to-head matrices).
+# "locmem" is per process; "file" shares entries across workers/processes.
+# Payloads of finished tournaments go to their own "pinned" cache so the
+# churn of live versions in "default" can't cull them. Pinning is still
+# best effort: past PINNED_CACHE_MAX_ENTRIES the oldest are culled too (and
+# locmem starts empty on every restart); a culled payload is rebuilt on the
+# next request. The golfer directory and course catalog responses
+# (config/generation_cache.py) live in "catalog": one entry per query
+# string, never expiring, so they get their own CATALOG_CACHE_MAX_ENTRIES
+# instead of competing with live payloads.
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "locmem")
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", "64"))
+PINNED_CACHE_MAX_ENTRIES = int(os.environ.get("PINNED_CACHE_MAX_ENTRIES", "256"))
+CATALOG_CACHE_MAX_ENTRIES = int(os.environ.get("CATALOG_CACHE_MAX_ENTRIES", "512"))
+if CACHE_BACKEND == "file":
+    CACHE_LOCATION = os.environ.get("CACHE_LOCATION", os.path.join(tempfile.gettempdir(), "golf-bot-sim-cache"))
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": CACHE_LOCATION,
+            "OPTIONS": {"MAX_ENTRIES": CACHE_MAX_ENTRIES},
+        },
+        "pinned": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": f"{CACHE_LOCATION}-pinned",
+            "OPTIONS": {"MAX_ENTRIES": PINNED_CACHE_MAX_ENTRIES},
+        },
+        "catalog": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": f"{CACHE_LOCATION}-catalog",
+            "OPTIONS": {"MAX_ENTRIES": CATALOG_CACHE_MAX_ENTRIES},
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "golf-bot-sim",
+            "OPTIONS": {"MAX_ENTRIES": CACHE_MAX_ENTRIES},
+        },
+        "pinned": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "golf-bot-sim-pinned",
+            "OPTIONS": {"MAX_ENTRIES": PINNED_CACHE_MAX_ENTRIES},
+        },
+        "catalog": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "golf-bot-sim-catalog",
+            "OPTIONS": {"MAX_ENTRIES": CATALOG_CACHE_MAX_ENTRIES},
+        },
+    }
+
+# Rendered payloads of live tournaments expire (newer versions supersede
+# them anyway); finished tournaments never change and are kept without a
+# timeout in the "pinned" cache.
+RESPONSE_CACHE_TTL = int(os.environ.get("RESPONSE_CACHE_TTL", "600"))
+
+# Win probability engine
+# "fast": normal approximation. "model": plays out remaining holes with the
+# scoring kernel on a process pool, bounded by WIN_PROB_TIME_BUDGET seconds.
+WIN_PROB_MODE = os.environ.get("WIN_PROB_MODE", "fast")
+WIN_PROB_TIME_BUDGET = float(os.environ.get("WIN_PROB_TIME_BUDGET", "2.0"))
+WIN_PROB_WORKERS = int(os.environ.get("WIN_PROB_WORKERS", "0")) or None
+
+# Live updates (SSE). The broker fans serialized frames out to subscribers;
+# the default is in-process, which is enough for a single ASGI server.
+# Any class with the same interface (see services/live.py) can be dropped in.
+LIVE_BROKER = os.environ.get("LIVE_BROKER", "apps.tournaments.services.live.LocalBroker")
+
+# Event retention (manage.py compact_events). Once a finished tournament's
+# events are EVENT_RETENTION_DAYS old, only the highlights (importance >=
+# EVENT_KEEP_IMPORTANCE) and the newest EVENT_KEEP_RECENT events are kept.
+EVENT_RETENTION_DAYS = int(os.environ.get("EVENT_RETENTION_DAYS", "30"))
+EVENT_KEEP_IMPORTANCE = int(os.environ.get("EVENT_KEEP_IMPORTANCE", "3"))
+EVENT_KEEP_RECENT = int(os.environ.get("EVENT_KEEP_RECENT", "50"))
+
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import path, include
 from django.http import JsonResponse
 
@@ -10,3 +11,6 @@ urlpatterns = [
     path("api/health/", health),
     path("api/", include("config.api_urls")),
 ]
+
+# Served only with DEBUG on; runserver did this implicitly, uvicorn doesn't
+urlpatterns += staticfiles_urlpatterns()
@@ -1,8 +1,9 @@
 const API_BASE = import.meta.env.VITE_API_BASE || 'http://localhost:8000/api'
 
-async function apiFetch(path, { method = 'GET', body, headers } = {}) {
+async function apiFetch(path, { method = 'GET', body, headers, cache } = {}) {
   const res = await fetch(`${API_BASE}${path}`, {
     method,
+    ...(cache ? { cache } : {}),
     headers: {
       'Content-Type': 'application/json',
       ...(headers || {}),
@@ -18,23 +19,66 @@ async function apiFetch(path, { method = 'GET', body, headers } = {}) {
   return res.json()
 }
 
+// Tournament payloads are requested normalized (each entry sent once, groups
+// reference entry ids) and expanded back to the nested shape pages use.
+function expandTournament(t) {
+  if (!t || Array.isArray(t.entries)) return t
+  const byId = t.entries || {}
+  return {
+    ...t,
+    entries: Object.values(byId),
+    groups: (t.groups || []).map((g) => ({
+      ...g,
+      members: (g.members || []).map((m) => ({ ...m, entry: byId[m.entry] })),
+    })),
+  }
+}
+
+// `holes` ('full' | 'strokes' | 'none') trims the per-hole detail entries
+// embed; pages that trim it load stats one card at a time with getScorecard.
+async function tournamentFetch(path, { holes, ...options } = {}) {
+  const params = new URLSearchParams({ shape: 'normalized', ...(holes ? { holes } : {}) })
+  return expandTournament(await apiFetch(`${path}?${params}`, options))
+}
+
 export const api = {
   listCourses: () => apiFetch('/courses/'),
   getCourse: (id) => apiFetch(`/courses/${id}/`),
-  listGolfers: () => apiFetch('/golfers/'),
-  listTournaments: () => apiFetch('/tournaments/'),
+  // Paginated directory: { count, next, previous, results }. params: page, page_size,
+  // min_overall, max_overall, country, active, ordering, fields
+  listGolfers: (params = {}) => apiFetch(`/golfers/?${new URLSearchParams(params)}`),
+  // Paginated summaries: { next, previous, results }. params: status, season, cursor
+  listTournaments: (params = {}) => apiFetch(`/tournaments/?${new URLSearchParams(params)}`),
   createTournament: (payload) => apiFetch('/tournaments/', { method: 'POST', body: payload }),
-  getTournament: (id) => apiFetch(`/tournaments/${id}/`),
-  tickTournament: (id, minutes = 11) =>
-    apiFetch(`/tournaments/${id}/tick/`, { method: 'POST', body: { minutes } }),
-  simToTee: (id) =>
-    apiFetch(`/tournaments/${id}/sim-to-tee/`, { method: 'POST' }),
-  shufflePairings: (id) =>
-    apiFetch(`/tournaments/${id}/shuffle-pairings/`, { method: 'POST' }),
-  submitHoleResult: (id, payload) =>
-    apiFetch(`/tournaments/${id}/hole-result/`, { method: 'POST', body: payload }),
-  simToEndOfDay: (id) =>
-    apiFetch(`/tournaments/${id}/sim-to-end-of-day/`, { method: 'POST' }),
+  // 'no-cache' revalidates with the ETag: unchanged tournaments come back 304
+  getTournament: (id, { holes } = {}) => tournamentFetch(`/tournaments/${id}/`, { cache: 'no-cache', holes }),
+  // One entry's rounds hole by hole, with stats and commentary; pairs with
+  // `{ holes: 'strokes' | 'none' }` on the tournament calls
+  getScorecard: (id, entryId) =>
+    apiFetch(`/tournaments/${id}/entries/${entryId}/scorecard/`, { cache: 'no-cache' }),
+  // Field-wide FIR/GIR/putts/driving table. params: round, sort (gir|fir|putts|drive_distance)
+  getStatLeaders: (id, params = {}) =>
+    apiFetch(`/tournaments/${id}/stats/?${new URLSearchParams(params)}`, { cache: 'no-cache' }),
+  // Server-sent events: a `changes` frame (delta + version) after every update
+  tournamentStreamUrl: (id) => `${API_BASE}/tournaments/${id}/stream/`,
+  // Long-poll fallback: resolves with the delta since `version`, or null if
+  // nothing changed before the server's timeout (204)
+  waitForChange: async (id, version) => {
+    const res = await fetch(`${API_BASE}/tournaments/${id}/wait/?version=${version}`)
+    if (res.status === 204) return null
+    if (!res.ok) throw new Error(`API GET wait failed: ${res.status} ${await res.text()}`)
+    return res.json()
+  },
+  tickTournament: (id, minutes = 11, { holes } = {}) =>
+    tournamentFetch(`/tournaments/${id}/tick/`, { method: 'POST', body: { minutes }, holes }),
+  simToTee: (id, { holes } = {}) =>
+    tournamentFetch(`/tournaments/${id}/sim-to-tee/`, { method: 'POST', holes }),
+  shufflePairings: (id, { holes } = {}) =>
+    tournamentFetch(`/tournaments/${id}/shuffle-pairings/`, { method: 'POST', holes }),
+  submitHoleResult: (id, payload, { holes } = {}) =>
+    tournamentFetch(`/tournaments/${id}/hole-result/`, { method: 'POST', body: payload, holes }),
+  simToEndOfDay: (id, { holes } = {}) =>
+    tournamentFetch(`/tournaments/${id}/sim-to-end-of-day/`, { method: 'POST', holes }),
   getHistory: () => apiFetch('/history/'),
   
   // Seasons
@@ -11,7 +11,7 @@ export default function CreateTournamentPage() {
   const navigate = useNavigate()
 
   const [courses, setCourses] = useState([])
-  const [golfers, setGolfers] = useState([])
+  const [golferTotal, setGolferTotal] = useState(0)
   const [loading, setLoading] = useState(true)
   const [err, setErr] = useState('')
 
@@ -44,12 +44,13 @@ export default function CreateTournamentPage() {
       ; (async () => {
         try {
           setLoading(true)
-          const [c, g] = await Promise.all([api.listCourses(), api.listGolfers()])
+          const [c, g] = await Promise.all([api.listCourses(), api.listGolfers({ page_size: 1, fields: 'id' })])
           if (!alive) return
           setCourses(c)
-          setGolfers(g)
+          // Only the size of the pool is needed here, not the golfer rows
+          setGolferTotal(g.count)
           setCourseId(String(c?.[0]?.id ?? ''))
-          setGolferCount(Math.min(3, g.length))
+          setGolferCount(Math.min(3, g.count))
         } catch (e) {
           setErr(e.message || String(e))
         } finally {
@@ -207,14 +208,14 @@ export default function CreateTournamentPage() {
                 <input
                   type="number"
                   min={0}
-                  max={golfers.length}
+                  max={golferTotal}
                   value={golferCount}
                   onChange={e => setGolferCount(Number(e.target.value))}
                   disabled={format.startsWith('match')} 
                   className={`w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-green-500 focus:border-green-500 outline-none transition-all ${format.startsWith('match') ? 'bg-gray-100 text-gray-500' : ''}`}
                 />
                 <p className="text-xs text-gray-500 mt-1">
-                    {format.startsWith('match') ? 'Fixed for Ryder Cup (Total 24 players)' : `Total available bots: ${golfers.length}`}
+                    {format.startsWith('match') ? 'Fixed for Ryder Cup (Total 24 players)' : `Total available bots: ${golferTotal}`}
                 </p>
               </div>
 
@@ -528,11 +528,17 @@ export default function RyderCupPage() {
   const [saving, setSaving] = useState(false)
 
   const [expandedMatchId, setExpandedMatchId] = useState(null)
+  const [odds, setOdds] = useState(null)
+  const clockRef = useRef(null)
+  const versionRef = useRef(null)
   
   const load = useCallback(async () => {
     try {
       const data = await api.getTournament(id)
       setTournament(data)
+      clockRef.current = `${data.current_time}|${data.status}`
+      versionRef.current = data.version
+      if (data.live_match_probs) setOdds(data.live_match_probs)
       if (data.course) {
         const c = await api.getCourse(data.course)
         setCourse(c)
@@ -544,11 +550,42 @@ export default function RyderCupPage() {
     }
   }, [id])
 
-  useEffect(() => {
-    load()
-    const timer = setInterval(load, 15000)
-    return () => clearInterval(timer)
+  // Apply a live delta: odds update in place; only refetch the full tournament when the clock moves
+  const applyDelta = useCallback((delta) => {
+    const t = delta.tournament
+    if (!t) return
+    if (t.live_match_probs) setOdds(t.live_match_probs)
+    if (`${t.current_time}|${t.status}` !== clockRef.current) load()
   }, [load])
+
+  useEffect(() => {
+    const ready = load()
+
+    // Server push when available; otherwise long-poll (one request per change)
+    if (typeof EventSource === 'undefined') {
+      let alive = true
+      ;(async () => {
+        await ready
+        while (alive) {
+          try {
+            const delta = await api.waitForChange(id, versionRef.current ?? 0)
+            if (!alive || !delta) continue
+            versionRef.current = delta.version
+            applyDelta(delta)
+          } catch (err) {
+            console.error(err)
+            await new Promise((resolve) => setTimeout(resolve, 15000))
+          }
+        }
+      })()
+      return () => { alive = false }
+    }
+
+    const source = new EventSource(api.tournamentStreamUrl(id))
+    source.addEventListener('changes', (ev) => applyDelta(JSON.parse(ev.data)))
+    source.addEventListener('resync', () => load())
+    return () => source.close()
+  }, [id, load, applyDelta])
   
   const tick = async () => {
       setSimulating(true)
@@ -788,11 +825,17 @@ export default function RyderCupPage() {
                      <div className="text-center">
                          <h2 className="text-5xl font-bold text-red-500 tabular-nums">{usaScore}</h2>
                          <span className="text-xs font-bold tracking-widest text-slate-400">USA (Proj)</span>
+                         {odds?.teams && (
+                           <div className="text-[10px] text-slate-500 tabular-nums">Win {(odds.teams.USA.win * 100).toFixed(0)}%</div>
+                         )}
                      </div>
                      <div className="text-2xl text-slate-600 font-serif italic pt-2">vs</div>
                      <div className="text-center">
                          <h2 className="text-5xl font-bold text-blue-400 tabular-nums">{eurScore}</h2>
                          <span className="text-xs font-bold tracking-widest text-slate-400">EUR (Proj)</span>
+                         {odds?.teams && (
+                           <div className="text-[10px] text-slate-500 tabular-nums">Win {(odds.teams.EUR.win * 100).toFixed(0)}%</div>
+                         )}
                      </div>
                  </div>
              </div>
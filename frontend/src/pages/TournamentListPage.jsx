@@ -3,9 +3,14 @@ import { useNavigate } from 'react-router-dom'
 import { Trophy, Calendar, Plus, Users, Play, Clock, CheckCircle, ArrowRight } from 'lucide-react'
 import { api } from '../api/client'
 
+// The API returns `next` as a full URL; we only need its cursor
+const cursorFrom = (url) => (url ? new URL(url).searchParams.get('cursor') : null)
+
 export default function TournamentListPage() {
   const navigate = useNavigate()
   const [tournaments, setTournaments] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [seasons, setSeasons] = useState([])
   const [loading, setLoading] = useState(true)
   const [err, setErr] = useState('')
@@ -16,12 +21,13 @@ export default function TournamentListPage() {
       try {
         setLoading(true)
         const [tData, sData] = await Promise.all([
-          api.listTournaments(),
+          // Tournaments that belong to a season are shown in the season card
+          api.listTournaments({ season: 'none' }),
           api.listSeasons() // Assume api.listSeasons is available
         ])
         if (!alive) return
-        // Filter out tournaments that belong to a season (they are shown in the season card)
-        setTournaments(tData.filter(t => !t.season))
+        setTournaments(tData.results)
+        setNextCursor(cursorFrom(tData.next))
         setSeasons(sData || [])
       } catch (e) {
         if (!alive) return
@@ -33,6 +39,20 @@ export default function TournamentListPage() {
     return () => { alive = false }
   }, [])
 
+  const loadMore = async () => {
+    if (!nextCursor) return
+    try {
+      setLoadingMore(true)
+      const page = await api.listTournaments({ season: 'none', cursor: nextCursor })
+      setTournaments(prev => [...prev, ...page.results])
+      setNextCursor(cursorFrom(page.next))
+    } catch (e) {
+      setErr(e.message || String(e))
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const formatDate = (dateStr) => {
     const d = new Date(dateStr)
     return d.toLocaleDateString(undefined, { 
@@ -245,7 +265,7 @@ export default function TournamentListPage() {
                     </span>
                     <span className="flex items-center gap-2">
                       <Users className="w-4 h-4 text-blue-600" />
-                      {t.entries?.length || 0} players
+                      {t.entry_count || 0} players
                     </span>
                   </div>
                   
@@ -263,6 +283,18 @@ export default function TournamentListPage() {
             ))}
           </div>
         )}
+
+        {nextCursor && (
+          <div className="flex justify-center mt-8">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-white border border-gray-300 hover:border-green-400 text-gray-700 rounded-lg font-medium transition-colors disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   )
@@ -15,6 +15,10 @@ import LiveTicker from '../components/LiveTicker'
 
 /** ---------- helpers ---------- */
 
+// Polled payloads carry strokes only; per-hole stats and commentary are
+// loaded for the selected player from the scorecard endpoint.
+const HOLES = { holes: 'strokes' }
+
 const holeSequence = (startHole) => {
   const s = Number(startHole || 1)
   const a = []
@@ -85,7 +89,38 @@ const groupStatus = (group) => {
 
 /** ---------- scorecard view ---------- */
 
+// The entry with its full hole results (stats and commentary) from the
+// scorecard endpoint, refetched when the tournament version moves on.
+// Falls back to the polled entry (strokes only) until the card arrives.
+function useDetailedEntry(tournamentId, entry, version) {
+  const [card, setCard] = useState(null)
+  const entryId = entry?.id
+
+  useEffect(() => {
+    if (!tournamentId || !entryId) return
+    let cancelled = false
+    api
+      .getScorecard(tournamentId, entryId)
+      .then((c) => {
+        if (!cancelled) setCard(c)
+      })
+      .catch(() => {})
+    return () => {
+      cancelled = true
+    }
+  }, [tournamentId, entryId, version])
+
+  return useMemo(() => {
+    if (!entry || card?.id !== entry.id) return entry
+    const hole_results = card.rounds.flatMap((r) =>
+      r.holes.map((h) => ({ ...h, round_number: r.round_number }))
+    )
+    return { ...entry, hole_results }
+  }, [entry, card])
+}
+
 function PlayerScorecard({ player, group, tournament, course, onBack }) {
+  const detailed = useDetailedEntry(tournament?.id, player, tournament?.version)
   const holes = course?.holes || []
   const currentRound = tournament?.current_round || 1
   const [selectedRound, setSelectedRound] = useState(currentRound)
@@ -244,7 +279,7 @@ function PlayerScorecard({ player, group, tournament, course, onBack }) {
            <div className="p-4 col-span-2">
              <div className="h-full flex items-center justify-center w-full">
                <div className="w-full">
-                 <StatsEmbed player={player} holes={holes} variant="large" round={selectedRound} />
+                 <StatsEmbed player={detailed} holes={holes} variant="large" round={selectedRound} />
                </div>
              </div>
            </div>
@@ -352,7 +387,7 @@ function PlayerScorecard({ player, group, tournament, course, onBack }) {
           <div className="bg-gray-50 border-t border-gray-200 px-6 py-4">
              <h4 className="text-xs font-bold text-gray-500 uppercase tracking-wider mb-3">Live Feed - {player.display_name} (R{selectedRound})</h4>
              <div className="space-y-2">
-                 {(player.hole_results || [])
+                 {(detailed.hole_results || [])
                     .filter(r => Number(r.round_number) === Number(selectedRound))
                     .sort((a, b) => b.hole_number - a.hole_number) // Newest first
                     .slice(0, 3) // Last 3 holes
@@ -583,7 +618,7 @@ export default function TournamentPage() {
   const load = useCallback(async () => {
     setErr('')
     try {
-      const data = await api.getTournament(id)
+      const data = await api.getTournament(id, HOLES)
       setT(data)
 
       try {
@@ -608,7 +643,7 @@ export default function TournamentPage() {
       setSaving(true)
       setErr('')
       try {
-        const data = await api.tickTournament(id, Number(mins))
+        const data = await api.tickTournament(id, Number(mins), HOLES)
         setT(data)
         setStatusMsg('Time advanced!')
         setTimeout(() => setStatusMsg(''), 1200)
@@ -627,7 +662,7 @@ export default function TournamentPage() {
       setErr('')
       setStatusMsg('Simulating to tee time...')
       try {
-        const data = await api.simToTee(id)
+        const data = await api.simToTee(id, HOLES)
         setT(data)
         setStatusMsg('Ready to tee off!')
         setTimeout(() => setStatusMsg(''), 1500)
@@ -650,7 +685,7 @@ export default function TournamentPage() {
           entry_id: entryId,
           hole_number: Number(holeNumber),
           strokes: Number(strokes),
-        })
+        }, HOLES)
         setT(data)
         setStatusMsg('Score saved ✓')
         setTimeout(() => setStatusMsg(''), 1000)
@@ -678,11 +713,12 @@ export default function TournamentPage() {
       setStatusMsg(`Saving hole ${holeNumber}…`)
       try {
         for (const [entryIdStr, strokes] of Object.entries(strokesByEntryId)) {
+          // Only the tick below is kept, so skip the hole detail here
           await api.submitHoleResult(id, {
             entry_id: Number(entryIdStr),
             hole_number: Number(holeNumber),
             strokes: Number(strokes),
-          })
+          }, { holes: 'none' })
         }
 
         const par = Number(defaultPar || 4)
@@ -695,7 +731,7 @@ export default function TournamentPage() {
             : ({ 3: 11, 4: 14, 5: 18 }[par] || 14)
 
         setStatusMsg(`Advancing time (+${mins}m)…`)
-        const updated = await api.tickTournament(id, mins)
+        const updated = await api.tickTournament(id, mins, HOLES)
         setT(updated)
 
         setStatusMsg(`Hole ${holeNumber} saved ✓`)
@@ -716,7 +752,7 @@ export default function TournamentPage() {
     setErr('')
     setStatusMsg('Simulating end of day...')
     try {
-      const data = await api.simToEndOfDay(id)
+      const data = await api.simToEndOfDay(id, HOLES)
       setT(data)
       setStatusMsg('Round complete!')
       setTimeout(() => setStatusMsg(''), 1500)
@@ -1785,6 +1821,12 @@ function BigMoversWidget({ rounds }) {
   )
 }
 
+// StatsEmbed for a player picked in a list: loads their scorecard on demand
+function SelectedStatsEmbed({ tournament, entry, holes }) {
+  const detailed = useDetailedEntry(tournament?.id, entry, tournament?.version)
+  return <StatsEmbed player={detailed} holes={holes} />
+}
+
 function StatsEmbed({ player, holes, variant = 'small', round = null }) {
   if (!player) return null
   
@@ -1936,7 +1978,7 @@ function OnCourseTracker({ tournament, featuredGroup, allInterestingGroups, cour
                       
                       {isSelected && (
                          <div className="px-2 pb-2">
-                            <StatsEmbed player={m.entry} holes={course?.holes || []} />
+                            <SelectedStatsEmbed tournament={tournament} entry={m.entry} holes={course?.holes || []} />
                          </div>
                       )}
                     </div>